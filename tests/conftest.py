@@ -0,0 +1,359 @@
+"""
+Fixtures of the tests: generated files with results in Hex, conversion options and checks shared by the execution
+modes
+"""
+
+import collections
+import csv
+import os
+import random
+import sqlite3
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import zx_ruler_results_interpreter  # noqa: E402
+
+
+# Header of the generated files: all the columns with hex codes, columns without hex code in between
+HEADER = (["TIMESTAMP", "CYCLE", "GET_CURRENT", "GET_MODE", "GET_CONFIG_MODE", "SET_TEMP", "CHAMBER_TEMP",
+           "GET_LD_TEMP", "GET_LASER_ON_OFF", "GET_POWER_OUT_ABS", "GET_POWER_VAL_IN_PERC", "GET_LD_LIFETIME",
+           "GET_PD_VALUE", "GET_MODULE_TOTAL_ONTIME", "GET_STATUS", "GET_SMCU_STATUS", "GET_CAL_LASER",
+           "GET_COMP_REF", "GET_FW_VERSION", "GET_TEMP_ADC"] + [f"AUX_{aux_number}" for aux_number in range(20, 24)]
+          + ["GET_CURRENT_DAC_ADC", "NOTE"])
+
+# Name of the generated files, with a device serial and a run date (see RESULTS_FILE_NAME_PATTERN)
+HEX_RESULTS_FILE_NAME = "2300003506_TempZyklen_230727.csv"
+
+# Calibration profile different from the default one
+TEST_CALIBRATION_PROFILE = zx_ruler_results_interpreter.DEFAULT_CALIBRATION_PROFILE._replace(
+    name="test", u_ref_smcu=2.5, r_shunt=5.0)
+
+# Options of the conversion, the same for the serial conversion and the execution mode
+CONVERSION_OPTIONS = {"all_columns": {},
+                      "check_crc": {"check_crc": True, "calibration_profile": TEST_CALIBRATION_PROFILE},
+                      "selection": {"columns": ["STATUS_ERRORS_WARNING", "SMCU_STATUS", "GET_CURRENT_ADC"],
+                                    "drop_hex_columns": True, "where": ["errors & 0x10000"]}}
+
+# Generated files: end of the lines, end of the last line
+HEX_RESULTS_FILE_LAYOUTS = {"lf": {"new_line": "\n"},
+                            "crlf": {"new_line": "\r\n"},
+                            "no_last_new_line": {"last_new_line": False}}
+
+# Payloads of the SMCU status with known start-up states (the states are looked up as strings)
+SMCU_STATUS_PAYLOADS = [start_up_state + operation_state for start_up_state in ("10", "20", "30", "40")
+                        for operation_state in ("00", "10", "20", "80", "7f")]
+
+# Generated files of the batch: name -> number of lines, truncated lines
+BATCH_FILES = {"2300003506_TempZyklen_230727.csv": (300, [10, 200]),
+               "2300003507_TempZyklen_230728.csv": (200, []),
+               "2300003508_TempZyklen_230729.csv": (100, [99])}
+
+
+def random_hex(random_generator, number_of_characters):
+    return "".join(random_generator.choice("0123456789abcdef") for _ in range(number_of_characters))
+
+
+def make_telegram(random_generator, payload_hex, nul_allowed=True):
+    """
+    Make a response telegram: status byte, payload and CRC (valid for about half of the telegrams). Some telegrams
+    are truncated (at most 6 characters) or contain NUL characters.
+    :param random_generator: random.Random
+    :param payload_hex: payload in hex
+    :param nul_allowed: the converter of the column handles NUL characters
+    :return: telegram in hex
+    """
+
+    draw = random_generator.random()
+    if nul_allowed and draw < 0.02:
+        return "00\x00\x00\x00\x0000"
+    if draw < 0.05:
+        return random_hex(random_generator, random_generator.choice([0, 2, 4, 6]))
+
+    telegram_hex = random_generator.choice(["00", "00", "30", "01"]) + payload_hex
+    if random_generator.random() < 0.5:
+        return telegram_hex + f"{zx_ruler_results_interpreter.crc_16(bytes.fromhex(telegram_hex)):04x}"
+    return telegram_hex + random_hex(random_generator, 4)
+
+
+def make_hex_results_line(line_number, random_generator):
+    """
+    Make a line of a file with results in Hex (see HEADER)
+    :param line_number: number of the line, used for the time stamp
+    :param random_generator: random.Random
+    :return: line without new line
+    """
+
+    def telegram(payload_hex, nul_allowed=True):
+        return make_telegram(random_generator, payload_hex, nul_allowed)
+
+    error_word = random_generator.choice([0, 0, 1 << 16, (1 << 13) | (1 << 16), random_generator.getrandbits(30)])
+    warning_word = random_generator.choice([0, 0, 1 << 11, random_generator.getrandbits(14)])
+    status_response = random_generator.choice(["00", "30", "ff", "01"]) + "01" + f"{error_word:08x}{warning_word:08x}"
+    if random_generator.random() < 0.5:
+        status_response += f"{zx_ruler_results_interpreter.crc_16(bytes.fromhex(status_response)):04x}"
+    else:
+        status_response += random_hex(random_generator, 4)
+    if random_generator.random() < 0.03:
+        status_response = random_generator.choice(["", "00", "0a1b", "00\x00\x00\x00\x00\x00\x00"])
+
+    fields = [f"2023-07-27 {line_number // 3600 % 24:02d}:{line_number // 60 % 60:02d}:{line_number % 60:02d}",
+              str(line_number),
+              telegram(random_hex(random_generator, 4)),
+              telegram(random_generator.choice(["00", "05", "1f", "80"])),
+              telegram(random_generator.choice(["00", "03", "09", "08"])),
+              str(random_generator.randint(-40, 85)),
+              f"{random_generator.uniform(-40, 85):.1f}",
+              telegram(random_generator.choice(["09c4", "fe0c", random_hex(random_generator, 4)])),
+              telegram(random_generator.choice(["00", "01"])),
+              # The legacy conversions of power out abs, lifetime, ontime and comp ref don't check for NUL
+              telegram(random_hex(random_generator, 4), nul_allowed=False),
+              telegram(random_hex(random_generator, 2)),
+              telegram(random_hex(random_generator, 6), nul_allowed=False),
+              telegram(random_hex(random_generator, 4)),
+              telegram(random_hex(random_generator, 6), nul_allowed=False),
+              status_response,
+              telegram(random_generator.choice(["10", "20", "30", "40"])
+                       + random_generator.choice(["00", "10", "20", "80"]) + random_hex(random_generator, 8)),
+              telegram(random_hex(random_generator, 8)),
+              telegram(random_hex(random_generator, 4), nul_allowed=False),
+              telegram("010203" + random_hex(random_generator, 6) + "040506"),
+              telegram(random_hex(random_generator, 4))]
+    fields += [random_hex(random_generator, random_generator.randint(0, 6)) for _ in range(4)]
+    fields += [telegram(random_hex(random_generator, 8)), random_generator.choice(["ok", "", "x"])]
+
+    return ",".join(fields)
+
+
+def make_hex_column(random_generator, payloads, number_of_rows=3000):
+    """
+    Make a column of telegrams of every length, some with NUL or a character which is not a hex digit (outside of
+    the payloads)
+    :param random_generator: random.Random
+    :param payloads: valid payloads at the start of the telegrams after the status byte (None: random)
+    :param number_of_rows: number of telegrams
+    :return: list with the telegrams
+    """
+
+    hex_column = []
+    for _ in range(number_of_rows):
+        hex_code = random_hex(random_generator, random_generator.choice([0, 2, 4, 6, 7, 8, 10, 12, 14, 18, 20, 24]))
+        payload_stop = 2
+        if payloads is not None and len(hex_code) > 6:
+            payload = random_generator.choice(payloads)
+            hex_code = (hex_code[:2] + payload + hex_code[2:])[:len(hex_code)]
+            payload_stop += len(payload)
+
+        draw = random_generator.random()
+        if draw < 0.1 and hex_code:
+            character_index = random_generator.randrange(len(hex_code))
+            if 2 <= character_index < payload_stop:
+                character_index = random_generator.choice([0, 1])
+            hex_code = hex_code[:character_index] + ("\x00" if draw < 0.05 else "g") + hex_code[character_index + 1:]
+        hex_column.append(hex_code)
+
+    return hex_column
+
+
+def render_smcu_status(start_up_state, operation_state, adc_ld_temp, si_temp):
+    return " | ".join([zx_ruler_results_interpreter.START_UP_STATES_DICT[f"{start_up_state:02x}"],
+                       zx_ruler_results_interpreter.OPERATION_STATES_DICT.get(
+                           f"{operation_state:02x}", f"{operation_state:02x}: Not existing"),
+                       f"{round(adc_ld_temp, 2)} V",
+                       f"{round(si_temp, 2)} degC"])
+
+
+def write_hex_results_file(hex_results_file_path, number_of_lines, seed=1, new_line="\n", truncated_lines=(),
+                           last_new_line=True):
+    """
+    Write a generated file with results in Hex
+    :param hex_results_file_path: path of the file
+    :param number_of_lines: number of lines after the header
+    :param seed: seed of the random values
+    :param new_line: end of the lines
+    :param truncated_lines: numbers of the lines (0: first line after the header) cut in the middle of the hex
+                            columns, which can't be converted
+    :param last_new_line: end the last line with a new line
+    :return: path of the file
+    """
+
+    random_generator = random.Random(seed)
+    hex_results_lines = [",".join(HEADER)]
+    for line_number in range(number_of_lines):
+        hex_results_line = make_hex_results_line(line_number, random_generator)
+        if line_number in truncated_lines:
+            hex_results_line = hex_results_line[:len(hex_results_line) // 3]
+        hex_results_lines.append(hex_results_line)
+
+    with open(hex_results_file_path, "w", newline="") as hex_results_file:
+        hex_results_file.write(new_line.join(hex_results_lines) + (new_line if last_new_line else ""))
+
+    return str(hex_results_file_path)
+
+
+def write_batch_files(batch_directory):
+    for seed, (file_name, (number_of_lines, truncated_lines)) in enumerate(BATCH_FILES.items()):
+        write_hex_results_file(batch_directory / file_name, number_of_lines, seed=seed,
+                               truncated_lines=truncated_lines)
+
+
+def read_manifest(batch_directory):
+    with open(batch_directory / zx_ruler_results_interpreter.BATCH_MANIFEST_FILE_NAME, "r",
+              newline="") as manifest_file:
+        return {os.path.basename(manifest_entry["FILE"]): manifest_entry
+                for manifest_entry in csv.DictReader(manifest_file)}
+
+
+def read_interpreted_columns(hex_results_file_path, calibration_profile):
+    """
+    Convert a file and read the interpreted columns of the converted lines
+    :param hex_results_file_path: path of the file with results in Hex
+    :param calibration_profile: CalibrationProfile of the conversion
+    :return: list with the lists of the interpreted values of the lines
+    """
+
+    zx_ruler_results_interpreter.zx_interpret_results(hex_results_file_path, calibration_profile=calibration_profile)
+    with open(hex_results_file_path[:-4] + "_converter.csv", "r") as interpreted_results_file:
+        next(interpreted_results_file)
+        return [interpreted_results_line.rstrip("\n").split(",")[len(HEADER):]
+                for interpreted_results_line in interpreted_results_file]
+
+
+def read_database_interpreted_columns(database_path):
+    with sqlite3.connect(database_path) as database_connection:
+        return [list(row) for row in database_connection.execute(
+            f"SELECT {', '.join(zx_ruler_results_interpreter.INTERPRETED_COLUMN_NAMES)} FROM results "
+            f"ORDER BY line_number")]
+
+
+@pytest.fixture
+def hex_results_file_path(tmp_path):
+    return write_hex_results_file(tmp_path / HEX_RESULTS_FILE_NAME, 400)
+
+
+def convert(hex_results_file_path, **kwargs):
+    """
+    Convert a file and read the converted file, which is removed
+    :param hex_results_file_path: path of the file with results in Hex
+    :param kwargs: keyword arguments of zx_interpret_results
+    :return: number of converted lines, content of the converted file
+    """
+
+    number_of_lines = zx_ruler_results_interpreter.zx_interpret_results(hex_results_file_path, **kwargs)
+
+    interpreted_results_file_path = hex_results_file_path[:-4] + "_converter.csv"
+    with open(interpreted_results_file_path, "rb") as interpreted_results_file:
+        interpreted_results = interpreted_results_file.read()
+    os.remove(interpreted_results_file_path)
+
+    return number_of_lines, interpreted_results
+
+
+def check_same_as_serial(tmp_path, execution_options, options, layout):
+    """
+    Check that an execution mode gives the same converted file as the serial conversion and leaves no other file
+    :param tmp_path: empty directory of the generated file
+    :param execution_options: keyword arguments of zx_interpret_results of the execution mode
+    :param options: key of CONVERSION_OPTIONS
+    :param layout: key of HEX_RESULTS_FILE_LAYOUTS
+    :return: NONE
+    """
+
+    hex_results_file_path = write_hex_results_file(tmp_path / HEX_RESULTS_FILE_NAME, 400,
+                                                   **HEX_RESULTS_FILE_LAYOUTS[layout])
+    serial_results = convert(hex_results_file_path, **CONVERSION_OPTIONS[options])
+
+    assert convert(hex_results_file_path, **CONVERSION_OPTIONS[options], **execution_options) == serial_results
+    # No checkpoint, temporary or quarantine file left
+    assert sorted(os.listdir(tmp_path)) == [HEX_RESULTS_FILE_NAME]
+
+
+def check_bad_frames(hex_results_file_path, execution_options):
+    """
+    Check the bad frames counted by an execution mode
+    :param hex_results_file_path: path of the file with results in Hex
+    :param execution_options: keyword arguments of zx_interpret_results of the execution mode
+    :return: NONE
+    """
+
+    bad_frames = collections.Counter()
+    convert(hex_results_file_path, check_crc=True, bad_frames=bad_frames, **execution_options)
+
+    number_of_lines, expected_bad_frames = zx_ruler_results_interpreter.count_bad_frames(hex_results_file_path)
+    assert dict(bad_frames) == expected_bad_frames
+    assert 0 < bad_frames["GET_STATUS"] < number_of_lines
+
+
+def check_empty_file(tmp_path, execution_options, number_of_lines):
+    """
+    Check that an execution mode converts an empty file or a file with only the header like the serial conversion
+    :param tmp_path: empty directory of the generated file
+    :param execution_options: keyword arguments of zx_interpret_results of the execution mode
+    :param number_of_lines: 0 (empty file) or 1 (only the header)
+    :return: NONE
+    """
+
+    hex_results_file_path = str(tmp_path / HEX_RESULTS_FILE_NAME)
+    if number_of_lines:
+        write_hex_results_file(hex_results_file_path, 0)
+    else:
+        open(hex_results_file_path, "w").close()
+
+    assert convert(hex_results_file_path, **execution_options) == convert(hex_results_file_path)
+
+
+def check_truncated_line(tmp_path, execution_options):
+    """
+    Check that an execution mode fails on a truncated line without leaving a partial converted file
+    :param tmp_path: empty directory of the generated file
+    :param execution_options: keyword arguments of zx_interpret_results of the execution mode
+    :return: NONE
+    """
+
+    hex_results_file_path = write_hex_results_file(tmp_path / HEX_RESULTS_FILE_NAME, 400, truncated_lines=[250])
+
+    with pytest.raises(IndexError):
+        zx_ruler_results_interpreter.zx_interpret_results(hex_results_file_path, **execution_options)
+
+    assert not os.path.exists(hex_results_file_path[:-4] + "_converter.csv")
+
+
+def check_column_decoder(seed, decode_column, convert, render, payloads, decoded_column_indexes):
+    """
+    Check that a NumPy column decoder gives the same values as the single value function of the column
+    :param seed: seed of the generated column
+    :param decode_column: column decoder (see zx_ruler_results_vectorized.TYPED_COLUMNS)
+    :param convert: single value function
+    :param render: rendering of the decoded values as the single value function
+    :param payloads: valid payloads at the start of the telegrams (None: random, see make_hex_column)
+    :param decoded_column_indexes: indexes of the decoded arrays compared (None: all)
+    :return: NONE
+    """
+
+    # NumPy is only needed by the tests of the column decoders
+    import zx_ruler_results_vectorized
+
+    hex_column = make_hex_column(random.Random(seed), payloads)
+
+    decoded_columns = decode_column(hex_column)
+    if decoded_column_indexes is not None:
+        decoded_columns = [decoded_columns[column_index] for column_index in decoded_column_indexes]
+    # Python values, rounded like the single value functions
+    *value_columns, status_column = [decoded_column.tolist() for decoded_column in decoded_columns]
+
+    for row_index, hex_code in enumerate(hex_column):
+        status = status_column[row_index]
+        if status == zx_ruler_results_vectorized.STATUS_INVALID_HEX:
+            with pytest.raises(ValueError):
+                convert(hex_code)
+        elif status != zx_ruler_results_vectorized.STATUS_OK:
+            assert convert(hex_code) == zx_ruler_results_vectorized.STATUS_STRINGS[status]
+        else:
+            assert convert(hex_code) == render(*[value_column[row_index] for value_column in value_columns])
+
+    # Every status of the column is tested (the payloads are valid)
+    assert zx_ruler_results_vectorized.STATUS_OK in status_column
+    if payloads is None:
+        assert zx_ruler_results_vectorized.STATUS_INVALID_HEX in status_column
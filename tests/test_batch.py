@@ -0,0 +1,46 @@
+"""
+Tests of the batch conversion of many files and of its manifest
+"""
+
+import os
+
+import zx_ruler_results_interpreter
+from conftest import BATCH_FILES, read_manifest, write_batch_files
+
+
+def test_batch_same_as_single_file(tmp_path):
+    write_batch_files(tmp_path)
+    zx_ruler_results_interpreter.zx_interpret_results_batch(str(tmp_path), workers=2, quarantine=True)
+
+    for file_name in BATCH_FILES:
+        hex_results_file_path = str(tmp_path / file_name)
+        with open(hex_results_file_path[:-4] + "_converter.csv", "rb") as interpreted_results_file:
+            batch_results = interpreted_results_file.read()
+        zx_ruler_results_interpreter.zx_interpret_results(hex_results_file_path, quarantine=True)
+        with open(hex_results_file_path[:-4] + "_converter.csv", "rb") as interpreted_results_file:
+            assert interpreted_results_file.read() == batch_results
+
+
+def test_batch_without_quarantine_fails_on_truncated_lines(tmp_path):
+    write_batch_files(tmp_path)
+    zx_ruler_results_interpreter.zx_interpret_results_batch(str(tmp_path), workers=2)
+
+    # A bad file doesn't abort the batch
+    manifest = read_manifest(tmp_path)
+    for file_name, (_, truncated_lines) in BATCH_FILES.items():
+        assert manifest[file_name]["STATUS"] == ("FAILED" if truncated_lines else "OK")
+        assert os.path.exists(tmp_path / (file_name[:-4] + "_converter.csv")) == (not truncated_lines)
+
+
+def test_batch_files_of_directory_and_pattern(tmp_path):
+    write_batch_files(tmp_path)
+    (tmp_path / "notes.txt").write_text("not a file with results")
+    zx_ruler_results_interpreter.zx_interpret_results_batch(str(tmp_path), workers=1, quarantine=True)
+
+    # The converted, quarantine and manifest files are not converted again, the largest file comes first
+    assert [os.path.basename(hex_results_file_path)
+            for hex_results_file_path in zx_ruler_results_interpreter.get_hex_results_file_paths(str(tmp_path))] \
+        == list(BATCH_FILES)
+    assert [os.path.basename(hex_results_file_path) for hex_results_file_path
+            in zx_ruler_results_interpreter.get_hex_results_file_paths(str(tmp_path / "*_230728*"))] \
+        == ["2300003507_TempZyklen_230728.csv"]
@@ -0,0 +1,124 @@
+"""
+Tests of the calibration profiles in the conversion, the batches and the SQLite sink
+"""
+
+import json
+import random
+
+import pytest
+
+import zx_ruler_results_interpreter
+from conftest import HEADER, SMCU_STATUS_PAYLOADS, TEST_CALIBRATION_PROFILE, check_column_decoder, make_hex_column, \
+    read_database_interpreted_columns, read_interpreted_columns, render_smcu_status
+
+
+# Interpreted columns depending on the calibration profile
+CALIBRATED_COLUMN_NAMES = ("SMCU_STATUS", "GET_CURRENT_DAC_ADC", "GET_COMP_REF", "GET_CURRENT_ADC")
+
+# Legacy conversion with the default constants, conversion with the calibration tables and payloads (None: random)
+CALIBRATED_CONVERTERS = {
+    "current_dac": (zx_ruler_results_interpreter.convert_current_dac_adc,
+                    zx_ruler_results_interpreter.convert_current_dac_calibrated, None),
+    "current_adc": (zx_ruler_results_interpreter.convert_current_adc,
+                    zx_ruler_results_interpreter.convert_current_adc_calibrated, None),
+    "comp_ref": (zx_ruler_results_interpreter.convert_comp_ref,
+                 zx_ruler_results_interpreter.convert_comp_ref_calibrated, None),
+    "smcu_status": (zx_ruler_results_interpreter.interpret_get_smcu_status,
+                    zx_ruler_results_interpreter.interpret_get_smcu_status_calibrated, SMCU_STATUS_PAYLOADS)}
+
+# Telegrams with a sign, which int() accepts: raw values outside of the calibration tables
+SIGNED_TELEGRAMS = ["00-fff12341234", "00ffff-0011234", "0010-0011234abcd", "0020-fff-0011234"]
+
+
+def test_calibration_changes_the_calibrated_columns(hex_results_file_path):
+    default_interpreted_columns = read_interpreted_columns(hex_results_file_path, None)
+    calibrated_interpreted_columns = read_interpreted_columns(hex_results_file_path, TEST_CALIBRATION_PROFILE)
+
+    for column_index, column_name in enumerate(zx_ruler_results_interpreter.INTERPRETED_COLUMN_NAMES):
+        default_values = [interpreted_values[column_index] for interpreted_values in default_interpreted_columns]
+        calibrated_values = [interpreted_values[column_index]
+                             for interpreted_values in calibrated_interpreted_columns]
+        assert (default_values != calibrated_values) == (column_name in CALIBRATED_COLUMN_NAMES)
+
+
+def test_calibration_file_of_the_device(tmp_path, hex_results_file_path):
+    calibration_file_path = tmp_path / "calibration.json"
+    calibration_file_path.write_text(json.dumps({"profiles": {"ZX-405": {"u_ref_smcu": 2.5, "r_shunt": 5.0}},
+                                                 "devices": {"2300003506": "ZX-405"}}))
+    calibration_profiles = zx_ruler_results_interpreter.load_calibration_profiles(str(calibration_file_path))
+    calibration_profile = zx_ruler_results_interpreter.get_calibration_profile(calibration_profiles,
+                                                                               hex_results_file_path)
+    assert calibration_profile == TEST_CALIBRATION_PROFILE._replace(name="ZX-405")
+    calibrated_interpreted_columns = read_interpreted_columns(hex_results_file_path, calibration_profile)
+
+    # Batch conversion with the profile of the device
+    zx_ruler_results_interpreter.zx_interpret_results_batch(str(tmp_path / "*_TempZyklen_*.csv"), workers=1,
+                                                            calibration_profiles=calibration_profiles)
+    with open(hex_results_file_path[:-4] + "_converter.csv", "r") as interpreted_results_file:
+        next(interpreted_results_file)
+        assert [interpreted_results_line.rstrip("\n").split(",")[len(HEADER):]
+                for interpreted_results_line in interpreted_results_file] == calibrated_interpreted_columns
+
+    # SQLite database with the profile of the device
+    database_path = str(tmp_path / "results.sqlite")
+    zx_ruler_results_interpreter.zx_results_to_sqlite(hex_results_file_path, database_path,
+                                                      calibration_profile=calibration_profile)
+    assert read_database_interpreted_columns(database_path) == calibrated_interpreted_columns
+
+
+@pytest.mark.parametrize("converter", CALIBRATED_CONVERTERS)
+def test_legacy_converter_same_as_default_calibration(converter):
+    convert, convert_calibrated, payloads = CALIBRATED_CONVERTERS[converter]
+    calibration_tables = zx_ruler_results_interpreter.get_calibration_tables()
+    hex_column = make_hex_column(random.Random(converter), payloads) + SIGNED_TELEGRAMS
+
+    for hex_code in hex_column:
+        try:
+            interpreted_value = convert(hex_code)
+        except (TypeError, ValueError) as exception:
+            # Same error, e.g. unknown start-up state or not a hex value
+            with pytest.raises(type(exception)):
+                convert_calibrated(hex_code, calibration_tables)
+        else:
+            assert convert_calibrated(hex_code, calibration_tables) == interpreted_value
+
+
+def test_calibration_tables():
+    calibration_tables = zx_ruler_results_interpreter.get_calibration_tables(TEST_CALIBRATION_PROFILE)
+    # Computed once per profile
+    assert zx_ruler_results_interpreter.get_calibration_tables(TEST_CALIBRATION_PROFILE) is calibration_tables
+    assert calibration_tables.calibration_profile == TEST_CALIBRATION_PROFILE
+
+    for calibration_table, calibrate in zip(calibration_tables[1:],
+                                            (zx_ruler_results_interpreter.calibrate_current_dac,
+                                             zx_ruler_results_interpreter.calibrate_current_adc,
+                                             zx_ruler_results_interpreter.calibrate_comp_ref,
+                                             zx_ruler_results_interpreter.calibrate_adc_ld_temp)):
+        assert len(calibration_table) == zx_ruler_results_interpreter.CALIBRATION_TABLE_SIZE
+        for raw_value in (0, 1, 0x7ff, 0xfff, 0x1000, 0x8000, 0xffff):
+            assert calibration_table[raw_value] == calibrate(TEST_CALIBRATION_PROFILE, raw_value)
+
+
+def test_calibrated_column_decoders():
+    zx_ruler_results_vectorized = pytest.importorskip("zx_ruler_results_vectorized")
+    calibration_tables = zx_ruler_results_interpreter.get_calibration_tables(TEST_CALIBRATION_PROFILE)
+
+    def with_test_calibration(decode_column):
+        return lambda hex_column: decode_column(hex_column, TEST_CALIBRATION_PROFILE)
+
+    def with_test_calibration_tables(convert_calibrated):
+        return lambda hex_code: convert_calibrated(hex_code, calibration_tables)
+
+    # Column decoder, rendering of the decoded values as the converter with the calibration tables
+    calibrated_column_decoders = {
+        "current_dac": (zx_ruler_results_vectorized.decode_current_dac_adc_column,
+                        lambda current: str(round(current, 2))),
+        "current_adc": (zx_ruler_results_vectorized.decode_current_adc_column,
+                        lambda current: str(round(current, 2))),
+        "comp_ref": (zx_ruler_results_vectorized.decode_comp_ref_column, lambda voltage: f"{round(voltage, 2)} mV"),
+        "smcu_status": (zx_ruler_results_vectorized.decode_smcu_status_column, render_smcu_status)}
+
+    for converter, (decode_column, render) in calibrated_column_decoders.items():
+        _, convert_calibrated, payloads = CALIBRATED_CONVERTERS[converter]
+        check_column_decoder(converter, with_test_calibration(decode_column),
+                             with_test_calibration_tables(convert_calibrated), render, payloads, None)
@@ -0,0 +1,116 @@
+"""
+Tests of the cache of the conversions of many files
+"""
+
+import json
+import os
+
+import pytest
+
+import zx_ruler_results_interpreter
+from conftest import BATCH_FILES, TEST_CALIBRATION_PROFILE, read_manifest, write_batch_files, write_hex_results_file
+
+
+# Options of the conversion changing the converted results, with a value other than the default one
+CHANGED_CONVERSION_OPTIONS = {"columns": ["SMCU_STATUS"], "drop_hex_columns": True, "where": ["laser = ON"],
+                              "check_crc": True, "calibration_profile": TEST_CALIBRATION_PROFILE,
+                              "quarantine": True}
+
+
+def convert_batch_with_cache(batch_directory):
+    """
+    Convert the files of a directory with the cache
+    :param batch_directory: directory of the files
+    :return: dictionary name of the file -> status of the manifest
+    """
+
+    zx_ruler_results_interpreter.zx_interpret_results_batch(str(batch_directory), workers=1, quarantine=True,
+                                                            use_cache=True)
+    return {file_name: manifest_entry["STATUS"] for file_name, manifest_entry in read_manifest(batch_directory).items()}
+
+
+def test_batch_cache(tmp_path):
+    write_batch_files(tmp_path)
+    zx_ruler_results_interpreter.zx_interpret_results_batch(str(tmp_path), workers=2, quarantine=True,
+                                                            check_crc=True, use_cache=True)
+    first_manifest = read_manifest(tmp_path)
+
+    # The converted files are up to date, except the one of the changed file
+    changed_file_name = "2300003507_TempZyklen_230728.csv"
+    write_hex_results_file(tmp_path / changed_file_name, 150, seed=10)
+    zx_ruler_results_interpreter.zx_interpret_results_batch(str(tmp_path), workers=2, quarantine=True,
+                                                            check_crc=True, use_cache=True)
+    manifest = read_manifest(tmp_path)
+    assert sorted(manifest) == sorted(BATCH_FILES)
+    for file_name in BATCH_FILES:
+        if file_name == changed_file_name:
+            assert manifest[file_name]["STATUS"] == "OK"
+            assert manifest[file_name]["ROWS"] == "150"
+        else:
+            assert manifest[file_name]["STATUS"] == "CACHED"
+            assert manifest[file_name]["ROWS"] == first_manifest[file_name]["ROWS"]
+            assert manifest[file_name]["BAD_FRAMES"] == first_manifest[file_name]["BAD_FRAMES"]
+
+    # Other options convert all the files again
+    zx_ruler_results_interpreter.zx_interpret_results_batch(str(tmp_path), workers=2, quarantine=True,
+                                                            use_cache=True)
+    assert {manifest_entry["STATUS"] for manifest_entry in read_manifest(tmp_path).values()} == {"OK"}
+
+
+def test_conversion_cache_key():
+    cache_key = zx_ruler_results_interpreter.get_conversion_cache_key({})
+    assert zx_ruler_results_interpreter.CACHED_CONVERSION_OPTIONS == tuple(CHANGED_CONVERSION_OPTIONS)
+
+    # The options which only change the speed and the default values are not in the key
+    assert zx_ruler_results_interpreter.get_conversion_cache_key(
+        {"workers": 4, "chunk_size": 1024, "use_mmap": True, "decode_cache_size": 0, "columns": None,
+         "calibration_profile": zx_ruler_results_interpreter.DEFAULT_CALIBRATION_PROFILE}) == cache_key
+    assert zx_ruler_results_interpreter.get_conversion_cache_key({"where": ("laser = ON",)}) \
+        == zx_ruler_results_interpreter.get_conversion_cache_key({"where": ["laser = ON"]})
+
+    # Every option changing the results changes the key
+    cache_keys = {zx_ruler_results_interpreter.get_conversion_cache_key({option_name: option_value})
+                  for option_name, option_value in CHANGED_CONVERSION_OPTIONS.items()}
+    assert len(cache_keys) == len(CHANGED_CONVERSION_OPTIONS) and cache_key not in cache_keys
+
+
+def test_conversion_cache_of_copied_file(tmp_path):
+    write_batch_files(tmp_path)
+    convert_batch_with_cache(tmp_path)
+    with open(tmp_path / zx_ruler_results_interpreter.CONVERSION_CACHE_FILE_NAME, "r") as cache_file:
+        cache_entries = json.load(cache_file)["entries"]
+
+    # Same content with another modification time (copied again), same size with another content
+    copied_file_name, changed_file_name = list(BATCH_FILES)[1:]
+    copied_file_stat = os.stat(tmp_path / copied_file_name)
+    os.utime(tmp_path / copied_file_name, ns=(copied_file_stat.st_atime_ns, copied_file_stat.st_mtime_ns + 10 ** 9))
+    with open(tmp_path / changed_file_name, "r+b") as changed_file:
+        changed_file.seek(-10, os.SEEK_END)
+        changed_file.write(b"\n" if changed_file.read(1) == b"x" else b"x")
+    changed_file_stat = os.stat(tmp_path / changed_file_name)
+    assert changed_file_stat.st_size == cache_entries[str(tmp_path / changed_file_name)]["size"]
+
+    assert convert_batch_with_cache(tmp_path) == {list(BATCH_FILES)[0]: "CACHED", copied_file_name: "CACHED",
+                                                  changed_file_name: "OK"}
+    with open(tmp_path / zx_ruler_results_interpreter.CONVERSION_CACHE_FILE_NAME, "r") as cache_file:
+        cache_entries = json.load(cache_file)["entries"]
+    # The content is not hashed again for the next conversions
+    assert cache_entries[str(tmp_path / copied_file_name)]["mtime_ns"] == copied_file_stat.st_mtime_ns + 10 ** 9
+
+
+@pytest.mark.parametrize("change", ["removed", "changed"])
+def test_conversion_cache_of_changed_converted_file(tmp_path, change):
+    write_batch_files(tmp_path)
+    convert_batch_with_cache(tmp_path)
+
+    changed_file_name = list(BATCH_FILES)[1]
+    interpreted_results_file_path = tmp_path / (changed_file_name[:-4] + "_converter.csv")
+    if change == "removed":
+        os.remove(interpreted_results_file_path)
+    else:
+        with open(interpreted_results_file_path, "a") as interpreted_results_file:
+            interpreted_results_file.write("edited\n")
+
+    assert convert_batch_with_cache(tmp_path) == {file_name: "OK" if file_name == changed_file_name else "CACHED"
+                                                  for file_name in BATCH_FILES}
+    assert convert_batch_with_cache(tmp_path) == dict.fromkeys(BATCH_FILES, "CACHED")
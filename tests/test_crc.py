@@ -0,0 +1,105 @@
+"""
+Tests of the CRC of the response telegrams and of the bad frames
+"""
+
+import random
+
+import pytest
+
+import zx_ruler_results_interpreter
+from conftest import HEADER, TEST_CALIBRATION_PROFILE, convert, random_hex
+
+
+def bitwise_crc_16(data):
+    """
+    CRC-16 computed bit by bit, reference of the table driven crc_16
+    :param data: bytes
+    :return: CRC as integer
+    """
+
+    crc = zx_ruler_results_interpreter.CRC_INITIAL_VALUE
+    for byte_value in data:
+        crc ^= byte_value << 8
+        for _ in range(8):
+            crc = ((crc << 1) ^ zx_ruler_results_interpreter.CRC_POLYNOMIAL) if crc & 0x8000 else crc << 1
+            crc &= 0xFFFF
+    return crc
+
+
+def make_crc_telegrams():
+    random_generator = random.Random(1)
+    telegrams = []
+    for _ in range(300):
+        telegram_hex = random_hex(random_generator, 2 * random_generator.randint(1, 12))
+        telegrams.append(telegram_hex + f"{zx_ruler_results_interpreter.crc_16(bytes.fromhex(telegram_hex)):04x}")
+    # Wrong CRC, upper case hex digits, odd length, NUL, white space, wrong hex digits, too short
+    telegrams += [telegram[:-1] + ("0" if telegram[-1] != "0" else "1") for telegram in telegrams[:50]]
+    telegrams += [telegram.upper() for telegram in telegrams[:50]]
+    telegrams += [telegram[:-1] for telegram in telegrams[:50]]
+    telegrams += ["", "00", "0000", "ffff", "00\x00\x00\x00\x0000", "00 1d0f", "001d0f ", "zz1d0f", "0x1d0f",
+                  "０１1d0f", "e1f0"]
+    return telegrams
+
+
+@pytest.mark.parametrize("data, crc", [(b"123456789", 0x29B1), (b"", 0xFFFF), (b"A", 0xB915),
+                                       (bytes(range(256)), None)])
+def test_crc_16_known_vectors(data, crc):
+    if crc is not None:
+        assert zx_ruler_results_interpreter.crc_16(data) == crc
+    assert zx_ruler_results_interpreter.crc_16(data) == bitwise_crc_16(data)
+
+    # The CRC continues from the CRC of the first part
+    for split_index in range(len(data)):
+        assert zx_ruler_results_interpreter.crc_16(data[split_index:], zx_ruler_results_interpreter.crc_16(
+            data[:split_index])) == zx_ruler_results_interpreter.crc_16(data)
+
+
+def test_is_telegram_crc_valid():
+    for telegram in make_crc_telegrams():
+        try:
+            telegram_bytes = bytes.fromhex(telegram) if telegram.isascii() and telegram.isalnum() else None
+        except ValueError:
+            telegram_bytes = None
+        crc_valid = telegram_bytes is not None and len(telegram) % 2 == 0 and len(telegram_bytes) >= 3 \
+            and bitwise_crc_16(telegram_bytes[:-2]) == int.from_bytes(telegram_bytes[-2:], "big")
+        assert zx_ruler_results_interpreter.is_telegram_crc_valid(telegram) == crc_valid
+
+    assert zx_ruler_results_interpreter.is_telegram_crc_valid("31323334353637383929b1")
+    assert not zx_ruler_results_interpreter.is_telegram_crc_valid("31323334353637383929b2")
+
+
+def test_check_crc_column_same_as_is_telegram_crc_valid():
+    pytest.importorskip("numpy")
+    import zx_ruler_results_vectorized
+
+    telegrams = make_crc_telegrams()
+    assert zx_ruler_results_vectorized.check_crc_column(telegrams).tolist() \
+        == [zx_ruler_results_interpreter.is_telegram_crc_valid(telegram) for telegram in telegrams]
+    assert zx_ruler_results_vectorized.check_crc_column([]).tolist() == []
+
+
+def test_crc_columns_and_bad_frames_same_as_telegrams(hex_results_file_path):
+    with open(hex_results_file_path, "r") as hex_results_file:
+        next(hex_results_file)
+        hex_results_lines_split = [hex_results_line.strip().split(",") for hex_results_line in hex_results_file]
+    crc_valid = {hex_column_name: [zx_ruler_results_interpreter.is_telegram_crc_valid(
+        hex_results_line_split[HEADER.index(hex_column_name)]) for hex_results_line_split in hex_results_lines_split]
+        for _, hex_column_name, _ in zx_ruler_results_interpreter.INTERPRETED_COLUMNS}
+
+    # Bad frames of each column with hex codes
+    number_of_lines, bad_frames = zx_ruler_results_interpreter.count_bad_frames(hex_results_file_path)
+    assert number_of_lines == len(hex_results_lines_split)
+    assert bad_frames == {hex_column_name: column_crc_valid.count(False)
+                          for hex_column_name, column_crc_valid in crc_valid.items()}
+    assert all(0 < number_of_bad_frames < number_of_lines for number_of_bad_frames in bad_frames.values())
+
+    # Validity flag of each interpreted column
+    _, interpreted_results = convert(hex_results_file_path, check_crc=True,
+                                     calibration_profile=TEST_CALIBRATION_PROFILE)
+    interpreted_results_lines_split = [interpreted_results_line.split(",") for interpreted_results_line
+                                       in interpreted_results.decode().splitlines()]
+    converted_header = interpreted_results_lines_split[0]
+    for column_name, hex_column_name, _ in zx_ruler_results_interpreter.INTERPRETED_COLUMNS:
+        column_index = converted_header.index(column_name + zx_ruler_results_interpreter.CRC_COLUMN_SUFFIX)
+        assert [interpreted_results_line_split[column_index] == "1" for interpreted_results_line_split
+                in interpreted_results_lines_split[1:]] == crc_valid[hex_column_name]
@@ -0,0 +1,70 @@
+"""
+Tests of the decode caches of the converters
+"""
+
+import pytest
+
+import zx_ruler_results_interpreter
+from conftest import CONVERSION_OPTIONS, HEADER, HEX_RESULTS_FILE_LAYOUTS, check_bad_frames, check_empty_file, \
+    check_same_as_serial, check_truncated_line, convert
+
+
+# Conversion without the caches of the converters
+NO_DECODE_CACHE_OPTIONS = {"decode_cache_size": 0}
+
+
+@pytest.mark.parametrize("layout", HEX_RESULTS_FILE_LAYOUTS)
+@pytest.mark.parametrize("options", CONVERSION_OPTIONS)
+def test_no_decode_cache_same_as_serial(tmp_path, options, layout):
+    check_same_as_serial(tmp_path, NO_DECODE_CACHE_OPTIONS, options, layout)
+
+
+def test_no_decode_cache_bad_frames(hex_results_file_path):
+    check_bad_frames(hex_results_file_path, NO_DECODE_CACHE_OPTIONS)
+
+
+@pytest.mark.parametrize("number_of_lines", [0, 1])
+def test_no_decode_cache_empty_file(tmp_path, number_of_lines):
+    check_empty_file(tmp_path, NO_DECODE_CACHE_OPTIONS, number_of_lines)
+
+
+def test_no_decode_cache_truncated_line(tmp_path):
+    check_truncated_line(tmp_path, NO_DECODE_CACHE_OPTIONS)
+
+
+@pytest.mark.parametrize("decode_cache_size", [zx_ruler_results_interpreter.DECODE_CACHE_SIZE, 16])
+def test_decode_cache_counters(hex_results_file_path, decode_cache_size):
+    converters = zx_ruler_results_interpreter.get_converters(decode_cache_size)
+    serial_results = convert(hex_results_file_path)
+    assert convert(hex_results_file_path, converters=converters) == serial_results
+
+    with open(hex_results_file_path, "r") as hex_results_file:
+        next(hex_results_file)
+        hex_results_lines_split = [hex_results_line.strip().split(",") for hex_results_line in hex_results_file]
+
+    decode_cache_info = zx_ruler_results_interpreter.get_decode_cache_info(converters)
+    assert sorted(decode_cache_info) == sorted(zx_ruler_results_interpreter.INTERPRETED_COLUMN_NAMES)
+    for column_name, hex_column_name, _ in zx_ruler_results_interpreter.INTERPRETED_COLUMNS:
+        hex_codes = [hex_results_line_split[HEADER.index(hex_column_name)]
+                     for hex_results_line_split in hex_results_lines_split]
+        # The columns derived from the same telegram share the cache of its parser
+        number_of_calls = len(hex_codes)
+        if hex_column_name in zx_ruler_results_interpreter.TELEGRAM_PARSERS:
+            number_of_calls *= len(zx_ruler_results_interpreter.TELEGRAM_PARSERS[hex_column_name][1])
+
+        cache_info = decode_cache_info[column_name]
+        assert cache_info.hits + cache_info.misses == number_of_calls
+        assert cache_info.maxsize == decode_cache_size
+        assert cache_info.currsize == min(len(set(hex_codes)), decode_cache_size)
+        if len(set(hex_codes)) <= decode_cache_size:
+            assert cache_info.misses == len(set(hex_codes))
+
+
+def test_no_decode_cache_counters():
+    # Only the parsers of the telegrams keep the last telegram
+    decode_cache_info = zx_ruler_results_interpreter.get_decode_cache_info(
+        zx_ruler_results_interpreter.get_converters(0))
+    assert sorted(decode_cache_info) == sorted(column_name for _, column_names
+                                               in zx_ruler_results_interpreter.TELEGRAM_PARSERS.values()
+                                               for column_name in column_names)
+    assert {cache_info.maxsize for cache_info in decode_cache_info.values()} == {1}
@@ -0,0 +1,81 @@
+"""
+Tests of the row filters evaluated on the raw values of the hex codes
+"""
+
+import operator
+
+import pytest
+
+import zx_ruler_results_interpreter
+from conftest import HEADER, convert
+
+
+# Rendered values of the full conversion used to check the filters
+INTERPRETED_COLUMN_INDEXES = {column_name: len(HEADER) + column_number for column_number, column_name
+                              in enumerate(zx_ruler_results_interpreter.INTERPRETED_COLUMN_NAMES)}
+
+
+def is_number(value_string):
+    try:
+        float(value_string)
+    except ValueError:
+        return False
+    return True
+
+
+def has_valid_status(interpreted_row):
+    return interpreted_row[INTERPRETED_COLUMN_INDEXES["STATUS_ERRORS_WARNING"]] not in ("CRC Error",
+                                                                                        "Wrong Hex value")
+
+
+# Filters and the same selection on the rendered values of the full conversion
+ROW_FILTERS = {
+    "mask_or_warning": (["errors & 0x10000 or warnings != 0"],
+                        lambda interpreted_row: has_valid_status(interpreted_row) and (
+                            "ERROR_LD_OVERTEMP" in interpreted_row[INTERPRETED_COLUMN_INDEXES["STATUS_ERRORS_WARNING"]]
+                            or "No Warnings" not in interpreted_row[
+                                INTERPRETED_COLUMN_INDEXES["STATUS_ERRORS_WARNING"]])),
+    "laser_and_no_errors": (["laser = on", "ERRORS == 0"],
+                            lambda interpreted_row: interpreted_row[INTERPRETED_COLUMN_INDEXES["LASER_ON_OR_OFF"]]
+                            == "ON" and has_valid_status(interpreted_row)
+                            and interpreted_row[INTERPRETED_COLUMN_INDEXES["STATUS_ERRORS_WARNING"]].startswith(
+                                "No Errors")),
+    "ld_temp": (["ld_temp > 20.5"],
+                lambda interpreted_row: is_number(interpreted_row[INTERPRETED_COLUMN_INDEXES["LD_TEMP_IN_DEG"]])
+                and float(interpreted_row[INTERPRETED_COLUMN_INDEXES["LD_TEMP_IN_DEG"]]) > 20.5),
+    "current": (["current <= 0x7fff"],
+                lambda interpreted_row: interpreted_row[INTERPRETED_COLUMN_INDEXES["CURRENT"]].endswith(" mA")
+                and int(interpreted_row[INTERPRETED_COLUMN_INDEXES["CURRENT"]][:-3]) <= 0x7fff)}
+
+
+@pytest.mark.parametrize("filter_condition, expected_condition",
+                         [("errors != 0", ("errors", operator.ne, 0)),
+                          ("  Warnings&0x8 ", ("warnings", zx_ruler_results_interpreter.FILTER_OPERATORS["&"], 8)),
+                          ("laser=on", ("laser", operator.eq, "ON")),
+                          ("ld_temp >= -5.5", ("ld_temp", operator.ge, -5.5)),
+                          ("status_byte == 0b11", ("status_byte", operator.eq, 3))])
+def test_filter_condition(filter_condition, expected_condition):
+    assert zx_ruler_results_interpreter.parse_filter_condition(filter_condition) == expected_condition
+
+
+@pytest.mark.parametrize("filter_condition", ["errors", "errors == ", "errors == 1 2", "voltage == 1", "errors == x",
+                                              "laser == MAYBE", "laser > ON", "ld_temp & 1", "errors =< 1"])
+def test_invalid_filter_condition(filter_condition):
+    with pytest.raises(ValueError):
+        zx_ruler_results_interpreter.parse_filter_condition(filter_condition)
+
+
+@pytest.mark.parametrize("row_filter", ROW_FILTERS)
+def test_filtered_rows_same_as_selected_rows(hex_results_file_path, row_filter):
+    where, select = ROW_FILTERS[row_filter]
+    selected_rows = [interpreted_row for interpreted_row
+                     in zx_ruler_results_interpreter.iter_interpreted_rows(hex_results_file_path)
+                     if select(interpreted_row)]
+    assert 0 < len(selected_rows) < 400
+
+    assert list(zx_ruler_results_interpreter.iter_interpreted_rows(hex_results_file_path, where=where)) \
+        == selected_rows
+    number_of_lines, interpreted_results = convert(hex_results_file_path, where=where)
+    assert number_of_lines == len(selected_rows)
+    assert interpreted_results.decode().splitlines()[1:] == [",".join(interpreted_row)
+                                                             for interpreted_row in selected_rows]
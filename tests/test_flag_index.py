@@ -0,0 +1,98 @@
+"""
+Tests of the index of the error and warning flags
+"""
+
+import os
+
+import pytest
+
+import zx_ruler_results_interpreter
+from conftest import HEADER, HEX_RESULTS_FILE_NAME, write_hex_results_file
+
+
+def read_flag_row_ids(hex_results_file_path):
+    """
+    Get the rows of every flag from the status words, line by line
+    :param hex_results_file_path: path of the file with results in Hex
+    :return: dictionary flag -> list with the sorted row ids
+    """
+
+    status_column_index = HEADER.index("GET_STATUS")
+    flag_row_ids = {flag_name: [] for flag_name in zx_ruler_results_interpreter.ERROR_FLAG_NAMES
+                    + zx_ruler_results_interpreter.WARNING_FLAG_NAMES}
+    with open(hex_results_file_path, "r") as hex_results_file:
+        next(hex_results_file)
+        for row_id, hex_results_line in enumerate(hex_results_file):
+            status_response = hex_results_line.strip().split(",")[status_column_index]
+            for flag_names, flag_word in ((zx_ruler_results_interpreter.ERROR_FLAG_NAMES,
+                                           zx_ruler_results_interpreter.get_raw_error_word(status_response)),
+                                          (zx_ruler_results_interpreter.WARNING_FLAG_NAMES,
+                                           zx_ruler_results_interpreter.get_raw_warning_word(status_response))):
+                for bit_number, flag_name in enumerate(flag_names):
+                    if flag_word is not None and flag_word & (1 << bit_number):
+                        flag_row_ids[flag_name].append(row_id)
+
+    return flag_row_ids
+
+
+def test_flag_index_with_bad_rows(tmp_path):
+    truncated_lines = [5, 60]
+    hex_results_file_path = write_hex_results_file(tmp_path / HEX_RESULTS_FILE_NAME, 100,
+                                                   truncated_lines=truncated_lines)
+
+    # Status responses with wrong hex digits and a sign
+    status_column_index = HEADER.index("GET_STATUS")
+    with open(hex_results_file_path, "r", newline="") as hex_results_file:
+        hex_results_lines = hex_results_file.read().split("\n")
+    for line_number, status_response in ((20, "0001zz0000000000000000001234"), (21, "0001-000000100000000001234")):
+        hex_results_line_split = hex_results_lines[line_number + 1].split(",")
+        hex_results_line_split[status_column_index] = status_response
+        hex_results_lines[line_number + 1] = ",".join(hex_results_line_split)
+    with open(hex_results_file_path, "w", newline="") as hex_results_file:
+        hex_results_file.write("\n".join(hex_results_lines))
+
+    flag_index = zx_ruler_results_interpreter.zx_build_flag_index(hex_results_file_path)
+    assert flag_index["rows"] == 100
+    assert zx_ruler_results_interpreter.get_bad_row_ids(flag_index) == [5, 20, 21, 60]
+    assert zx_ruler_results_interpreter.load_flag_index(hex_results_file_path) == flag_index
+
+
+def test_flag_index_queries(hex_results_file_path):
+    flag_row_ids = read_flag_row_ids(hex_results_file_path)
+    flag_index = zx_ruler_results_interpreter.load_flag_index(hex_results_file_path)
+    assert flag_index["rows"] == 400
+    assert zx_ruler_results_interpreter.get_bad_row_ids(flag_index) == []
+
+    # Every flag alone
+    for flag_name, row_ids in flag_row_ids.items():
+        assert zx_ruler_results_interpreter.query_flag_index(flag_index, [flag_name]) == row_ids
+    assert zx_ruler_results_interpreter.get_first_flag_occurrences(flag_index) \
+        == {flag_name: row_ids[0] for flag_name, row_ids in flag_row_ids.items() if row_ids}
+
+    # Rows with all the flags of errors and warnings
+    error_flag_names = zx_ruler_results_interpreter.ERROR_FLAG_NAMES
+    warning_flag_names = zx_ruler_results_interpreter.WARNING_FLAG_NAMES
+    for flag_names in ([error_flag_names[13], error_flag_names[16]], [error_flag_names[16], warning_flag_names[11]],
+                       [error_flag_names[0], error_flag_names[1], warning_flag_names[0]], list(error_flag_names)):
+        row_ids = sorted(set.intersection(*[set(flag_row_ids[flag_name]) for flag_name in flag_names]))
+        assert zx_ruler_results_interpreter.query_flag_index(flag_index, flag_names) == row_ids
+    assert zx_ruler_results_interpreter.query_flag_index(flag_index, [error_flag_names[13], error_flag_names[16]])
+    assert zx_ruler_results_interpreter.query_flag_index(flag_index, []) == []
+
+    with pytest.raises(ValueError):
+        zx_ruler_results_interpreter.query_flag_index(flag_index, ["ERROR_UNKNOWN"])
+
+
+def test_flag_index_out_of_date(tmp_path):
+    hex_results_file_path = write_hex_results_file(tmp_path / HEX_RESULTS_FILE_NAME, 100)
+    flag_index = zx_ruler_results_interpreter.load_flag_index(hex_results_file_path)
+    assert os.path.isfile(zx_ruler_results_interpreter.get_flag_index_file_path(hex_results_file_path))
+    assert zx_ruler_results_interpreter.load_flag_index(hex_results_file_path) == flag_index
+
+    # Built again after the file changed
+    write_hex_results_file(hex_results_file_path, 150, seed=2)
+    flag_index = zx_ruler_results_interpreter.load_flag_index(hex_results_file_path)
+    assert flag_index["rows"] == 150
+    flag_row_ids = read_flag_row_ids(hex_results_file_path)
+    for flag_name, row_ids in flag_row_ids.items():
+        assert zx_ruler_results_interpreter.query_flag_index(flag_index, [flag_name]) == row_ids
@@ -0,0 +1,57 @@
+"""
+Tests of the precomputed tables of the error, warning, status byte and mode flags
+"""
+
+import random
+
+import pytest
+
+import zx_ruler_results_interpreter
+
+
+def get_flags_bit_by_bit(flag_word, flag_dict, unknown_flag_prefix):
+    return tuple(flag_dict.get(bit_number, unknown_flag_prefix + str(bit_number)) for bit_number in range(32)
+                 if flag_word & (1 << bit_number))
+
+
+@pytest.mark.parametrize("flag_dict, flag_byte_tables, unknown_flag_prefix",
+                         [(zx_ruler_results_interpreter.ERROR_DICT, zx_ruler_results_interpreter.ERROR_FLAG_TABLES,
+                           "UNKNOWN_ERROR_BIT_"),
+                          (zx_ruler_results_interpreter.WARNING_DICT,
+                           zx_ruler_results_interpreter.WARNING_FLAG_TABLES, "UNKNOWN_WARNING_BIT_")])
+def test_flags_of_flag_word_same_as_bit_by_bit(flag_dict, flag_byte_tables, unknown_flag_prefix):
+    random_generator = random.Random(3)
+    flag_words = [0, 1, 1 << 31, 0xFFFFFFFF] + [1 << bit_number for bit_number in range(32)] \
+        + [random_generator.getrandbits(32) for _ in range(1000)]
+
+    for flag_word in flag_words:
+        assert zx_ruler_results_interpreter.get_flags_of_flag_word(flag_word, flag_byte_tables) \
+            == get_flags_bit_by_bit(flag_word, flag_dict, unknown_flag_prefix)
+
+
+def test_errors_and_warnings_of_status_response():
+    assert zx_ruler_results_interpreter.get_errors_and_warnings_from_status_response("0001000000000000000012ab") \
+        == "No Errors | No Warnings"
+    assert zx_ruler_results_interpreter.get_errors_and_warnings_from_status_response(
+        "0001" + f"{(1 << 13) | (1 << 16):08x}{1 << 11:08x}" + "12ab") \
+        == "ERROR_OVER_CURRENT | ERROR_LD_OVERTEMP | WARNING_EXTRAPOLATION"
+    assert zx_ruler_results_interpreter.get_errors_and_warnings_from_status_response(
+        "0001" + f"{1 << 31:08x}{1 << 20:08x}" + "12ab") == "UNKNOWN_ERROR_BIT_31 | UNKNOWN_WARNING_BIT_20"
+
+
+def test_status_byte_and_mode_labels():
+    for flag_byte in range(256):
+        flag_byte_hex = f"{flag_byte:02x}"
+        assert zx_ruler_results_interpreter.convert_status_byte(flag_byte_hex + "01") \
+            == (" | ".join(zx_ruler_results_interpreter.STATUS_DICT[bit_number] for bit_number in range(8)
+                           if flag_byte & (1 << bit_number)) if flag_byte else "STATUS_OK")
+        assert zx_ruler_results_interpreter.interpret_get_mode("00" + flag_byte_hex + "c0de") \
+            == " | ".join(zx_ruler_results_interpreter.MODE_DICT[bit_number] for bit_number in range(8)
+                          if flag_byte & (1 << bit_number))
+
+
+def test_negative_status_byte():
+    with pytest.raises(ValueError):
+        zx_ruler_results_interpreter.convert_status_byte("-1")
+    with pytest.raises(ValueError):
+        zx_ruler_results_interpreter.interpret_get_mode("00-1c0de")
@@ -0,0 +1,64 @@
+"""
+Tests of the conversion of the lines appended to a growing file (follow mode)
+"""
+
+import json
+import os
+import shutil
+
+import pytest
+
+import zx_ruler_results_interpreter
+from conftest import HEX_RESULTS_FILE_NAME, convert, write_hex_results_file
+
+
+def test_increment_same_as_serial(tmp_path, hex_results_file_path):
+    serial_results = convert(hex_results_file_path)
+    with open(hex_results_file_path, "rb") as hex_results_file:
+        hex_results = hex_results_file.read()
+
+    # The file grows in three steps, the first ones end in the middle of a line
+    growing_hex_results_file_path = str(tmp_path / "growing" / HEX_RESULTS_FILE_NAME)
+    os.mkdir(tmp_path / "growing")
+    for size in (len(hex_results) // 3, 2 * len(hex_results) // 3, len(hex_results)):
+        with open(growing_hex_results_file_path, "wb") as growing_hex_results_file:
+            growing_hex_results_file.write(hex_results[:size])
+        zx_ruler_results_interpreter.zx_interpret_results_increment(growing_hex_results_file_path, chunk_size=4096)
+
+    with open(growing_hex_results_file_path[:-4] + "_converter.csv", "rb") as interpreted_results_file:
+        assert interpreted_results_file.read() == serial_results[1]
+
+
+def test_increment_rotated_file(tmp_path, hex_results_file_path):
+    zx_ruler_results_interpreter.zx_interpret_results_increment(hex_results_file_path)
+
+    # A shorter file with other lines replaces the file
+    rotated_hex_results_file_path = write_hex_results_file(tmp_path / "rotated.csv", 100, seed=2)
+    shutil.copyfile(rotated_hex_results_file_path, hex_results_file_path)
+    assert zx_ruler_results_interpreter.zx_interpret_results_increment(hex_results_file_path) == 100
+
+    with open(hex_results_file_path[:-4] + "_converter.csv", "rb") as interpreted_results_file:
+        assert interpreted_results_file.read() == convert(rotated_hex_results_file_path)[1]
+
+
+@pytest.mark.parametrize("follow_checkpoint", ["", "[]", "{}", '{"input_offset": 10', '{"file_id": null}',
+                                               '{"input_offset": "10", "output_offset": 10}'])
+def test_increment_stale_checkpoint(hex_results_file_path, follow_checkpoint):
+    zx_ruler_results_interpreter.zx_interpret_results_increment(hex_results_file_path)
+    follow_checkpoint_file_path = hex_results_file_path[:-4] \
+        + zx_ruler_results_interpreter.FOLLOW_CHECKPOINT_FILE_SUFFIX
+    with open(follow_checkpoint_file_path, "r") as follow_checkpoint_file:
+        assert json.load(follow_checkpoint_file)["input_offset"] == os.path.getsize(hex_results_file_path)
+
+    # A checkpoint which can't be read or misses values converts the whole file again
+    with open(follow_checkpoint_file_path, "w") as follow_checkpoint_file:
+        follow_checkpoint_file.write(follow_checkpoint)
+    assert zx_ruler_results_interpreter.zx_interpret_results_increment(hex_results_file_path) == 400
+
+    with open(hex_results_file_path[:-4] + "_converter.csv", "rb") as interpreted_results_file:
+        assert interpreted_results_file.read() == convert(hex_results_file_path)[1]
+
+
+def test_follow_results(hex_results_file_path):
+    assert zx_ruler_results_interpreter.zx_follow_results(hex_results_file_path, poll_interval=0,
+                                                          number_of_refreshes=2) == 400
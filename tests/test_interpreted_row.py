@@ -0,0 +1,73 @@
+"""
+Tests of the lazy views of the interpreted rows
+"""
+
+import pytest
+
+import zx_ruler_results_interpreter
+from conftest import CONVERSION_OPTIONS, HEADER
+
+
+@pytest.mark.parametrize("options", CONVERSION_OPTIONS)
+def test_lazy_rows_same_as_rows(hex_results_file_path, options):
+    rows = list(zx_ruler_results_interpreter.iter_interpreted_rows(hex_results_file_path,
+                                                                   **CONVERSION_OPTIONS[options]))
+    lazy_rows = list(zx_ruler_results_interpreter.iter_interpreted_rows(hex_results_file_path, lazy=True,
+                                                                        **CONVERSION_OPTIONS[options]))
+    assert len(lazy_rows) == len(rows) > 0
+
+    for row, lazy_row in zip(rows, lazy_rows):
+        assert isinstance(lazy_row, zx_ruler_results_interpreter.InterpretedRow)
+        assert lazy_row == row
+        assert lazy_row.to_list() == row
+        assert list(lazy_row) == row
+        assert len(lazy_row) == len(row)
+        assert [lazy_row[position] for position in range(-len(row), len(row))] == row + row
+        assert lazy_row[2:5] == row[2:5] and lazy_row[::-3] == row[::-3] and lazy_row[-4:] == row[-4:]
+
+        # Interpreted columns by title and by attribute
+        interpreted_column_names = lazy_row.row_layout.row_decoding_plan.column_names
+        for column_name, interpreted_value in zip(interpreted_column_names, row[-len(interpreted_column_names):]):
+            assert lazy_row[column_name] == getattr(lazy_row, column_name) \
+                == getattr(lazy_row, column_name.lower()) == interpreted_value
+
+
+def test_lazy_row_converts_only_the_read_columns(hex_results_file_path):
+    lazy_row = next(zx_ruler_results_interpreter.iter_interpreted_rows(hex_results_file_path, lazy=True))
+    interpreted_column_names = zx_ruler_results_interpreter.INTERPRETED_COLUMN_NAMES
+
+    # The columns of the file are not converted
+    assert lazy_row["CYCLE"] == lazy_row[HEADER.index("CYCLE")] == "0"
+    assert lazy_row.interpreted_values is None
+
+    ld_temp_in_deg = lazy_row.LD_TEMP_IN_DEG
+    assert [interpreted_value is not zx_ruler_results_interpreter.NOT_INTERPRETED
+            for interpreted_value in lazy_row.interpreted_values] \
+        == [column_name == "LD_TEMP_IN_DEG" for column_name in interpreted_column_names]
+    assert lazy_row[len(HEADER) + interpreted_column_names.index("LD_TEMP_IN_DEG")] == ld_temp_in_deg
+
+
+def test_lazy_row_titles_of_file_and_interpreted_columns(hex_results_file_path):
+    row = next(zx_ruler_results_interpreter.iter_interpreted_rows(hex_results_file_path))
+    lazy_row = next(zx_ruler_results_interpreter.iter_interpreted_rows(hex_results_file_path, lazy=True))
+
+    # The interpreted column wins over the column of the file with the same title
+    column_index = HEADER.index("GET_CURRENT_DAC_ADC")
+    interpreted_column_index = len(HEADER) + zx_ruler_results_interpreter.INTERPRETED_COLUMN_NAMES.index(
+        "GET_CURRENT_DAC_ADC")
+    assert lazy_row["GET_CURRENT_DAC_ADC"] == row[interpreted_column_index]
+    assert lazy_row.get_hex_code("GET_CURRENT_DAC_ADC") == row[column_index]
+    assert lazy_row["GET_STATUS"] == lazy_row.get_status == row[HEADER.index("GET_STATUS")]
+
+    with pytest.raises(KeyError):
+        lazy_row["NOT_A_COLUMN"]
+    with pytest.raises(AttributeError):
+        lazy_row.not_a_column
+    with pytest.raises(IndexError):
+        lazy_row[len(row)]
+    with pytest.raises(IndexError):
+        lazy_row[-len(row) - 1]
+    with pytest.raises(TypeError):
+        hash(lazy_row)
+    assert lazy_row != row[:-1]
+    assert repr(lazy_row) == f"InterpretedRow({row!r})"
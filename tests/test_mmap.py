@@ -0,0 +1,54 @@
+"""
+Tests of the conversion from a memory map of the file, split on bytes
+"""
+
+import pytest
+
+from conftest import CONVERSION_OPTIONS, HEADER, HEX_RESULTS_FILE_NAME, HEX_RESULTS_FILE_LAYOUTS, check_bad_frames, \
+    check_empty_file, check_same_as_serial, check_truncated_line, convert, write_hex_results_file
+
+
+# Conversion from the memory map
+MMAP_OPTIONS = {"use_mmap": True}
+
+
+@pytest.mark.parametrize("layout", HEX_RESULTS_FILE_LAYOUTS)
+@pytest.mark.parametrize("options", CONVERSION_OPTIONS)
+def test_mmap_same_as_serial(tmp_path, options, layout):
+    check_same_as_serial(tmp_path, MMAP_OPTIONS, options, layout)
+
+
+def test_mmap_bad_frames(hex_results_file_path):
+    check_bad_frames(hex_results_file_path, MMAP_OPTIONS)
+
+
+@pytest.mark.parametrize("number_of_lines", [0, 1])
+def test_mmap_empty_file(tmp_path, number_of_lines):
+    check_empty_file(tmp_path, MMAP_OPTIONS, number_of_lines)
+
+
+def test_mmap_truncated_line(tmp_path):
+    check_truncated_line(tmp_path, MMAP_OPTIONS)
+
+
+@pytest.mark.parametrize("where", [["errors != 0"], ["status_byte == 0x30 or mode >= 5"], ["laser = ON"]])
+def test_mmap_filter_of_non_ascii_fields(tmp_path, where):
+    hex_results_file_path = write_hex_results_file(tmp_path / HEX_RESULTS_FILE_NAME, 200)
+
+    # Full width digits are hex digits for int, but not for the fields parsed as bytes
+    full_width_digits = str.maketrans("0123456789", "０１２３４５６７８９")
+    with open(hex_results_file_path, "r") as hex_results_file:
+        hex_results_lines = hex_results_file.read().splitlines()
+    for line_number in range(0, 200, 3):
+        hex_results_line_split = hex_results_lines[line_number + 1].split(",")
+        for column_name in ("GET_STATUS", "GET_MODE", "GET_LASER_ON_OFF"):
+            column_index = HEADER.index(column_name)
+            hex_results_line_split[column_index] = hex_results_line_split[column_index].translate(full_width_digits)
+        hex_results_line_split[HEADER.index("NOTE")] = "température"
+        hex_results_lines[line_number + 1] = ",".join(hex_results_line_split)
+    with open(hex_results_file_path, "w") as hex_results_file:
+        hex_results_file.write("\n".join(hex_results_lines) + "\n")
+
+    serial_results = convert(hex_results_file_path, where=where)
+    assert serial_results[0] > 0
+    assert convert(hex_results_file_path, where=where, **MMAP_OPTIONS) == serial_results
@@ -0,0 +1,50 @@
+"""
+Tests of the conversion of byte ranges by worker processes
+"""
+
+import pytest
+
+import zx_ruler_results_interpreter
+from conftest import CONVERSION_OPTIONS, HEX_RESULTS_FILE_LAYOUTS, check_bad_frames, check_empty_file, \
+    check_same_as_serial, check_truncated_line
+
+
+# Small ranges so that the file is split in many of them
+PARALLEL_OPTIONS = {"workers": 2, "chunk_size": 4096}
+
+
+@pytest.mark.parametrize("layout", HEX_RESULTS_FILE_LAYOUTS)
+@pytest.mark.parametrize("options", CONVERSION_OPTIONS)
+def test_parallel_same_as_serial(tmp_path, options, layout):
+    check_same_as_serial(tmp_path, PARALLEL_OPTIONS, options, layout)
+
+
+def test_parallel_bad_frames(hex_results_file_path):
+    check_bad_frames(hex_results_file_path, PARALLEL_OPTIONS)
+
+
+@pytest.mark.parametrize("number_of_lines", [0, 1])
+def test_parallel_empty_file(tmp_path, number_of_lines):
+    check_empty_file(tmp_path, PARALLEL_OPTIONS, number_of_lines)
+
+
+def test_parallel_truncated_line(tmp_path):
+    check_truncated_line(tmp_path, PARALLEL_OPTIONS)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 100, 4096, 1 << 30])
+def test_line_aligned_byte_ranges(hex_results_file_path, chunk_size):
+    with open(hex_results_file_path, "rb") as hex_results_file:
+        hex_results = hex_results_file.read()
+    start_offset = hex_results.index(b"\n") + 1
+
+    byte_ranges = list(zx_ruler_results_interpreter.get_line_aligned_byte_ranges(
+        hex_results_file_path, start_offset, chunk_size))
+    # Contiguous ranges of complete lines, covering the file after the header
+    assert byte_ranges[0][0] == start_offset
+    assert byte_ranges[-1][1] == len(hex_results)
+    for (_, range_end_offset), (next_range_start_offset, _) in zip(byte_ranges, byte_ranges[1:]):
+        assert range_end_offset == next_range_start_offset
+    for range_start_offset, range_end_offset in byte_ranges:
+        assert range_end_offset - range_start_offset >= min(chunk_size, len(hex_results) - range_start_offset)
+        assert hex_results[range_end_offset - 1:range_end_offset] == b"\n"
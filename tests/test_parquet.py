@@ -0,0 +1,49 @@
+"""
+Tests of the Parquet dataset partitioned by device serial and run date
+"""
+
+import os
+
+import pytest
+
+import zx_ruler_results_interpreter
+from conftest import TEST_CALIBRATION_PROFILE
+
+
+def test_parquet_same_as_table(tmp_path, hex_results_file_path):
+    pyarrow_parquet = pytest.importorskip("pyarrow.parquet")
+    import zx_ruler_results_vectorized
+
+    calibration_profiles = zx_ruler_results_interpreter.CalibrationProfiles({"test": TEST_CALIBRATION_PROFILE},
+                                                                            {"2300003506": "test"})
+    # The file is written in several row groups
+    parquet_file_path, number_of_rows = zx_ruler_results_vectorized.zx_results_to_parquet(
+        hex_results_file_path, str(tmp_path / "dataset"), row_group_size=64, calibration_profiles=calibration_profiles)
+    assert number_of_rows == 400
+
+    parquet_file = pyarrow_parquet.ParquetFile(parquet_file_path)
+    assert parquet_file.metadata.num_row_groups == 7
+    expected_table = zx_ruler_results_vectorized.results_table_to_arrow(
+        zx_ruler_results_vectorized.read_results_table(hex_results_file_path,
+                                                       calibration_profile=TEST_CALIBRATION_PROFILE))
+    assert parquet_file.read().equals(expected_table.cast(parquet_file.schema_arrow))
+
+
+def test_parquet_partitions(tmp_path, hex_results_file_path):
+    pytest.importorskip("pyarrow.parquet")
+    import zx_ruler_results_vectorized
+
+    dataset_directory = tmp_path / "dataset"
+    parquet_file_path, _ = zx_ruler_results_vectorized.zx_results_to_parquet(hex_results_file_path,
+                                                                             str(dataset_directory))
+    assert os.path.relpath(parquet_file_path, dataset_directory) \
+        == os.path.join("serial=2300003506", "date=2023-07-27", "2300003506_TempZyklen_230727.parquet")
+
+    # Converting the file again replaces its Parquet file
+    modification_time = os.path.getmtime(parquet_file_path)
+    os.utime(parquet_file_path, (modification_time - 10, modification_time - 10))
+    assert zx_ruler_results_vectorized.zx_results_to_parquet(hex_results_file_path, str(dataset_directory)) \
+        == (parquet_file_path, 400)
+    assert os.path.getmtime(parquet_file_path) > modification_time - 10
+    assert [file_names for _, _, file_names in os.walk(dataset_directory) if file_names] \
+        == [["2300003506_TempZyklen_230727.parquet"]]
@@ -0,0 +1,108 @@
+"""
+Tests of the pipelined conversion: reader thread, decode stage and writer thread
+"""
+
+import multiprocessing
+import os
+import threading
+
+import pytest
+
+import zx_ruler_results_interpreter
+from conftest import CONVERSION_OPTIONS, HEX_RESULTS_FILE_LAYOUTS, HEX_RESULTS_FILE_NAME, check_bad_frames, \
+    check_empty_file, check_same_as_serial, check_truncated_line, write_hex_results_file
+
+
+# Keyword arguments of the pipelined conversion, with small blocks and queues so that the file is split in many
+# blocks waiting in the queues
+PIPELINE_MODES = {"pipeline": {"pipeline": True, "block_size": 4096, "queue_depth": 1},
+                  "pipeline_workers": {"pipeline": True, "workers": 2, "block_size": 4096, "queue_depth": 2}}
+
+
+def check_pipeline_error(tmp_path, mode, error_type):
+    """
+    Check that an error of a stage of the pipeline stops the conversion without leaving a thread, a worker process
+    or a converted file
+    :param tmp_path: directory of the generated file
+    :param mode: key of PIPELINE_MODES
+    :param error_type: type of the error raised by the stage
+    :return: NONE
+    """
+
+    hex_results_file_path = write_hex_results_file(tmp_path / HEX_RESULTS_FILE_NAME, 400)
+    threads = set(threading.enumerate())
+
+    with pytest.raises(error_type):
+        zx_ruler_results_interpreter.zx_interpret_results(hex_results_file_path, **PIPELINE_MODES[mode])
+
+    assert set(threading.enumerate()) <= threads
+    assert multiprocessing.active_children() == []
+    assert sorted(os.listdir(tmp_path)) == [HEX_RESULTS_FILE_NAME]
+
+
+@pytest.mark.parametrize("layout", HEX_RESULTS_FILE_LAYOUTS)
+@pytest.mark.parametrize("options", CONVERSION_OPTIONS)
+@pytest.mark.parametrize("mode", PIPELINE_MODES)
+def test_pipeline_same_as_serial(tmp_path, mode, options, layout):
+    check_same_as_serial(tmp_path, PIPELINE_MODES[mode], options, layout)
+
+
+@pytest.mark.parametrize("mode", PIPELINE_MODES)
+def test_pipeline_bad_frames(hex_results_file_path, mode):
+    check_bad_frames(hex_results_file_path, PIPELINE_MODES[mode])
+
+
+@pytest.mark.parametrize("number_of_lines", [0, 1])
+@pytest.mark.parametrize("mode", PIPELINE_MODES)
+def test_pipeline_empty_file(tmp_path, mode, number_of_lines):
+    check_empty_file(tmp_path, PIPELINE_MODES[mode], number_of_lines)
+
+
+@pytest.mark.parametrize("mode", PIPELINE_MODES)
+def test_pipeline_truncated_line(tmp_path, mode):
+    threads = set(threading.enumerate())
+    check_truncated_line(tmp_path, PIPELINE_MODES[mode])
+
+    # The decode error stops the reader and the writer
+    assert set(threading.enumerate()) <= threads
+    assert multiprocessing.active_children() == []
+
+
+@pytest.mark.parametrize("mode", PIPELINE_MODES)
+def test_pipeline_writer_error(tmp_path, monkeypatch, mode):
+    write_blocks_from_queue = zx_ruler_results_interpreter.write_blocks_from_queue
+
+    class FullDiskFile:
+        """
+        File with converted results whose third write fails
+        """
+
+        def __init__(self, interpreted_results_file):
+            self.interpreted_results_file = interpreted_results_file
+            self.number_of_writes = 0
+
+        def write(self, converted_block):
+            self.number_of_writes += 1
+            if self.number_of_writes == 3:
+                raise OSError(28, "No space left on device")
+            return self.interpreted_results_file.write(converted_block)
+
+    def failing_write_blocks_from_queue(interpreted_results_file, converted_queue, errors):
+        write_blocks_from_queue(FullDiskFile(interpreted_results_file), converted_queue, errors)
+
+    monkeypatch.setattr(zx_ruler_results_interpreter, "write_blocks_from_queue", failing_write_blocks_from_queue)
+    check_pipeline_error(tmp_path, mode, OSError)
+
+
+@pytest.mark.parametrize("mode", PIPELINE_MODES)
+def test_pipeline_reader_error(tmp_path, monkeypatch, mode):
+    iter_line_aligned_blocks = zx_ruler_results_interpreter.iter_line_aligned_blocks
+
+    def failing_iter_line_aligned_blocks(*args, **kwargs):
+        for block_number, hex_results_block in enumerate(iter_line_aligned_blocks(*args, **kwargs)):
+            if block_number == 3:
+                raise OSError(5, "Input/output error")
+            yield hex_results_block
+
+    monkeypatch.setattr(zx_ruler_results_interpreter, "iter_line_aligned_blocks", failing_iter_line_aligned_blocks)
+    check_pipeline_error(tmp_path, mode, OSError)
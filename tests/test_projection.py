@@ -0,0 +1,39 @@
+"""
+Tests of the selection of the interpreted columns and of the removal of the hex columns
+"""
+
+import pytest
+
+import zx_ruler_results_interpreter
+from conftest import HEADER, convert
+
+
+def read_converted_lines_split(hex_results_file_path, **kwargs):
+    return [interpreted_results_line.split(",")
+            for interpreted_results_line in convert(hex_results_file_path, **kwargs)[1].decode().splitlines()]
+
+
+@pytest.mark.parametrize("drop_hex_columns", [False, True])
+def test_selected_columns_same_as_all_columns(hex_results_file_path, drop_hex_columns):
+    columns = ["GET_CURRENT_ADC", "STATUS_BYTE", "LD_TEMP_IN_DEG"]
+    all_columns_lines_split = read_converted_lines_split(hex_results_file_path)
+    selected_columns_lines_split = read_converted_lines_split(hex_results_file_path, columns=columns,
+                                                              drop_hex_columns=drop_hex_columns)
+
+    # Columns of the file without the hex codes of the registry
+    hex_column_names = {hex_column_name for _, hex_column_name, _ in zx_ruler_results_interpreter.INTERPRETED_COLUMNS}
+    kept_column_indexes = [column_index for column_index, column_name in enumerate(HEADER)
+                           if not drop_hex_columns or column_name not in hex_column_names]
+    interpreted_column_indexes = [len(HEADER) + zx_ruler_results_interpreter.INTERPRETED_COLUMN_NAMES.index(
+        column_name) for column_name in columns]
+
+    assert selected_columns_lines_split[0][-len(columns):] == columns
+    assert selected_columns_lines_split \
+        == [[all_columns_line_split[column_index] for column_index in kept_column_indexes + interpreted_column_indexes]
+            for all_columns_line_split in all_columns_lines_split]
+
+
+@pytest.mark.parametrize("columns", [[], ["STATUS_BYTE", "NOT_A_COLUMN"]])
+def test_wrong_columns(hex_results_file_path, columns):
+    with pytest.raises(ValueError):
+        zx_ruler_results_interpreter.zx_interpret_results(hex_results_file_path, columns=columns)
@@ -0,0 +1,121 @@
+"""
+Tests of the resilient mode: the lines which can't be converted go to the quarantine file
+"""
+
+import collections
+import csv
+import json
+import os
+
+import pytest
+
+import zx_ruler_results_interpreter
+from conftest import BATCH_FILES, CONVERSION_OPTIONS, HEADER, HEX_RESULTS_FILE_LAYOUTS, HEX_RESULTS_FILE_NAME, \
+    check_bad_frames, check_empty_file, check_same_as_serial, convert, read_manifest, write_batch_files, \
+    write_hex_results_file
+
+
+# Resilient conversion
+QUARANTINE_OPTIONS = {"quarantine": True}
+
+
+@pytest.mark.parametrize("layout", HEX_RESULTS_FILE_LAYOUTS)
+@pytest.mark.parametrize("options", CONVERSION_OPTIONS)
+def test_quarantine_same_as_serial(tmp_path, options, layout):
+    check_same_as_serial(tmp_path, QUARANTINE_OPTIONS, options, layout)
+
+
+def test_quarantine_bad_frames(hex_results_file_path):
+    check_bad_frames(hex_results_file_path, QUARANTINE_OPTIONS)
+
+
+@pytest.mark.parametrize("number_of_lines", [0, 1])
+def test_quarantine_empty_file(tmp_path, number_of_lines):
+    check_empty_file(tmp_path, QUARANTINE_OPTIONS, number_of_lines)
+
+
+@pytest.mark.parametrize("check_crc", [False, True])
+def test_quarantine_same_as_serial_without_bad_lines(tmp_path, check_crc):
+    truncated_lines = [0, 57, 250, 399]
+    hex_results_file_path = write_hex_results_file(tmp_path / HEX_RESULTS_FILE_NAME, 400,
+                                                   truncated_lines=truncated_lines)
+
+    # The same file without the truncated lines
+    os.mkdir(tmp_path / "good_lines")
+    good_hex_results_file_path = str(tmp_path / "good_lines" / HEX_RESULTS_FILE_NAME)
+    with open(hex_results_file_path, "r", newline="") as hex_results_file, \
+            open(good_hex_results_file_path, "w", newline="") as good_hex_results_file:
+        good_hex_results_file.writelines(hex_results_line for hex_results_line in hex_results_file
+                                         if hex_results_line.count(",") == len(HEADER) - 1)
+
+    error_summary = collections.Counter()
+    bad_frames = collections.Counter()
+    quarantine_results = convert(hex_results_file_path, quarantine=True, check_crc=check_crc,
+                                 error_summary=error_summary, bad_frames=bad_frames)
+    assert quarantine_results == convert(good_hex_results_file_path, check_crc=check_crc)
+    assert error_summary == {"IndexError": len(truncated_lines)}
+    if check_crc:
+        assert dict(bad_frames) == zx_ruler_results_interpreter.count_bad_frames(hex_results_file_path)[1]
+
+    # Line numbers of the file (header: line 1)
+    with open(zx_ruler_results_interpreter.get_quarantine_file_path(hex_results_file_path), "r") as quarantine_file:
+        quarantine_lines = quarantine_file.read().splitlines()
+    assert quarantine_lines[0] == "LINE_NUMBER,REASON,LINE"
+    assert [int(quarantine_line.split(",")[0]) for quarantine_line in quarantine_lines[1:]] \
+        == [line_number + 2 for line_number in truncated_lines]
+
+
+def test_quarantine_reasons(tmp_path):
+    hex_results_file_path = write_hex_results_file(tmp_path / HEX_RESULTS_FILE_NAME, 300, truncated_lines=[120])
+
+    # A wrong hex digit in the LD temperature
+    with open(hex_results_file_path, "r", newline="") as hex_results_file:
+        hex_results_lines = hex_results_file.read().split("\n")
+    hex_results_line_split = hex_results_lines[201].split(",")
+    hex_results_line_split[HEADER.index("GET_LD_TEMP")] = "00zz001234"
+    hex_results_lines[201] = ",".join(hex_results_line_split)
+    with open(hex_results_file_path, "w", newline="") as hex_results_file:
+        hex_results_file.write("\n".join(hex_results_lines))
+
+    error_summary = collections.Counter()
+    number_of_lines, _ = convert(hex_results_file_path, error_summary=error_summary, **QUARANTINE_OPTIONS)
+    assert number_of_lines == 298
+    assert error_summary == {"IndexError": 1, "ValueError": 1}
+    with open(zx_ruler_results_interpreter.get_quarantine_file_path(hex_results_file_path), "r",
+              newline="") as quarantine_file:
+        quarantine_rows = list(csv.reader(quarantine_file))
+    assert quarantine_rows[0] == ["LINE_NUMBER", "REASON", "LINE"]
+    # Line numbers of the file (header: line 1), reasons and the lines as they are in the file
+    assert [(line_number, line) for line_number, _, line in quarantine_rows[1:]] \
+        == [("122", hex_results_lines[121]), ("202", hex_results_lines[201])]
+    assert [reason.split(":")[0] for _, reason, _ in quarantine_rows[1:]] == ["IndexError", "ValueError"]
+
+    # The quarantine file of a previous conversion is removed when there is no bad line
+    write_hex_results_file(hex_results_file_path, 300)
+    convert(hex_results_file_path, **QUARANTINE_OPTIONS)
+    assert not os.path.exists(zx_ruler_results_interpreter.get_quarantine_file_path(hex_results_file_path))
+
+
+def test_quarantine_cannot_resume(hex_results_file_path):
+    with pytest.raises(ValueError):
+        zx_ruler_results_interpreter.zx_interpret_results(hex_results_file_path, resume=True, **QUARANTINE_OPTIONS)
+
+
+def test_batch_quarantine_run_twice(tmp_path):
+    write_batch_files(tmp_path)
+
+    for _ in range(2):
+        zx_ruler_results_interpreter.zx_interpret_results_batch(str(tmp_path), workers=2, quarantine=True,
+                                                                check_crc=True)
+
+        # The converted, quarantine and sidecar files of the first run are not converted again
+        manifest = read_manifest(tmp_path)
+        assert sorted(manifest) == sorted(BATCH_FILES)
+        for file_name, (number_of_lines, truncated_lines) in BATCH_FILES.items():
+            assert manifest[file_name]["STATUS"] == "OK"
+            assert int(manifest[file_name]["ROWS"]) == number_of_lines - len(truncated_lines)
+            assert int(manifest[file_name]["BAD_LINES"]) == len(truncated_lines)
+            assert json.loads(manifest[file_name]["BAD_FRAMES"]) \
+                == zx_ruler_results_interpreter.count_bad_frames(str(tmp_path / file_name))[1]
+            assert os.path.exists(zx_ruler_results_interpreter.get_quarantine_file_path(str(tmp_path / file_name))) \
+                == bool(truncated_lines)
@@ -0,0 +1,82 @@
+"""
+Tests of the records of the decoded telegrams
+"""
+
+import random
+
+import pytest
+
+import zx_ruler_results_interpreter
+from conftest import TEST_CALIBRATION_PROFILE, read_interpreted_columns
+
+
+@pytest.mark.parametrize("calibration_profile", [None, TEST_CALIBRATION_PROFILE])
+def test_records_same_as_converted_file(hex_results_file_path, calibration_profile):
+    interpreted_columns = read_interpreted_columns(hex_results_file_path, calibration_profile)
+    column_indexes = [zx_ruler_results_interpreter.INTERPRETED_COLUMN_NAMES.index(column_name)
+                      for column_name in ("SMCU_STATUS", "GET_CURRENT_DAC_ADC", "GET_CURRENT_ADC")]
+
+    records = zx_ruler_results_interpreter.iter_telegram_records(hex_results_file_path,
+                                                                 ["GET_SMCU_STATUS", "GET_CURRENT_DAC_ADC"],
+                                                                 calibration_profile=calibration_profile)
+    number_of_records = 0
+    for (smcu_status, current_dac_adc), interpreted_values in zip(records, interpreted_columns):
+        smcu_status_string, current_dac_string, current_adc_string = [interpreted_values[column_index]
+                                                                      for column_index in column_indexes]
+        # The short and wrong telegrams have no record
+        if smcu_status is not None:
+            assert str(smcu_status) == smcu_status_string
+            number_of_records += 1
+        if current_dac_adc is not None:
+            assert current_dac_adc.current_dac_string() == current_dac_string
+            assert current_dac_adc.current_adc_string() == current_adc_string
+            number_of_records += 1
+
+    assert number_of_records > 400
+
+
+def test_records_of_all_columns_same_as_converted_file(hex_results_file_path):
+    interpreted_columns = read_interpreted_columns(hex_results_file_path, None)
+    hex_column_names = list(zx_ruler_results_interpreter.RECORD_DECODERS)
+    # str() of a record renders the first interpreted column of its hex code
+    column_indexes = [[hex_column_name for _, hex_column_name, _ in zx_ruler_results_interpreter.INTERPRETED_COLUMNS]
+                      .index(hex_column_name) for hex_column_name in hex_column_names]
+
+    number_of_records = dict.fromkeys(hex_column_names, 0)
+    for records, interpreted_values in zip(zx_ruler_results_interpreter.iter_telegram_records(hex_results_file_path),
+                                           interpreted_columns):
+        assert len(records) == len(hex_column_names)
+        for hex_column_name, record, column_index in zip(hex_column_names, records, column_indexes):
+            if record is not None:
+                assert str(record) == interpreted_values[column_index]
+                number_of_records[hex_column_name] += 1
+
+    assert all(number_of_records[hex_column_name] > 300 for hex_column_name in hex_column_names)
+
+
+def test_status_word_flags():
+    random_generator = random.Random(1)
+    for _ in range(1000):
+        status_byte = random_generator.choice([0, 1, 0x30, random_generator.getrandbits(8)])
+        error_word = random_generator.choice([0, 1 << 16, 1 << 31, random_generator.getrandbits(32)])
+        warning_word = random_generator.choice([0, 1 << 11, random_generator.getrandbits(32)])
+        status_response = f"{status_byte:02x}01{error_word:08x}{warning_word:08x}1234"
+        status_word = zx_ruler_results_interpreter.decode_status_word(status_response)
+        assert status_word == (status_byte, error_word, warning_word)
+
+        # Flags of the set bits, lowest bit first
+        assert status_word.errors == tuple(flag_name for bit_number, flag_name
+                                           in enumerate(zx_ruler_results_interpreter.ERROR_FLAG_NAMES)
+                                           if error_word & (1 << bit_number))
+        assert status_word.warnings == tuple(flag_name for bit_number, flag_name
+                                             in enumerate(zx_ruler_results_interpreter.WARNING_FLAG_NAMES)
+                                             if warning_word & (1 << bit_number))
+        assert str(status_word) \
+            == zx_ruler_results_interpreter.get_errors_and_warnings_from_status_response(status_response)
+        assert status_word.status_byte_string() == zx_ruler_results_interpreter.convert_status_byte(status_response)
+
+
+@pytest.mark.parametrize("status_response", ["", "0001", "00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x001234",
+                                             "0001zz00000000000000001234", "0x0100000010000000001234"])
+def test_no_status_word_of_wrong_status_response(status_response):
+    assert zx_ruler_results_interpreter.decode_status_word(status_response) is None
@@ -0,0 +1,131 @@
+"""
+Tests of the resumable conversion: byte ranges with a checkpoint after each one
+"""
+
+import collections
+import json
+import os
+
+import pytest
+
+import zx_ruler_results_interpreter
+from conftest import CONVERSION_OPTIONS, HEX_RESULTS_FILE_LAYOUTS, check_bad_frames, check_empty_file, \
+    check_same_as_serial, check_truncated_line, convert
+
+
+# Keyword arguments of the resumable conversion, with small ranges so that the file is split in many of them
+RESUME_MODES = {"resume": {"resume": True, "chunk_size": 4096},
+                "resume_workers": {"resume": True, "workers": 2, "chunk_size": 4096}}
+
+# Changes of the checkpoint of an interrupted conversion, which can't be resumed
+MALFORMED_CHECKPOINTS = {"not_json": lambda checkpoint: "{",
+                         "list": lambda checkpoint: "[]",
+                         "string": lambda checkpoint: '"checkpoint"',
+                         "empty": lambda checkpoint: "{}",
+                         "missing_input_offset": lambda checkpoint: {key: value for key, value in checkpoint.items()
+                                                                     if key != "input_offset"},
+                         "string_lines": lambda checkpoint: dict(checkpoint, lines=str(checkpoint["lines"])),
+                         "float_output_offset": lambda checkpoint: dict(checkpoint,
+                                                                        output_offset=checkpoint["output_offset"] / 2),
+                         "list_bad_frames": lambda checkpoint: dict(checkpoint, bad_frames=[]),
+                         "other_plan": lambda checkpoint: dict(checkpoint, plan_hash="0"),
+                         "output_after_temporary_file": lambda checkpoint: dict(
+                             checkpoint, output_offset=checkpoint["output_offset"] + 10 ** 6)}
+
+
+def interrupt_resumable_conversion(hex_results_file_path, monkeypatch, number_of_ranges, **kwargs):
+    """
+    Interrupt a resumable conversion after some byte ranges
+    :param hex_results_file_path: path of the file with results in Hex
+    :param monkeypatch: pytest monkeypatch, undone before the function returns
+    :param number_of_ranges: number of ranges converted before the interruption
+    :param kwargs: other keyword arguments of zx_interpret_results
+    :return: path of the checkpoint left by the interrupted conversion
+    """
+
+    convert_hex_results_byte_range = zx_ruler_results_interpreter.convert_hex_results_byte_range
+    converted_ranges = []
+
+    def interrupted_convert_hex_results_byte_range(*args, **kwargs):
+        if len(converted_ranges) == number_of_ranges:
+            raise KeyboardInterrupt
+        converted_ranges.append(args[2:4])
+        return convert_hex_results_byte_range(*args, **kwargs)
+
+    monkeypatch.setattr(zx_ruler_results_interpreter, "convert_hex_results_byte_range",
+                        interrupted_convert_hex_results_byte_range)
+    with pytest.raises(KeyboardInterrupt):
+        zx_ruler_results_interpreter.zx_interpret_results(hex_results_file_path, resume=True, chunk_size=4096,
+                                                          **kwargs)
+    monkeypatch.undo()
+
+    checkpoint_file_path = hex_results_file_path[:-4] + zx_ruler_results_interpreter.RESUME_CHECKPOINT_FILE_SUFFIX
+    assert os.path.exists(checkpoint_file_path)
+    return checkpoint_file_path
+
+
+@pytest.mark.parametrize("layout", HEX_RESULTS_FILE_LAYOUTS)
+@pytest.mark.parametrize("options", CONVERSION_OPTIONS)
+@pytest.mark.parametrize("mode", RESUME_MODES)
+def test_resume_same_as_serial(tmp_path, mode, options, layout):
+    check_same_as_serial(tmp_path, RESUME_MODES[mode], options, layout)
+
+
+@pytest.mark.parametrize("mode", RESUME_MODES)
+def test_resume_bad_frames(hex_results_file_path, mode):
+    check_bad_frames(hex_results_file_path, RESUME_MODES[mode])
+
+
+@pytest.mark.parametrize("number_of_lines", [0, 1])
+@pytest.mark.parametrize("mode", RESUME_MODES)
+def test_resume_empty_file(tmp_path, mode, number_of_lines):
+    check_empty_file(tmp_path, RESUME_MODES[mode], number_of_lines)
+
+
+@pytest.mark.parametrize("mode", RESUME_MODES)
+def test_resume_truncated_line(tmp_path, mode):
+    check_truncated_line(tmp_path, RESUME_MODES[mode])
+
+
+def test_resume_after_interruption(hex_results_file_path, monkeypatch):
+    serial_results = convert(hex_results_file_path, check_crc=True)
+    checkpoint_file_path = interrupt_resumable_conversion(hex_results_file_path, monkeypatch, 5, check_crc=True)
+
+    # The conversion continues after the ranges converted before the interruption
+    bad_frames = collections.Counter()
+    assert convert(hex_results_file_path, resume=True, chunk_size=4096, check_crc=True,
+                   bad_frames=bad_frames) == serial_results
+    assert dict(bad_frames) == zx_ruler_results_interpreter.count_bad_frames(hex_results_file_path)[1]
+    assert not os.path.exists(checkpoint_file_path)
+
+
+@pytest.mark.parametrize("malformed_checkpoint", MALFORMED_CHECKPOINTS)
+def test_resume_malformed_checkpoint(hex_results_file_path, monkeypatch, malformed_checkpoint):
+    serial_results = convert(hex_results_file_path, check_crc=True)
+    checkpoint_file_path = interrupt_resumable_conversion(hex_results_file_path, monkeypatch, 5, check_crc=True)
+    with open(checkpoint_file_path, "r") as checkpoint_file:
+        checkpoint = MALFORMED_CHECKPOINTS[malformed_checkpoint](json.load(checkpoint_file))
+    with open(checkpoint_file_path, "w") as checkpoint_file:
+        checkpoint_file.write(checkpoint if isinstance(checkpoint, str) else json.dumps(checkpoint))
+
+    # The conversion starts again from the beginning
+    bad_frames = collections.Counter()
+    assert convert(hex_results_file_path, resume=True, chunk_size=4096, check_crc=True,
+                   bad_frames=bad_frames) == serial_results
+    assert dict(bad_frames) == zx_ruler_results_interpreter.count_bad_frames(hex_results_file_path)[1]
+    assert not os.path.exists(checkpoint_file_path)
+
+
+def test_resume_checkpoints_on_the_disk(hex_results_file_path, monkeypatch):
+    synced_directory_paths = []
+    monkeypatch.setattr(zx_ruler_results_interpreter, "fsync_directory", synced_directory_paths.append)
+    with open(hex_results_file_path, "rb") as hex_results_file:
+        header_size = len(hex_results_file.readline())
+    number_of_ranges = len(list(zx_ruler_results_interpreter.get_line_aligned_byte_ranges(
+        hex_results_file_path, header_size, 4096)))
+    assert number_of_ranges > 5
+
+    convert(hex_results_file_path, resume=True, chunk_size=4096)
+
+    # The rename of the first checkpoint and of the checkpoint of every range
+    assert synced_directory_paths == [os.path.dirname(hex_results_file_path)] * (number_of_ranges + 1)
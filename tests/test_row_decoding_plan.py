@@ -0,0 +1,80 @@
+"""
+Tests of the row decoding plan compiled from the header of the file
+"""
+
+import random
+
+import pytest
+
+import zx_ruler_results_interpreter
+from conftest import HEADER, convert
+
+
+def write_rearranged_file(hex_results_file_path, rearranged_file_path, header, column_indexes):
+    """
+    Write the columns of a file in another order
+    :param hex_results_file_path: path of the file with results in Hex (see HEADER)
+    :param rearranged_file_path: path of the file written
+    :param header: titles of the columns of the file written
+    :param column_indexes: index in HEADER of every column of the file written (None: extra column)
+    :return: path of the file written
+    """
+
+    with open(hex_results_file_path, "r") as hex_results_file:
+        next(hex_results_file)
+        hex_results_lines_split = [hex_results_line.strip().split(",") for hex_results_line in hex_results_file]
+
+    with open(rearranged_file_path, "w") as rearranged_file:
+        rearranged_file.write(",".join(header) + "\n")
+        for line_number, hex_results_line_split in enumerate(hex_results_lines_split):
+            rearranged_file.write(",".join(hex_results_line_split[column_index] if column_index is not None
+                                           else f"extra {line_number}" for column_index in column_indexes) + "\n")
+
+    return str(rearranged_file_path)
+
+
+def read_interpreted_values(hex_results_file_path, number_of_columns):
+    interpreted_results_lines = convert(hex_results_file_path)[1].decode().splitlines()
+    return [interpreted_results_line.split(",")[number_of_columns:]
+            for interpreted_results_line in interpreted_results_lines]
+
+
+def test_reordered_and_extra_columns(tmp_path, hex_results_file_path):
+    column_indexes = list(range(len(HEADER))) + [None, None]
+    random.Random(4).shuffle(column_indexes)
+    header = [HEADER[column_index] if column_index is not None else f"EXTRA_{column_number}"
+              for column_number, column_index in enumerate(column_indexes)]
+    rearranged_file_path = write_rearranged_file(hex_results_file_path, tmp_path / "2300003506_TempZyklen_230728.csv",
+                                                 header, column_indexes)
+
+    assert read_interpreted_values(rearranged_file_path, len(header)) \
+        == read_interpreted_values(hex_results_file_path, len(HEADER))
+
+
+def test_legacy_column_indexes(tmp_path, hex_results_file_path):
+    # GET_CURRENT_DAC_ADC moved to its legacy index by extra columns, the legacy columns without title
+    current_dac_adc_column_index = HEADER.index("GET_CURRENT_DAC_ADC")
+    column_indexes = list(range(current_dac_adc_column_index)) \
+        + [None] * (zx_ruler_results_interpreter.LEGACY_HEX_COLUMN_INDEXES["GET_CURRENT_DAC_ADC"]
+                    - current_dac_adc_column_index) \
+        + list(range(current_dac_adc_column_index, len(HEADER)))
+    header = [HEADER[column_index] if column_index is not None else "AUX"
+              for column_index in column_indexes]
+    for hex_column_name, column_index in zx_ruler_results_interpreter.LEGACY_HEX_COLUMN_INDEXES.items():
+        assert header[column_index] == hex_column_name
+        header[column_index] = ""
+    rearranged_file_path = write_rearranged_file(hex_results_file_path, tmp_path / "2300003506_TempZyklen_230728.csv",
+                                                 header, column_indexes)
+
+    assert read_interpreted_values(rearranged_file_path, len(header)) \
+        == read_interpreted_values(hex_results_file_path, len(HEADER))
+
+
+def test_missing_column(tmp_path, hex_results_file_path):
+    # Only the columns of older loggers have a legacy index
+    header = ["" if column_name == "GET_POWER_OUT_ABS" else column_name for column_name in HEADER]
+    rearranged_file_path = write_rearranged_file(hex_results_file_path, tmp_path / "2300003506_TempZyklen_230728.csv",
+                                                 header, range(len(HEADER)))
+
+    with pytest.raises(ValueError, match="GET_POWER_OUT_ABS"):
+        zx_ruler_results_interpreter.zx_interpret_results(rearranged_file_path)
@@ -0,0 +1,93 @@
+"""
+Tests of the sparse row index and the reads of row and time ranges
+"""
+
+import pytest
+
+import zx_ruler_results_interpreter
+from conftest import HEADER, HEX_RESULTS_FILE_LAYOUTS, HEX_RESULTS_FILE_NAME, write_hex_results_file
+
+
+# Keyword arguments of the row decoding plan and of iter_interpreted_rows
+PLAN_OPTIONS = {"all_columns": {},
+                "selection": {"columns": ["STATUS_ERRORS_WARNING", "SMCU_STATUS", "GET_CURRENT_ADC"],
+                              "drop_hex_columns": True}}
+
+# Row ranges start row, stop row
+ROW_RANGES = [(0, 400), (0, 1), (6, 8), (7, 14), (63, 129), (399, 400), (390, 1000), (200, 200), (300, 100)]
+
+# Time ranges start time, stop time (a row every second from 00:00:00)
+TIME_RANGES = [("2023-07-27 00:00:00", "2023-07-27 00:06:39"), ("2023-07-27 00:01:10", "2023-07-27 00:03:00"),
+               ("2023-07-27 00:00:07", "2023-07-27 00:00:07"), ("2023-07-26 23:00:00", "2023-07-27 00:00:03"),
+               ("2023-07-27 00:06:30", "2023-07-28 00:00:00"), ("2023-07-27 00:03:00", "2023-07-27 00:01:10"),
+               ("2023-07-28 00:00:00", "2023-07-28 01:00:00")]
+
+
+def test_row_range_with_lone_carriage_return(tmp_path):
+    hex_results_file_path = write_hex_results_file(tmp_path / HEX_RESULTS_FILE_NAME, 100)
+
+    # A carriage return in the last column of some lines doesn't end the line
+    with open(hex_results_file_path, "r", newline="") as hex_results_file:
+        hex_results_lines = hex_results_file.read().split("\n")
+    for line_number in (3, 40, 41, 77):
+        hex_results_lines[line_number + 1] += "\rnote"
+    with open(hex_results_file_path, "w", newline="") as hex_results_file:
+        hex_results_file.write("\n".join(hex_results_lines))
+
+    row_index = zx_ruler_results_interpreter.zx_build_row_index(hex_results_file_path, row_index_interval=7)
+    assert row_index["rows"] == 100
+
+    cycle_column_index = HEADER.index("CYCLE")
+    interpreted_rows = zx_ruler_results_interpreter.read_interpreted_rows_by_row_range(
+        hex_results_file_path, 30, 90, row_index_interval=7)
+    assert [row_id for row_id, _ in interpreted_rows] == list(range(30, 90))
+    assert all(interpreted_row[cycle_column_index] == str(row_id) for row_id, interpreted_row in interpreted_rows)
+    assert interpreted_rows[41 - 30][1][HEADER.index("NOTE")].endswith("\rnote")
+
+
+@pytest.mark.parametrize("layout", HEX_RESULTS_FILE_LAYOUTS)
+@pytest.mark.parametrize("plan_options", PLAN_OPTIONS)
+@pytest.mark.parametrize("row_index_interval", [1, 7, 64, 1000])
+def test_row_and_time_ranges_same_as_all_rows(tmp_path, layout, plan_options, row_index_interval):
+    hex_results_file_path = write_hex_results_file(tmp_path / HEX_RESULTS_FILE_NAME, 400,
+                                                   **HEX_RESULTS_FILE_LAYOUTS[layout])
+    interpreted_rows = list(enumerate(zx_ruler_results_interpreter.iter_interpreted_rows(
+        hex_results_file_path, **PLAN_OPTIONS[plan_options])))
+
+    row_index = zx_ruler_results_interpreter.load_row_index(hex_results_file_path, row_index_interval)
+    assert row_index["rows"] == 400
+    assert [row_index_entry[0] for row_index_entry in row_index["entries"]] == list(range(0, 400, row_index_interval))
+
+    for start_row, stop_row in ROW_RANGES:
+        assert zx_ruler_results_interpreter.read_interpreted_rows_by_row_range(
+            hex_results_file_path, start_row, stop_row, PLAN_OPTIONS[plan_options], row_index_interval) \
+            == interpreted_rows[start_row:stop_row]
+
+    with open(hex_results_file_path, "r") as hex_results_file:
+        timestamps = [hex_results_line.split(",")[HEADER.index("TIMESTAMP")]
+                      for hex_results_line in hex_results_file.read().splitlines()[1:]]
+    for start_time, stop_time in TIME_RANGES:
+        assert zx_ruler_results_interpreter.read_interpreted_rows_by_time_range(
+            hex_results_file_path, start_time, stop_time, PLAN_OPTIONS[plan_options], row_index_interval) \
+            == [(row_id, interpreted_row) for row_id, interpreted_row in interpreted_rows
+                if start_time <= timestamps[row_id] <= stop_time]
+
+
+def test_ranges_of_empty_file(tmp_path):
+    hex_results_file_path = write_hex_results_file(tmp_path / HEX_RESULTS_FILE_NAME, 0)
+    assert zx_ruler_results_interpreter.read_interpreted_rows_by_row_range(hex_results_file_path, 0, 10) == []
+    assert zx_ruler_results_interpreter.read_interpreted_rows_by_time_range(
+        hex_results_file_path, "2023-07-27 00:00:00", "2023-07-28 00:00:00") == []
+
+
+def test_time_range_without_timestamp_column(tmp_path):
+    hex_results_file_path = write_hex_results_file(tmp_path / HEX_RESULTS_FILE_NAME, 10)
+    with open(hex_results_file_path, "r") as hex_results_file:
+        hex_results_lines = hex_results_file.read().splitlines()
+    with open(hex_results_file_path, "w") as hex_results_file:
+        hex_results_file.write("\n".join(["DATE" + hex_results_lines[0][len("TIMESTAMP"):]] + hex_results_lines[1:]))
+
+    assert len(zx_ruler_results_interpreter.read_interpreted_rows_by_row_range(hex_results_file_path, 2, 5)) == 3
+    with pytest.raises(ValueError):
+        zx_ruler_results_interpreter.read_interpreted_rows_by_time_range(
+            hex_results_file_path, "2023-07-27 00:00:00", "2023-07-28 00:00:00")
@@ -0,0 +1,83 @@
+"""
+Tests of the SQLite sink
+"""
+
+import sqlite3
+
+import pytest
+
+import zx_ruler_results_interpreter
+from conftest import TEST_CALIBRATION_PROFILE, convert, read_database_interpreted_columns, \
+    read_interpreted_columns, write_hex_results_file
+
+
+def read_database_rows(database_path):
+    with sqlite3.connect(database_path) as database_connection:
+        return [database_connection.execute(f"SELECT * FROM {table_name} ORDER BY 1, 2").fetchall()
+                for table_name in ("source_files", "results")]
+
+
+@pytest.mark.parametrize("calibration_profile", [None, TEST_CALIBRATION_PROFILE])
+def test_sqlite_same_as_converted_file(tmp_path, hex_results_file_path, calibration_profile):
+    database_path = str(tmp_path / "results.sqlite")
+    assert zx_ruler_results_interpreter.zx_results_to_sqlite(hex_results_file_path, database_path,
+                                                             calibration_profile=calibration_profile) == 400
+
+    assert read_database_interpreted_columns(database_path) \
+        == read_interpreted_columns(hex_results_file_path, calibration_profile)
+
+
+def test_sqlite_store_twice(tmp_path, hex_results_file_path):
+    database_path = str(tmp_path / "results.sqlite")
+    other_hex_results_file_path = write_hex_results_file(tmp_path / "2300003507_TempZyklen_230728.csv", 100, seed=2)
+    zx_ruler_results_interpreter.zx_results_to_sqlite(hex_results_file_path, database_path)
+    zx_ruler_results_interpreter.zx_results_to_sqlite(other_hex_results_file_path, database_path)
+    database_rows = read_database_rows(database_path)
+
+    # Storing a file again replaces its rows, the rows of the other files are kept
+    assert zx_ruler_results_interpreter.zx_results_to_sqlite(hex_results_file_path, database_path) == 400
+    assert read_database_rows(database_path) == database_rows
+    source_files, results = database_rows
+    assert [(device, run_date, rows) for _, _, device, run_date, _, _, rows in source_files] \
+        == [("2300003506", "2023-07-27", 400), ("2300003507", "2023-07-28", 100)]
+    assert len(results) == 500
+
+
+def test_sqlite_indexes(tmp_path, hex_results_file_path):
+    database_path = str(tmp_path / "results.sqlite")
+    zx_ruler_results_interpreter.zx_results_to_sqlite(hex_results_file_path, database_path)
+
+    with sqlite3.connect(database_path) as database_connection:
+        indexes = {index_name: column_names for index_name, column_names in (
+            (index_name, [column_name for _, _, column_name in database_connection.execute(
+                f"PRAGMA index_info({index_name})")])
+            for (index_name,) in database_connection.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'results'"))}
+        # The queries on the masks use the indexes
+        query_plan = database_connection.execute("EXPLAIN QUERY PLAN SELECT line_number FROM results "
+                                                 "WHERE raw_errors = 65536").fetchall()
+
+    assert indexes == {"results_source_file": ["source_file_id"],
+                       "results_device_timestamp": ["device", "timestamp"],
+                       "results_timestamp": ["timestamp"],
+                       "results_raw_errors": ["raw_errors"],
+                       "results_raw_warnings": ["raw_warnings"]}
+    assert "results_raw_errors" in str(query_plan)
+
+
+def test_sqlite_raw_values_and_filters(tmp_path, hex_results_file_path):
+    database_path = str(tmp_path / "results.sqlite")
+    zx_ruler_results_interpreter.zx_results_to_sqlite(hex_results_file_path, database_path)
+    with sqlite3.connect(database_path) as database_connection:
+        selected_line_numbers = [line_number for (line_number,) in database_connection.execute(
+            "SELECT line_number FROM results WHERE raw_errors & 65536 AND raw_laser = 'ON' ORDER BY line_number")]
+
+    # The same lines as the filters of the conversion
+    where = ["errors & 0x10000", "laser = ON"]
+    assert len(selected_line_numbers) == convert(hex_results_file_path, where=where)[0] > 0
+    filtered_database_path = str(tmp_path / "filtered_results.sqlite")
+    assert zx_ruler_results_interpreter.zx_results_to_sqlite(hex_results_file_path, filtered_database_path,
+                                                             where=where) == len(selected_line_numbers)
+    with sqlite3.connect(filtered_database_path) as database_connection:
+        assert [line_number for (line_number,) in database_connection.execute(
+            "SELECT line_number FROM results ORDER BY line_number")] == selected_line_numbers
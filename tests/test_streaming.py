@@ -0,0 +1,30 @@
+"""
+Tests of the streamed conversion and of iter_interpreted_rows
+"""
+
+import zx_ruler_results_interpreter
+from conftest import convert
+
+
+def test_fixture_contains_bad_telegrams(hex_results_file_path):
+    with open(hex_results_file_path, "r") as hex_results_file:
+        hex_results = hex_results_file.read()
+    interpreted_results = convert(hex_results_file_path)[1].decode()
+
+    assert "\x00" in hex_results
+    assert "Wrong Hex value" in interpreted_results
+    assert "CRC Error" in interpreted_results
+
+
+def test_interpreted_rows_same_as_converted_file(hex_results_file_path):
+    number_of_lines, interpreted_results = convert(hex_results_file_path)
+    interpreted_rows = list(zx_ruler_results_interpreter.iter_interpreted_rows(hex_results_file_path))
+
+    assert number_of_lines == len(interpreted_rows) == 400
+    assert interpreted_results.decode().splitlines()[1:] \
+        == [",".join(interpreted_row) for interpreted_row in interpreted_rows]
+
+
+def test_lines_per_write(hex_results_file_path):
+    # The converted lines are written in batches which don't divide the number of lines
+    assert convert(hex_results_file_path, lines_per_write=7) == convert(hex_results_file_path)
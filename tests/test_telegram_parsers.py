@@ -0,0 +1,77 @@
+"""
+Tests of the parsers converting a telegram once for all the columns derived from it
+"""
+
+import random
+
+import pytest
+
+import zx_ruler_results_interpreter
+from conftest import make_telegram, random_hex
+
+
+# Telegrams the parsers can't convert at once: short, NUL characters, wrong hex digits, sign, white space, full
+# width digits
+WRONG_TELEGRAMS = ["", "00", "0a1b", "001020", "00\x00\x00\x00\x0000", "0001zz00000000000000001234",
+                   "0001-0000001000000000001234", "00 1000000010000000001234", "0001 000000100000000001234",
+                   "00０１00000010000000001234", "0x0100000010000000001234", "000X00001000000000001234",
+                   "0001000000100000000"]
+
+
+def call(function, *args):
+    """
+    Call a function and catch its exception
+    :param function: function
+    :param args: arguments
+    :return: result or type of the exception
+    """
+
+    try:
+        return function(*args)
+    except Exception as exception:
+        return type(exception)
+
+
+def call_converters(converters, telegram):
+    """
+    Call the converters of the columns derived from a telegram, like a parser
+    :param converters: converters of the columns
+    :param telegram: telegram in hex
+    :return: tuple with the results or type of the first exception
+    """
+
+    results = tuple(call(converter, telegram) for converter in converters)
+    for result in results:
+        if isinstance(result, type):
+            return result
+    return results
+
+
+def make_telegrams(payload_length):
+    random_generator = random.Random(payload_length)
+    telegrams = [make_telegram(random_generator, random_hex(random_generator, payload_length)) for _ in range(500)]
+    # Any status byte
+    telegrams += [random_hex(random_generator, 2) + random_hex(random_generator, payload_length + 4)
+                  for _ in range(100)]
+    return telegrams + WRONG_TELEGRAMS
+
+
+def test_parse_status_response_same_as_converters():
+    for status_response in make_telegrams(18):
+        assert call(zx_ruler_results_interpreter.parse_status_response, status_response) \
+            == call_converters((zx_ruler_results_interpreter.get_errors_and_warnings_from_status_response,
+                                zx_ruler_results_interpreter.convert_status_byte), status_response)
+
+
+def test_parse_current_dac_adc_same_as_converters():
+    for current_dac_adc in make_telegrams(8):
+        assert call(zx_ruler_results_interpreter.parse_current_dac_adc, current_dac_adc) \
+            == call_converters((zx_ruler_results_interpreter.convert_current_dac_adc,
+                                zx_ruler_results_interpreter.convert_current_adc), current_dac_adc)
+
+
+@pytest.mark.parametrize("payload_length", [16, 18, 20])
+def test_parse_fw_version_same_as_interpret_get_fw_version(payload_length):
+    for fw_version in make_telegrams(payload_length):
+        assert call(zx_ruler_results_interpreter.parse_fw_version, fw_version) \
+            == call(zx_ruler_results_interpreter.interpret_get_fw_version, fw_version)
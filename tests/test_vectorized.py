@@ -0,0 +1,154 @@
+"""
+Tests of the NumPy column decoders (same values as the single value functions) and of the typed result tables
+"""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+import zx_ruler_results_interpreter  # noqa: E402
+import zx_ruler_results_vectorized  # noqa: E402
+from conftest import HEADER, SMCU_STATUS_PAYLOADS, check_column_decoder, render_smcu_status  # noqa: E402
+
+
+def render_fw_version(mmcu_fw_version, smcu_fw_version):
+    return "MMCU:  %d.%d.%d | SMCU:  %d.%d.%d" % (*mmcu_fw_version, *smcu_fw_version)
+
+
+def render_errors_and_warnings(error_word, warning_word):
+    return zx_ruler_results_interpreter.decode_error_word(error_word)[1] + " | " \
+        + zx_ruler_results_interpreter.decode_warning_word(warning_word)[1]
+
+
+def render_status_byte(status_byte):
+    return zx_ruler_results_interpreter.STATUS_BYTE_LABELS[status_byte] if status_byte else "STATUS_OK"
+
+
+# Column decoder, single value function, rendering of the decoded values as the single value function, payloads
+# (None: random) and indexes of the decoded arrays compared (default: all)
+COLUMN_DECODERS = {
+    "ld_temp": (zx_ruler_results_vectorized.decode_ld_temp_column, zx_ruler_results_interpreter.convert_ld_temp_in_deg,
+                lambda ld_temp: str(round(ld_temp, 2)), None, None),
+    "errors_and_warnings": (zx_ruler_results_vectorized.decode_status_column,
+                            zx_ruler_results_interpreter.get_errors_and_warnings_from_status_response,
+                            render_errors_and_warnings, None, (1, 2, 3)),
+    "status_byte": (zx_ruler_results_vectorized.decode_status_column, zx_ruler_results_interpreter.convert_status_byte,
+                    render_status_byte, None, (0, 4)),
+    "laser_on_off": (zx_ruler_results_vectorized.decode_laser_on_off_column,
+                     zx_ruler_results_interpreter.get_laser_on_or_off, lambda laser_on: "ON" if laser_on else "OFF",
+                     None, None),
+    "smcu_status": (zx_ruler_results_vectorized.decode_smcu_status_column,
+                    zx_ruler_results_interpreter.interpret_get_smcu_status, render_smcu_status,
+                    SMCU_STATUS_PAYLOADS, None),
+    "temp_adc": (zx_ruler_results_vectorized.decode_temp_adc_column,
+                 zx_ruler_results_interpreter.convert_temp_adc_in_deg, lambda temp_adc: f"{round(temp_adc, 2)}mV",
+                 None, None),
+    "current": (zx_ruler_results_vectorized.decode_current_column, zx_ruler_results_interpreter.convert_current,
+                lambda current: f"{current} mA", None, None),
+    "mode": (zx_ruler_results_vectorized.decode_mode_column, zx_ruler_results_interpreter.interpret_get_mode,
+             lambda mode_bits: zx_ruler_results_interpreter.MODE_LABELS[mode_bits], None, None),
+    "config_mode": (zx_ruler_results_vectorized.decode_config_mode_column,
+                    zx_ruler_results_interpreter.interpret_get_config_mode,
+                    lambda config_mode: zx_ruler_results_interpreter.CONFIG_MODE_DICT[config_mode],
+                    [f"{config_mode:02x}" for config_mode in zx_ruler_results_interpreter.CONFIG_MODE_DICT], None),
+    "fw_version": (zx_ruler_results_vectorized.decode_fw_version_column,
+                   zx_ruler_results_interpreter.interpret_get_fw_version, render_fw_version, None, None),
+    "current_dac": (zx_ruler_results_vectorized.decode_current_dac_adc_column,
+                    zx_ruler_results_interpreter.convert_current_dac_adc, lambda current: str(round(current, 2)),
+                    None, None),
+    "power_out_abs": (zx_ruler_results_vectorized.decode_power_out_abs_column,
+                      zx_ruler_results_interpreter.convert_power_out_abs, lambda power: f"{round(power)} mw",
+                      None, None),
+    "power_val_in_perc": (zx_ruler_results_vectorized.decode_power_val_in_perc_column,
+                          zx_ruler_results_interpreter.convert_power_val_in_perc, lambda power: f"{round(power)}  ",
+                          None, None),
+    "ld_lifetime": (zx_ruler_results_vectorized.decode_ld_lifetime_column,
+                    zx_ruler_results_interpreter.convert_ld_lifetime, lambda hours, minutes: f"{hours}h {minutes}min",
+                    None, None),
+    "pd_value": (zx_ruler_results_vectorized.decode_pd_value_column, zx_ruler_results_interpreter.convert_pd_value,
+                 str, None, None),
+    "module_total_ontime": (zx_ruler_results_vectorized.decode_module_total_ontime_column,
+                            zx_ruler_results_interpreter.convert_module_total_ontime,
+                            lambda hours, minutes: f"{hours}h {minutes}min", None, None),
+    "cal_laser": (zx_ruler_results_vectorized.decode_cal_laser_column, zx_ruler_results_interpreter.convert_cal_laser,
+                  lambda power, wavelength: f"{round(power)} mw | {wavelength} nm", None, None),
+    "comp_ref": (zx_ruler_results_vectorized.decode_comp_ref_column, zx_ruler_results_interpreter.convert_comp_ref,
+                 lambda voltage: f"{round(voltage, 2)} mV", None, None),
+    "current_adc": (zx_ruler_results_vectorized.decode_current_adc_column,
+                    zx_ruler_results_interpreter.convert_current_adc, lambda current: str(round(current, 2)),
+                    None, None)}
+
+
+@pytest.mark.parametrize("column_decoder", COLUMN_DECODERS)
+def test_column_decoder_same_as_single_value_function(column_decoder):
+    check_column_decoder(column_decoder, *COLUMN_DECODERS[column_decoder])
+
+
+def test_column_decoder_of_empty_column():
+    for decode_column, _, _, _, _ in COLUMN_DECODERS.values():
+        assert all(len(decoded_column) == 0 for decoded_column in decode_column([]))
+
+
+def test_results_table_same_as_column_decoders(hex_results_file_path):
+    results_table = zx_ruler_results_vectorized.read_results_table(hex_results_file_path, check_crc=True)
+    with open(hex_results_file_path, "r") as hex_results_file:
+        next(hex_results_file)
+        hex_results_lines_split = [hex_results_line.strip().split(",") for hex_results_line in hex_results_file]
+
+    def get_column(column_name):
+        return [hex_results_line_split[HEADER.index(column_name)] for hex_results_line_split in hex_results_lines_split]
+
+    # Columns without hex code as strings
+    assert results_table["TIMESTAMP"].tolist() == get_column("TIMESTAMP")
+    assert results_table["NOTE"].tolist() == get_column("NOTE")
+
+    valid = np.ones(len(hex_results_lines_split), dtype=bool)
+    for hex_column_name, decode_column, typed_column_names in zx_ruler_results_vectorized.TYPED_COLUMNS:
+        for typed_column_name, typed_column in zip(typed_column_names, decode_column(get_column(hex_column_name))):
+            assert np.array_equal(results_table[typed_column_name], typed_column)
+            if typed_column_name.endswith("_STATUS"):
+                valid &= typed_column == zx_ruler_results_vectorized.STATUS_OK
+        crc_valid = [zx_ruler_results_interpreter.is_telegram_crc_valid(hex_code)
+                     for hex_code in get_column(hex_column_name)]
+        assert results_table[hex_column_name + zx_ruler_results_interpreter.CRC_COLUMN_SUFFIX].tolist() == crc_valid
+        valid &= crc_valid
+
+    assert np.array_equal(results_table[zx_ruler_results_vectorized.VALID_COLUMN_NAME], valid)
+    assert zx_ruler_results_vectorized.count_bad_frames_of_table(results_table) \
+        == zx_ruler_results_interpreter.count_bad_frames(hex_results_file_path)[1]
+
+
+@pytest.mark.parametrize("rows_per_table", [64, 400, 1000])
+def test_results_tables_same_as_results_table(hex_results_file_path, rows_per_table):
+    results_table = zx_ruler_results_vectorized.read_results_table(hex_results_file_path)
+    results_tables = list(zx_ruler_results_vectorized.iter_results_tables(hex_results_file_path, rows_per_table))
+
+    assert len(results_tables) == -(-400 // rows_per_table)
+    for column_name, column in results_table.items():
+        assert np.array_equal(np.concatenate([table[column_name] for table in results_tables]), column)
+
+
+def test_results_tables_of_empty_file(tmp_path):
+    hex_results_file_path = tmp_path / "2300003506_TempZyklen_230727.csv"
+    hex_results_file_path.write_text(",".join(HEADER) + "\n")
+
+    (results_table,) = zx_ruler_results_vectorized.iter_results_tables(str(hex_results_file_path), 64)
+    assert list(results_table) == list(zx_ruler_results_vectorized.read_results_table(str(hex_results_file_path)))
+    assert all(len(column) == 0 for column in results_table.values())
+
+
+def test_arrow_table_nulls(hex_results_file_path):
+    pytest.importorskip("pyarrow")
+
+    results_table = zx_ruler_results_vectorized.read_results_table(hex_results_file_path)
+    arrow_table = zx_ruler_results_vectorized.results_table_to_arrow(results_table)
+
+    assert arrow_table.column_names == list(results_table)
+    # The values of the rows with another status are null
+    for typed_column_name, status_column_name in zx_ruler_results_vectorized.TYPED_COLUMN_STATUS_COLUMNS.items():
+        status_column = results_table[status_column_name]
+        arrow_column = arrow_table.column(typed_column_name)
+        assert arrow_column.null_count == np.count_nonzero(status_column != zx_ruler_results_vectorized.STATUS_OK)
+        valid_rows = np.flatnonzero(status_column == zx_ruler_results_vectorized.STATUS_OK)
+        assert [arrow_column[int(row)].as_py() for row in valid_rows] \
+            == results_table[typed_column_name][valid_rows].tolist()
@@ -5,6 +5,222 @@ Created: 09.07.2024
 Last modify: 09.07.2024
 """
 
+import argparse
+import base64
+import bisect
+import collections
+import concurrent.futures
+import csv
+import datetime
+import functools
+import glob
+import hashlib
+import io
+import itertools
+import json
+import locale
+import mmap
+import operator
+import os
+import queue
+import re
+import sqlite3
+import sys
+import threading
+import time
+import zlib
+
+
+# Dictionary (key:value) with errors
+ERROR_DICT = {0: "ERROR_FLASH_CHECK",
+              1: "ERROR_EEPROM_CHECK",
+              2: "ERROR_RAM_CHECK",
+              3: "ERROR_BOOT_CHECK",
+              4: "ERROR_WRONG_VIN_VOLTAGE",
+              5: "ERROR_VLD_LEVEL_CHECK",
+              6: "ERROR_SYNCRONISATION_CHECK",
+              7: "ERROR_COMPARATOR_CHECK",
+              8: "ERROR_VIN_OUT_OF_RANGE",
+              9: "ERROR_TWI_ERROR",
+              10: "ERROR_UART_ERROR",
+              11: "ERROR_HEARBEAT_MISSING",
+              12: "ERROR_MISSING_CALIB",
+              13: "ERROR_OVER_CURRENT",
+              14: "ERROR_UNDER_CURRENT",
+              15: "ERROR_LD_NTC_PROBLEM",
+              16: "ERROR_LD_OVERTEMP",
+              17: "ERROR_LD_UNDERTEMP",
+              18: "ERROR_MEMORY_FAIL",
+              19: "ERROR_EXTRAPOLATION_RANGE",
+              20: "ERROR_P_SET",
+              21: "ERROR_CALIBRATION_TABLE",
+              22: "ERROR_TABLE_INDICES_FAIL",
+              23: "ERROR_OPERATION_CURRENT_FAIL",
+              24: "ERROR_INTERPOLATION_TABLE",
+              25: "ERROR_SMCU_CALIBRATION",
+              26: "ERROR_PERIPHERAL_CHECK",
+              27: "ERROR_CMD_EXECUTION",
+              28: "ERROR_BYPASS_TRANSISTOR",
+              29: "ERROR_WRONG_LASER_HEAD"}
+
+# Dictionary (key:value) with warnings
+WARNING_DICT = {0: "WARNING_LD_NTC_PROBLEM",
+                1: "WARNING_LD_OVERTEMP",
+                2: "WARNING_LD_UNDERTEMP",
+                3: "WARNING_LD_SMALL_POWER_FACTOR",
+                4: "WARNING_LD_BIG_POWER_FACTOR",
+                5: "WARNING_CANT_SET_POWER_FACTOR",
+                6: "WARNING_WRONG_COMMAND",
+                7: "WARNING_COMMAND_VALUE_OOR",
+                8: "WARNING_ACCESS_VIOLATION",
+                9: "WARNING_CAN_NOT_SET_RUNNING_MODE",
+                10: "WARNING_OVER_24_HOURS_ONTIME",
+                11: "WARNING_EXTRAPOLATION",
+                12: "WARNING_CAL_T_MIN_MAX_LIMIT",
+                13: "WARNING_END_OF_LIFE"}
+
+# Dictionary (key:value) with Status Byte
+STATUS_DICT = {0: "STATUS_BUSY",
+               1: "STATUS_CRC_ERROR",
+               2: "STATUS_PASSWORD_ERROR",
+               3: "STATUS_TELEGRAM_ERROR",
+               4: "STATUS_WARNING",
+               5: "STATUS_ERROR",
+               6: "STATUS_PASSWORD_SET",
+               7: "STATUS_NO_DATA"}
+
+# Dictionary (key:value) with modes
+MODE_DICT = {0: "external_dig_modulation_on",
+             1: "future_use_1",
+             2: "extern_analog_modulation_on",
+             3: "OVTMP_shutdown_on",
+             4: "fail_out_signalling_on",
+             5: "fail_in_GPIO_on",
+             6: "future_use_2",
+             7: "future_use_3"}
+
+# Dictionary (key:value) with start up states
+START_UP_STATES_DICT = {"10": "STARTUP_TESTS_ONGOING",
+                        "20": "STARTUP_TESTS_FINISHED",
+                        "30": "STARTUP_COMP_TEST_FINISHED",
+                        "40": "STARTUP_COMP_READY"}
+
+# Dictionary (key:value) with operation state
+OPERATION_STATES_DICT = {"00": "OP_STAT_STARTUP_IDLE",
+                         "01": "OP_STAT_STARTUP_USERCOMM_SELECTED",
+                         "02": "OP_STAT_STARTUP_WAIT_FOR_SMCU",
+                         "03": "OP_STAT_STARTUP_TEST_FIRST_OPV_VALUE",
+                         "04": "OP_STAT_STARTUP_TEST_SECOND_OPV_VALUE",
+                         "10": "OP_STAT_STANDBY",
+                         "20": "OP_STAT_READY_OPERATION",
+                         "28": "OP_STAT_USER_SERVICE",
+                         "40": "OP_STAT_FACTORY_SERVICE",
+                         "60": "OP_STAT_LD_TEST",
+                         "80": "OP_STAT_FAILURE"}
+
+# Dictionary (key:value) with operation mode
+CONFIG_MODE_DICT = {0: "MODULATION_FAIL_OUT",
+                    1: "MODULATION_FAIL_IN",
+                    2: "RS232_COM_DIG_IN",
+                    3: "TWI_COM_DIG_IN",
+                    4: "RS232_COM_FAIL_IN",
+                    5: "TWI_COM_FAIL_IN",
+                    6: "RS232_COM_FAIL_OUT",
+                    7: "TWI_COM_FAIL_OUT",
+                    8: "ZX20S_AT_CONFIG",
+                    9: "ZXS_OEM_CONFIG"}
+
+
+def build_flag_byte_tables(flag_dict, number_of_bytes, unknown_flag_prefix):
+    """
+    Precompute for each byte of a flag word the flags of all 256 byte values
+    :param flag_dict: dictionary with the bit number as key and the flag as value
+    :param number_of_bytes: number of bytes of the flag word
+    :param unknown_flag_prefix: prefix of the flag of the bits not in the dictionary (followed by the bit number)
+    :return: tuple (one element per byte, lowest byte first) of tuples with the flags of the 256 byte values
+    """
+
+    flag_byte_tables = []
+
+    for byte_number in range(number_of_bytes):
+        flag_byte_table = []
+        for byte_value in range(256):
+            # Flags of the high bits, lowest bit first
+            flag_byte_table.append(tuple(flag_dict.get(bit_number, unknown_flag_prefix + str(bit_number))
+                                         for bit_number in range(byte_number * 8, byte_number * 8 + 8)
+                                         if byte_value & (1 << (bit_number - byte_number * 8))))
+        flag_byte_tables.append(tuple(flag_byte_table))
+
+    return tuple(flag_byte_tables)
+
+
+def get_flags_of_flag_word(flag_word, flag_byte_tables):
+    """
+    Get the flags of the high bits of a flag word with one table lookup per byte
+    :param flag_word: flag word as int
+    :param flag_byte_tables: tables of the flag word (see build_flag_byte_tables)
+    :return: tuple with the flags, lowest bit first
+    """
+
+    flags = ()
+    for flag_byte_table in flag_byte_tables:
+        flags += flag_byte_table[flag_word & 0xFF]
+        flag_word >>= 8
+    return flags
+
+
+# Precomputed flags of the 4 bytes of the error and warning words
+ERROR_FLAG_TABLES = build_flag_byte_tables(ERROR_DICT, 4, "UNKNOWN_ERROR_BIT_")
+WARNING_FLAG_TABLES = build_flag_byte_tables(WARNING_DICT, 4, "UNKNOWN_WARNING_BIT_")
+
+# Flag of every bit of the error and warning words
+ERROR_FLAG_NAMES = tuple(ERROR_DICT.get(bit_number, "UNKNOWN_ERROR_BIT_" + str(bit_number)) for bit_number in range(32))
+WARNING_FLAG_NAMES = tuple(WARNING_DICT.get(bit_number, "UNKNOWN_WARNING_BIT_" + str(bit_number))
+                           for bit_number in range(32))
+
+# Precomputed strings of the 256 values of the status byte and of the mode
+STATUS_BYTE_LABELS = tuple(" | ".join(flags) for flags in build_flag_byte_tables(STATUS_DICT, 1, "")[0])
+MODE_LABELS = tuple(" | ".join(flags) for flags in build_flag_byte_tables(MODE_DICT, 1, "")[0])
+
+
+def get_flag_byte_label(flag_byte_labels, flag_byte_hex):
+    """
+    Get the precomputed string of a flag byte in hex (e.g. "-1" is parsed by int() but isn't a byte value)
+    :param flag_byte_labels: strings of the 256 values of the byte (STATUS_BYTE_LABELS or MODE_LABELS)
+    :param flag_byte_hex: flag byte in hex
+    :return: string of the flags of the byte
+    :raises ValueError: the hex code is not a byte value
+    """
+
+    flag_byte = int(flag_byte_hex, base=16)
+    if not 0 <= flag_byte < len(flag_byte_labels):
+        raise ValueError(f"Flag byte {flag_byte_hex!r} out of range 00 to {len(flag_byte_labels) - 1:02x}")
+    return flag_byte_labels[flag_byte]
+
+
+def decode_error_word(error_word):
+    """
+    Decode the error word of the status response
+    :param error_word: error word as int
+    :return: error word (raw integer mask) and the errors as string
+    """
+
+    if not error_word:
+        return error_word, "No Errors"
+    return error_word, " | ".join(get_flags_of_flag_word(error_word, ERROR_FLAG_TABLES))
+
+
+def decode_warning_word(warning_word):
+    """
+    Decode the warning word of the status response
+    :param warning_word: warning word as int
+    :return: warning word (raw integer mask) and the warnings as string
+    """
+
+    if not warning_word:
+        return warning_word, "No Warnings"
+    return warning_word, " | ".join(get_flags_of_flag_word(warning_word, WARNING_FLAG_TABLES))
+
 
 def twos_complement_hex_to_signed_int(hex_string, number_of_bits):
     """
@@ -60,60 +276,6 @@ def get_errors_and_warnings_from_status_response(status_response):
     :param status_response: Status response
     :return:
     """
-    # List to store the errors
-    errors_in_response = []
-    # List to store the warnings
-    warnings_in_response = []
-    # List to store the errors and warnings
-    errors_and_warnings = []
-
-    # Dictionary (key:value) with errors
-    error_dict = {0: "ERROR_FLASH_CHECK",
-                  1: "ERROR_EEPROM_CHECK",
-                  2: "ERROR_RAM_CHECK",
-                  3: "ERROR_BOOT_CHECK",
-                  4: "ERROR_WRONG_VIN_VOLTAGE",
-                  5: "ERROR_VLD_LEVEL_CHECK",
-                  6: "ERROR_SYNCRONISATION_CHECK",
-                  7: "ERROR_COMPARATOR_CHECK",
-                  8: "ERROR_VIN_OUT_OF_RANGE",
-                  9: "ERROR_TWI_ERROR",
-                  10: "ERROR_UART_ERROR",
-                  11: "ERROR_HEARBEAT_MISSING",
-                  12: "ERROR_MISSING_CALIB",
-                  13: "ERROR_OVER_CURRENT",
-                  14: "ERROR_UNDER_CURRENT",
-                  15: "ERROR_LD_NTC_PROBLEM",
-                  16: "ERROR_LD_OVERTEMP",
-                  17: "ERROR_LD_UNDERTEMP",
-                  18: "ERROR_MEMORY_FAIL",
-                  19: "ERROR_EXTRAPOLATION_RANGE",
-                  20: "ERROR_P_SET",
-                  21: "ERROR_CALIBRATION_TABLE",
-                  22: "ERROR_TABLE_INDICES_FAIL",
-                  23: "ERROR_OPERATION_CURRENT_FAIL",
-                  24: "ERROR_INTERPOLATION_TABLE",
-                  25: "ERROR_SMCU_CALIBRATION",
-                  26: "ERROR_PERIPHERAL_CHECK",
-                  27: "ERROR_CMD_EXECUTION",
-                  28: "ERROR_BYPASS_TRANSISTOR",
-                  29: "ERROR_WRONG_LASER_HEAD"}
-
-    # Dictionary (key:value) with warnings
-    warning_dict = {0: "WARNING_LD_NTC_PROBLEM",
-                    1: "WARNING_LD_OVERTEMP",
-                    2: "WARNING_LD_UNDERTEMP",
-                    3: "WARNING_LD_SMALL_POWER_FACTOR",
-                    4: "WARNING_LD_BIG_POWER_FACTOR",
-                    5: "WARNING_CANT_SET_POWER_FACTOR",
-                    6: "WARNING_WRONG_COMMAND",
-                    7: "WARNING_COMMAND_VALUE_OOR",
-                    8: "WARNING_ACCESS_VIOLATION",
-                    9: "WARNING_CAN_NOT_SET_RUNNING_MODE",
-                    10: "WARNING_OVER_24_HOURS_ONTIME",
-                    11: "WARNING_EXTRAPOLATION",
-                    12: "WARNING_CAL_T_MIN_MAX_LIMIT",
-                    13: "WARNING_END_OF_LIFE"}
 
     # Set the return value
     errors_and_warnings_as_string = "CRC Error"
@@ -126,78 +288,15 @@ def get_errors_and_warnings_from_status_response(status_response):
         # Check if valid status response
         if len(status_response) > 6:
 
-            # Get the error code from the status response
+            # Get the error and warning code from the status response (an empty code has no errors or warnings)
             error_code = status_response[4:12]
-
-            # Check if no errors (protect against empty lines)
-            if str(error_code).count('0') == len(error_code):
-
-                errors_in_response.append("No Errors")
-
-            else:
-
-                # Convert the error code from hex to int
-                error_code_int = int(error_code, base=16)
-
-                # Convert from int to bin then str
-                error_code_bin_string = str(bin(error_code_int))
-
-                # Convert each single character as element of a list
-                error_code_bin_string_list = []
-                for character in error_code_bin_string:
-                    error_code_bin_string_list.append(character)
-
-                # remove the preceding "0b"
-                error_code_bin_string_list = error_code_bin_string_list[2:]
-
-                # Reverse the order of the elements in the list before interation
-                error_code_bin_string_list.reverse()
-
-                # Search the high bits and get the corresponding errors from the dict
-                for error_key, error_bit_str in enumerate(error_code_bin_string_list):
-                    if error_bit_str == "1":
-                        errors_in_response.append(error_dict.get(error_key))
-
-            errors_in_response_as_string = " | ".join(errors_in_response)
-            # Add the error list to the error and warnings list
-            errors_and_warnings.append(errors_in_response_as_string)
-
-            # Get the warning code from the status response
             warning_code = status_response[12:20]
-
-            # Check if no warnings
-            if warning_code.count('0') == len(warning_code):
-                warnings_in_response.append("No Warnings")
-
-            else:
-                # Convert the warning code from hex to int
-                warning_code_int = int(warning_code, base=16)
-
-                # Convert from int to bin then str
-                warning_code_bin_string = str(bin(warning_code_int))
-
-                # Convert each single character as element of a list
-                warning_code_bin_string_list = []
-                for character in warning_code_bin_string:
-                    warning_code_bin_string_list.append(character)
-
-                # remove the preceding "0b"
-                warning_code_bin_string_list = warning_code_bin_string_list[2:]
-
-                # Reverse the order of the elements in the list before interation
-                warning_code_bin_string_list.reverse()
-
-                # Search the high bits and get the corresponding warnings from the dict
-                for warning_key, warning_bit_str in enumerate(warning_code_bin_string_list):
-                    if warning_bit_str == "1":
-                        warnings_in_response.append(warning_dict.get(warning_key))
-
-            warnings_in_response_as_string = " | ".join(warnings_in_response)
-            # Add the warning to the error and warnings list
-            errors_and_warnings.append(warnings_in_response_as_string)
+            error_word = int(error_code, base=16) if error_code else 0
+            warning_word = int(warning_code, base=16) if warning_code else 0
 
             # Errors and Warning as string
-            errors_and_warnings_as_string = " | ".join(errors_and_warnings)
+            errors_and_warnings_as_string = decode_error_word(error_word)[1] + " | " + \
+                decode_warning_word(warning_word)[1]
 
     # Return errors and warnings
     return errors_and_warnings_as_string
@@ -238,95 +337,11 @@ def interpret_get_smcu_status(smcu_status):
     """
     This function interprets the hex code of GET_SMCU_STATUS
     :param smcu_status: Status of the SMCU in Hex code
-    :return:
+    :return: single string line with the interpretation results
     """
 
-    # Parameter to calculate the ADC LD_TEMP
-    u_ref = 2.06  # [V] Reference voltage
-    dac_max = 65535  # [-] DAC max value for 16 bits (2^16 = 65535)
-
-    # List to store the interpretation of each single blocks
-    smcu_status_interpreted_as_list = []
-
-    # Define some dictionaries
-
-    # Dictionary (key:value) with start up states
-    start_up_states_dict = {"10": "STARTUP_TESTS_ONGOING",
-                            "20": "STARTUP_TESTS_FINISHED",
-                            "30": "STARTUP_COMP_TEST_FINISHED",
-                            "40": "STARTUP_COMP_READY"}
-
-    # Dictionary (key:value) with operation state
-    operation_states_dict = {"00": "OP_STAT_STARTUP_IDLE",
-                             "01": "OP_STAT_STARTUP_USERCOMM_SELECTED",
-                             "02": "OP_STAT_STARTUP_WAIT_FOR_SMCU",
-                             "03": "OP_STAT_STARTUP_TEST_FIRST_OPV_VALUE",
-                             "04": "OP_STAT_STARTUP_TEST_SECOND_OPV_VALUE",
-                             "10": "OP_STAT_STANDBY",
-                             "20": "OP_STAT_READY_OPERATION",
-                             "28": "OP_STAT_USER_SERVICE",
-                             "40": "OP_STAT_FACTORY_SERVICE",
-                             "60": "OP_STAT_LD_TEST",
-                             "80": "OP_STAT_FAILURE"}
-
-    # Set the return value
-    smcu_status_interpreted_as_string = "CRC Error"
-
-    if "\x00" in smcu_status:
-        # Set the return value to wrong Hex value
-        smcu_status_interpreted_as_string = "Wrong Hex value"
-
-    else:
-        # Check if valid SMCU status
-        if len(smcu_status) > 6:
-
-            # Get code values
-
-            # Get the start-up state in Hex
-            start_up_state_hex = smcu_status[2:4]
-            # Get the corresponding string value for the start-up state
-            start_up_state_string = start_up_states_dict.get(start_up_state_hex)
-            # Add to the interpretation list
-            smcu_status_interpreted_as_list.append(start_up_state_string)
-            # print(start_up_state_hex)
-
-            # Get the operation states in hex
-            operation_state_hex = smcu_status[4:6]
-            # Convert to int
-            # operation_state_int = int(operation_state_hex, base=16)
-            # Get the corresponding operation state as string from the dictionary
-            operation_state_string = operation_states_dict.get(operation_state_hex, str(operation_state_hex)
-                                                               + ": Not existing")
-            # Add to the interpretation list
-            smcu_status_interpreted_as_list.append(operation_state_string)
-            # print(operation_state_hex)
-
-            # Get the ld_temp1 in Hex
-            ntc_temp_hex = smcu_status[6:10]
-            # Convert the ld_temp1 in decimal
-            ntc_temp_decimal = int(ntc_temp_hex, base=16)
-            # Calculate the adc LD_TEMP1 in V
-            dac_ld_temp = u_ref * (ntc_temp_decimal / dac_max)
-            # make the string line for the list with interpretation
-            dac_ld_temp_string = f"{round(dac_ld_temp, 2)} V"
-            # Add to the interpretation list
-            smcu_status_interpreted_as_list.append(str(dac_ld_temp_string))
-
-            # Get the si temp in hex
-            si_temp_hex = smcu_status[10:14]
-            # convert the si temp to decimal
-            si_temp_decimal = twos_complement_hex_to_signed_int(si_temp_hex, 16) / 100
-            # make the string line for the list with interpretation
-            si_temp_decimal_string = f"{round(si_temp_decimal, 2)} degC"
-            # Add to the interpretation list
-            smcu_status_interpreted_as_list.append(str(si_temp_decimal_string))
-            # print(smcu_status_interpreted_as_list)
-
-            # Join the elements of the interpretation list in a single string line
-            smcu_status_interpreted_as_string = " | ".join(smcu_status_interpreted_as_list)
-
-    # Return a single string line with the interpretation results
-    return smcu_status_interpreted_as_string
+    # ADC LD_TEMP with the constants of the default hardware variant (see calibrate_adc_ld_temp)
+    return interpret_get_smcu_status_calibrated(smcu_status, get_calibration_tables(DEFAULT_CALIBRATION_PROFILE))
 
 
 def convert_temp_adc_in_deg(temp_adc):
@@ -399,24 +414,9 @@ def convert_status_byte(status_resp):
     :param status_resp: Response with the status hex code
     :return: A String corresponding to the hex Code
     """
-    # Lists to store the interpretation of each single blocks
-    status_byte_response = []
-    status_byte_as_bin_string_list = []
-
-    # Dictionary (key:value) with Status Byte
-    status_dict = {0: "STATUS_BUSY",
-                   1: "STATUS_CRC_ERROR",
-                   2: "STATUS_PASSWORD_ERROR",
-                   3: "STATUS_TELEGRAM_ERROR",
-                   4: "STATUS_WARNING",
-                   5: "STATUS_ERROR",
-                   6: "STATUS_PASSWORD_SET",
-                   7: "STATUS_NO_DATA"}
 
     # Get the status byte from the status response
     status_byte = status_resp[:2]
-    # print(type(status_byte))
-    # print(status_byte)
 
     # Set the return value
     status_byte_as_string = ""
@@ -431,30 +431,8 @@ def convert_status_byte(status_resp):
             return "No Value"
         else:
             if status_byte != "00":
-
-                status_byte_as_int = int(status_byte, base=16)
-                # print(status_byte_as_int)
-
-                status_bytes_as_bin_string = str(bin(status_byte_as_int))
-
-                # Convert each single character of status_byte_as_string as element of a list
-                for character in status_bytes_as_bin_string:
-                    status_byte_as_bin_string_list.append(character)
-
-                # Reverse the order of the elements in the list before interation
-                status_byte_as_bin_string_list.reverse()
-                # print("status byte as bin list reversed:", status_byte_as_bin_string_list)
-
-                # remove "ob" at the End with 2 times pop
-                status_byte_as_bin_string_list.pop()
-                status_byte_as_bin_string_list.pop()
-
-                # Search the high bits and get the corresponding status from the dict
-                for status_key, status_bit_str in enumerate(status_byte_as_bin_string_list):
-                    if status_bit_str == "1":
-                        status_byte_response.append(status_dict.get(int(status_key)))
-
-                status_byte_as_string = " | ".join(status_byte_response)
+                # Get the corresponding status of the high bits from the table
+                status_byte_as_string = get_flag_byte_label(STATUS_BYTE_LABELS, status_byte)
 
             else:
                 status_byte_as_string = "STATUS_OK"
@@ -469,22 +447,6 @@ def interpret_get_mode(mode):
     :return:
     """
 
-    # List to store the interpretation of each single blocks
-    mode_as_bin_string_list = []
-    mode_response = []
-
-    # Define some dictionaries
-
-    # Dictionary (key:value) with operation state
-    mode_dict = {0: "external_dig_modulation_on",
-                 1: "future_use_1",
-                 2: "extern_analog_modulation_on",
-                 3: "OVTMP_shutdown_on",
-                 4: "fail_out_signalling_on",
-                 5: "fail_in_GPIO_on",
-                 6: "future_use_2",
-                 7: "future_use_3"}
-
     # Set the return value
     mode_as_string = "CRC Error"
 
@@ -498,28 +460,8 @@ def interpret_get_mode(mode):
 
             # Get the mode in Hex
             mode_hex = mode[2:4]
-            # Get the mode in dezimal
-            mode_as_int = int(mode_hex, base=16)
-            # Get the mode as string
-            mode_as_bin_string = str(bin(mode_as_int))
-
-            # Convert each single character of mode_as_string as element of a list
-            for character in mode_as_bin_string:
-                mode_as_bin_string_list.append(character)
-
-            # Reverse the order of the elements in the list before interation
-            mode_as_bin_string_list.reverse()
-
-            # remove "ob" at the End with 2 times pop
-            mode_as_bin_string_list.pop()
-            mode_as_bin_string_list.pop()
-
-            # Search the high bits and get the corresponding status from the dict
-            for mode_key, mode_str in enumerate(mode_as_bin_string_list):
-                if mode_str == "1":
-                    mode_response.append(mode_dict.get(int(mode_key)))
-
-            mode_as_string = " | ".join(mode_response)
+            # Get the corresponding modes of the high bits from the table
+            mode_as_string = get_flag_byte_label(MODE_LABELS, mode_hex)
 
     return mode_as_string
 
@@ -537,18 +479,6 @@ def interpret_get_config_mode(config_mode):
     # List to store the interpretation of each single blocks
     config_mode_as_list = []
 
-    # Dictionary (key:value) with operation mode
-    config_mode_dict = {0: "MODULATION_FAIL_OUT",
-                        1: "MODULATION_FAIL_IN",
-                        2: "RS232_COM_DIG_IN",
-                        3: "TWI_COM_DIG_IN",
-                        4: "RS232_COM_FAIL_IN",
-                        5: "TWI_COM_FAIL_IN",
-                        6: "RS232_COM_FAIL_OUT",
-                        7: "TWI_COM_FAIL_OUT",
-                        8: "ZX20S_AT_CONFIG",
-                        9: "ZXS_OEM_CONFIG"}
-
     # Check if the character NUL = \x00 is contained in the Hex value
     if "\x00" in config_mode:
         # Set the return value to wrong Hex value
@@ -563,7 +493,7 @@ def interpret_get_config_mode(config_mode):
             # Convert to int
             config_mode_as_int = int(config_mode_hex, base=16)
             # Get the corresponding operation config_mode as string from the dictionary
-            config_mode_string = config_mode_dict.get(config_mode_as_int)
+            config_mode_string = CONFIG_MODE_DICT.get(config_mode_as_int)
             # Add to the interpretation list
             config_mode_as_list.append(config_mode_string)
             # Join the elements of the interpretation list in a single string line
@@ -644,38 +574,11 @@ def convert_current_dac_adc(current_dac):
     """
     Convert the Temperature of the GET_CURRENT_DAC_ADC from hex in deg
     :param current_dac: current hex code
-    :return: NONE
+    :return: current DAC in mA as string
     """
 
-    # Parameter to calculate the current DAC
-    u_ref = 3.3  # [V] Reference voltage
-    dac_max = 4096  # [-] DAC max value for 12 bits (2^12 = 4096)
-    r_shunt = 4.8   # [Ohm] Shunt resistor (2,4  + 2,4)
-    xr_opv = (3.3 / 8)  # 3,3k / 8k
-    # adc_temp_as_list = []
-
-    # Set the return value
-    current_dac_as_string = "CRC Error"
-
-    # Check if the Hex contain NUL = \x00
-    if "\x00" in current_dac:
-        # Set the return value to wrong Hex value
-        current_dac_adc_as_string = "Wrong Hex value"
-
-    else:
-        if len(current_dac) > 6:
-
-            # Get the current dac hex value
-            current_dac_value = current_dac[2:6]
-            # Convert the current dac from hex to deg
-            current_dac_as_int = int(current_dac_value, 16)
-            dac_temp2 = ((u_ref * xr_opv * (current_dac_as_int / dac_max)) / r_shunt) * 1000
-            # make the string line for with the converted value [mA]
-            current_dac_as_string = str(round(dac_temp2, 2))
-            # print(current_dac_as_string)
-
-    # Return the string line
-    return current_dac_as_string
+    # Current DAC with the constants of the default hardware variant (see calibrate_current_dac)
+    return convert_current_dac_calibrated(current_dac, get_calibration_tables(DEFAULT_CALIBRATION_PROFILE))
 
 
 def convert_power_out_abs(power_out_abs):
@@ -871,281 +774,3617 @@ def convert_comp_ref(comp_ref):
     :return: comp_ref in mV
     """
 
-    # Parameter comp REF voltage set by the SMCU current in mV in GET_COMP_REF
-    u_ref = 2.06  # [V] Reference voltage
-    dac_max = 65535  # [-] DAC max value for 16 bits (2^16 = 65535)
+    # Comp REF voltage with the constants of the default hardware variant (see calibrate_comp_ref)
+    return convert_comp_ref_calibrated(comp_ref, get_calibration_tables(DEFAULT_CALIBRATION_PROFILE))
+
+
+def convert_current_adc(current_adc):
+    """
+    Convert the Temperature of the GET_CURRENT_DAC_ADC from hex in deg
+    :param current_adc: current hex code
+    :return: current ADC in mA as string
+    """
+
+    # Current ADC with the constants of the default hardware variant (see calibrate_current_adc)
+    return convert_current_adc_calibrated(current_adc, get_calibration_tables(DEFAULT_CALIBRATION_PROFILE))
 
-    if len(comp_ref) > 6:
 
-        # Get the comp REF voltage hex value
-        comp_ref_hex = comp_ref[2:6]
-        # Convert the comp REF voltage in decimal
-        comp_ref_decimal = int(comp_ref_hex, base=16) / 100
-        # Calculate the comp REF voltage in mV
-        comp_ref_value = u_ref * (comp_ref_decimal / dac_max) * 1000
-        # make the string line for the list with interpretation
-        comp_ref_string = f"{round(comp_ref_value, 2)} mV"
+# Calibration of the analog values of one hardware variant (laser head type): reference voltage of the SMCU
+# ADC/DAC [V], max value of the 16 bits ADC/DAC [-], reference voltage of the current DAC [V], max value of the
+# 12 bits current DAC [-], shunt resistor [Ohm] and ratio of the OPV resistors [-]
+CalibrationProfile = collections.namedtuple("CalibrationProfile", ["name", "u_ref_smcu", "adc_max", "u_ref_dac",
+                                                                   "dac_max", "r_shunt", "xr_opv"])
 
-        # Return the string line
-        return comp_ref_string
-    else:
+# Constants of the legacy conversions
+DEFAULT_CALIBRATION_PROFILE = CalibrationProfile(name="default",
+                                                 u_ref_smcu=2.06,  # [V] Reference voltage
+                                                 adc_max=65535,  # [-] ADC/DAC max value for 16 bits (2^16 = 65535)
+                                                 u_ref_dac=3.3,  # [V] Reference voltage of the current DAC
+                                                 dac_max=4096,  # [-] DAC max value for 12 bits (2^12 = 4096)
+                                                 r_shunt=4.8,  # [Ohm] Shunt resistor (2,4  + 2,4)
+                                                 xr_opv=(3.3 / 8))  # 3,3k / 8k
+
+# Profiles of a calibration file: name -> CalibrationProfile and device serial -> name of its profile
+CalibrationProfiles = collections.namedtuple("CalibrationProfiles", ["profiles", "device_profiles"])
+
+# Tables of the calibrated values of every 16 bits raw value (index: raw value) of a profile: current DAC [mA],
+# current ADC [mA], comp REF voltage [mV] and ADC LD_TEMP [V]
+CalibrationTables = collections.namedtuple("CalibrationTables", ["calibration_profile", "current_dac", "current_adc",
+                                                                 "comp_ref", "adc_ld_temp"])
+
+# Number of entries of the calibration tables: the fields are 4 hex digits, also the one of the 12 bits DAC
+CALIBRATION_TABLE_SIZE = 0x10000
+
+
+def calibrate_current_dac(calibration_profile, current_dac_as_int):
+    """
+    Current DAC of GET_CURRENT_DAC_ADC in mA
+    :param calibration_profile: CalibrationProfile
+    :param current_dac_as_int: raw value
+    :return: current in mA
+    """
+
+    return ((calibration_profile.u_ref_dac * calibration_profile.xr_opv
+             * (current_dac_as_int / calibration_profile.dac_max)) / calibration_profile.r_shunt) * 1000
+
+
+def calibrate_current_adc(calibration_profile, current_adc_as_int):
+    """
+    Current ADC of GET_CURRENT_DAC_ADC in mA
+    :param calibration_profile: CalibrationProfile
+    :param current_adc_as_int: raw value
+    :return: current in mA
+    """
+
+    return (calibration_profile.u_ref_smcu * (current_adc_as_int / calibration_profile.adc_max)
+            / calibration_profile.r_shunt) * 1000
+
+
+def calibrate_comp_ref(calibration_profile, comp_ref_as_int):
+    """
+    Comp REF voltage of GET_COMP_REF in mV (the raw value is in 1/100)
+    :param calibration_profile: CalibrationProfile
+    :param comp_ref_as_int: raw value
+    :return: voltage in mV
+    """
+
+    return calibration_profile.u_ref_smcu * ((comp_ref_as_int / 100) / calibration_profile.adc_max) * 1000
+
+
+def calibrate_adc_ld_temp(calibration_profile, ntc_temp_as_int):
+    """
+    ADC LD_TEMP of GET_SMCU_STATUS in V
+    :param calibration_profile: CalibrationProfile
+    :param ntc_temp_as_int: raw value
+    :return: voltage in V
+    """
+
+    return calibration_profile.u_ref_smcu * (ntc_temp_as_int / calibration_profile.adc_max)
+
+
+@functools.lru_cache(maxsize=None)
+def get_calibration_tables(calibration_profile=DEFAULT_CALIBRATION_PROFILE):
+    """
+    Precompute the calibrated value of every raw value once per profile, so that a conversion is a single index
+    :param calibration_profile: CalibrationProfile
+    :return: CalibrationTables
+    """
+
+    raw_values = range(CALIBRATION_TABLE_SIZE)
+    return CalibrationTables(calibration_profile,
+                             *(tuple(calibrate(calibration_profile, raw_value) for raw_value in raw_values)
+                               for calibrate in (calibrate_current_dac, calibrate_current_adc, calibrate_comp_ref,
+                                                 calibrate_adc_ld_temp)))
+
+
+def lookup_calibration_table(calibration_table, raw_value, calibrate, calibration_profile):
+    """
+    Get the calibrated value of a raw value from its table
+    :param calibration_table: table of the calibrated values (see CalibrationTables)
+    :param raw_value: raw value parsed from the hex code
+    :param calibrate: calculation of the table, used for the values outside of it (int() accepts e.g. "-fff")
+    :param calibration_profile: CalibrationProfile of the table
+    :return: calibrated value
+    """
+
+    if 0 <= raw_value < CALIBRATION_TABLE_SIZE:
+        return calibration_table[raw_value]
+    return calibrate(calibration_profile, raw_value)
+
+
+def load_calibration_profiles(calibration_file_path):
+    """
+    Load the calibration profiles of the hardware variants from a JSON file, e.g.
+    {"profiles": {"ZX-405": {"u_ref_smcu": 2.048, "r_shunt": 5.0}}, "devices": {"2300003506": "ZX-405"}}
+    The values missing in a profile are the ones of DEFAULT_CALIBRATION_PROFILE.
+    :param calibration_file_path: path of the calibration file
+    :return: CalibrationProfiles
+    """
+
+    with open(calibration_file_path, "r") as calibration_file:
+        calibration = json.load(calibration_file)
+
+    profiles = {}
+    for profile_name, profile_values in calibration.get("profiles", {}).items():
+        unknown_values = set(profile_values) - set(CalibrationProfile._fields[1:])
+        if unknown_values:
+            raise ValueError(f"Unknown calibration values {', '.join(sorted(unknown_values))} in the profile "
+                             f"{profile_name}, possible values: {', '.join(CalibrationProfile._fields[1:])}")
+        profiles[profile_name] = DEFAULT_CALIBRATION_PROFILE._replace(name=profile_name, **profile_values)
+
+    device_profiles = calibration.get("devices", {})
+    for device, profile_name in device_profiles.items():
+        if profile_name not in profiles:
+            raise ValueError(f"Unknown calibration profile {profile_name} of the device {device}")
+
+    return CalibrationProfiles(profiles, device_profiles)
+
+
+def get_calibration_profile(calibration_profiles, hex_results_file_path):
+    """
+    Get the calibration profile of the device of a file with results in Hex (serial in the name of the file)
+    :param calibration_profiles: CalibrationProfiles (see load_calibration_profiles)
+    :param hex_results_file_path: path of the file with results in Hex
+    :return: profile of the device, else the profile "default" of the file, else DEFAULT_CALIBRATION_PROFILE
+    """
+
+    file_name_match = RESULTS_FILE_NAME_PATTERN.match(os.path.basename(hex_results_file_path))
+    if file_name_match is not None and file_name_match.group("serial") in calibration_profiles.device_profiles:
+        return calibration_profiles.profiles[calibration_profiles.device_profiles[file_name_match.group("serial")]]
+    return calibration_profiles.profiles.get(DEFAULT_CALIBRATION_PROFILE.name, DEFAULT_CALIBRATION_PROFILE)
+
+
+def convert_current_dac_calibrated(current_dac, calibration_tables):
+    """
+    Convert the current DAC of GET_CURRENT_DAC_ADC in mA with the calibration tables of a profile
+    :param current_dac: current hex code
+    :param calibration_tables: CalibrationTables (see get_calibration_tables)
+    :return: current DAC in mA as string
+    """
+
+    # The legacy conversion returns "CRC Error" also for hex values with NUL
+    if "\x00" in current_dac or len(current_dac) <= 6:
         return "CRC Error"
 
+    current_dac_value = lookup_calibration_table(calibration_tables.current_dac, int(current_dac[2:6], 16),
+                                                 calibrate_current_dac, calibration_tables.calibration_profile)
+    return str(round(current_dac_value, 2))
 
-def convert_current_adc(current_adc):
+
+def convert_current_adc_calibrated(current_adc, calibration_tables):
     """
-    Convert the Temperature of the GET_CURRENT_DAC_ADC from hex in deg
+    Convert the current ADC of GET_CURRENT_DAC_ADC in mA with the calibration tables of a profile
     :param current_adc: current hex code
-    :return: NONE
+    :param calibration_tables: CalibrationTables (see get_calibration_tables)
+    :return: current ADC in mA as string
     """
 
-    # Parameter to calculate the ADC LD_TEMP
-    u_ref = 2.06  # [V] Reference voltage
-    adc_max = 65535  # [-] adc max value for 16 bits (2^16 = 65535)
-    r_shunt = 4.8  # [Ohm] Shunt resistor (2,4  + 2,4)
+    # The legacy conversion returns "CRC Error" also for hex values with NUL
+    if "\x00" in current_adc or len(current_adc) <= 6:
+        return "CRC Error"
 
-    # adc_temp_as_list = []
+    current_adc_value = lookup_calibration_table(calibration_tables.current_adc, int(current_adc[6:10], base=16),
+                                                 calibrate_current_adc, calibration_tables.calibration_profile)
+    return str(round(current_adc_value, 2))
 
-    # Set the return value
-    current_adc_as_string = "CRC Error"
 
-    # Check if the Hex contain NUL = \x00
-    if "\x00" in current_adc:
-        # Set the return value to wrong Hex value
-        current_dac_adc_as_string = "Wrong Hex value"
+def convert_comp_ref_calibrated(comp_ref, calibration_tables):
+    """
+    Convert the comp REF voltage of GET_COMP_REF in mV with the calibration tables of a profile
+    :param comp_ref: voltage hex code
+    :param calibration_tables: CalibrationTables (see get_calibration_tables)
+    :return: comp_ref in mV
+    """
 
-    else:
-        if len(current_adc) > 6:
+    if len(comp_ref) <= 6:
+        return "CRC Error"
 
-            # Get the adc temp hex value
-            adc_temp_hex = current_adc[6:10]
-            # Convert the adc temp in decimal
-            adc_temp_decimal = int(adc_temp_hex, base=16)
-            # Calculate the adc LD_TEMP2 in mV
-            adc_temp2 = (u_ref * (adc_temp_decimal / adc_max) / r_shunt) * 1000
-            # make the string line for the list with interpretation [mA]
-            current_adc_as_string = str(round(adc_temp2, 2))
+    comp_ref_value = lookup_calibration_table(calibration_tables.comp_ref, int(comp_ref[2:6], base=16),
+                                              calibrate_comp_ref, calibration_tables.calibration_profile)
+    return f"{round(comp_ref_value, 2)} mV"
 
-    # Return the string line
-    return current_adc_as_string
 
+def interpret_get_smcu_status_calibrated(smcu_status, calibration_tables):
+    """
+    Interpret the hex code of GET_SMCU_STATUS with the calibration tables of a profile
+    :param smcu_status: Status of the SMCU in Hex code
+    :param calibration_tables: CalibrationTables (see get_calibration_tables)
+    :return: single string line with the interpretation results
+    """
+
+    if "\x00" in smcu_status:
+        return "Wrong Hex value"
+    if len(smcu_status) <= 6:
+        return "CRC Error"
+
+    # Blocks of the interpretation: start-up state, operation state, ADC LD_TEMP and Si temp
+    operation_state_hex = smcu_status[4:6]
+    adc_ld_temp = lookup_calibration_table(calibration_tables.adc_ld_temp, int(smcu_status[6:10], base=16),
+                                           calibrate_adc_ld_temp, calibration_tables.calibration_profile)
+    si_temp_decimal = twos_complement_hex_to_signed_int(smcu_status[10:14], 16) / 100
 
-def zx_interpret_results(hex_results_file_path):
+    return " | ".join([START_UP_STATES_DICT.get(smcu_status[2:4]),
+                       OPERATION_STATES_DICT.get(operation_state_hex, str(operation_state_hex) + ": Not existing"),
+                       f"{round(adc_ld_temp, 2)} V",
+                       f"{round(si_temp_decimal, 2)} degC"])
+
+
+def parse_complete_hex_field(hex_code, start, stop, reject_nul=True):
     """
-    Convert some columns of the test results from hex in clear text
-    :param hex_results_file_path: path of the file with results in Hex
-    :return: NONE
+    Get a field of a hex code as integer if the telegram is complete and the field has only hex digits
+    :param hex_code: hex code of the telegram
+    :param start: index of the first hex digit of the field
+    :param stop: index after the last hex digit of the field
+    :param reject_nul: True if a NUL anywhere in the hex code makes the telegram invalid (legacy "Wrong Hex value")
+    :return: field as integer, None if the telegram is too short, incomplete or wrong
     """
 
-    # Open the file with Hex results in read mode
-    hex_results_file = open(hex_results_file_path, "r")
+    # Get the hex digits of the field
+    field_hex = hex_code[start:stop]
 
-    # Create the name of the file that will contain additional columns with results in clear text
-    interpreted_results_file_path = hex_results_file_path[:-4] + "_converter.csv"
+    # Only complete telegrams (legacy "CRC Error" up to 6 characters) with ASCII hex digits, int() would also accept
+    # a "0x" prefix that the legacy conversions of the single bytes reject
+    if len(hex_code) <= 6 or len(field_hex) != stop - start or not (field_hex.isascii() and field_hex.isalnum()) \
+            or "x" in field_hex or "X" in field_hex or (reject_nul and "\x00" in hex_code):
+        return None
 
-    # Open the file that will contain additional columns with results in clear text in write mode
-    interpreted_results_file = open(interpreted_results_file_path, "w")
-
-    # Initialization indexes of column
-    get_power_out_abs_index = 0
-    get_power_val_in_perc_index = 0
-    get_ld_lifetime_index = 0
-    get_pd_value_index = 0
-    get_module_total_ontime_index = 0
-    get_cal_laser_index = 0
-    get_comp_ref_index = 0
-    get_fw_version_index = 0
-    get_temp_adc_index = 0
-
-    # Navigate through lines of the file with the results in Hex
-    for counter, hex_results_line in enumerate(hex_results_file.readlines()):
-
-        # check if first line
-        if counter == 0:
-
-            # Get the indexes of the columns
-            header_hex_results_line_as_list = hex_results_line.strip().split(",")
-
-            # Indexes of column
-            get_power_out_abs_index = header_hex_results_line_as_list.index("GET_POWER_OUT_ABS")
-            get_power_val_in_perc_index = header_hex_results_line_as_list.index("GET_POWER_VAL_IN_PERC")
-            get_ld_lifetime_index = header_hex_results_line_as_list.index("GET_LD_LIFETIME")
-            get_pd_value_index = header_hex_results_line_as_list.index("GET_PD_VALUE")
-            get_module_total_ontime_index = header_hex_results_line_as_list.index("GET_MODULE_TOTAL_ONTIME")
-            get_cal_laser_index = header_hex_results_line_as_list.index("GET_CAL_LASER")
-            get_comp_ref_index = header_hex_results_line_as_list.index("GET_COMP_REF")
-            get_fw_version_index = header_hex_results_line_as_list.index("GET_FW_VERSION")
-            get_temp_adc_index = header_hex_results_line_as_list.index("GET_TEMP_ADC")
-
-            # rewrite the header in the file with the titles of the new columns
-            # and the new line character
-            interpreted_results_file.write(hex_results_line.strip() + ",LD_TEMP_IN_DEG,STATUS_ERRORS_WARNING,"
-                                                                      "LASER_ON_OR_OFF,SMCU_STATUS,TEMP_ADC,CURRENT,"
-                                                                      "STATUS_BYTE,MODE,CONFIG_MODE,"
-                                                                      "GET_CURRENT_DAC_ADC,GET_POWER_OUT_ABS,"
-                                                                      "POWER_VAL_IN_PERC,LD_LIFETIME,GET_PD_VALUE,"
-                                                                      "GET_MODULE_TOTAL_ONTIME,GET_CAL_LASER,"
-                                                                      "GET_COMP_REF,GET_FW_VERSION,"
-                                                                      "GET_CURRENT_ADC\n")
-
-        else:  # Other lines
-            # View the read line
-            # print(hex_results_line)
+    try:
+        return int(field_hex, base=16)
+    except ValueError:
+        return None
 
-            # Remove the new line ("\n") at the end of the line
-            hex_results_line_strip = hex_results_line.strip()
 
-            # Split at the comma to get each column element in the list
-            hex_results_line_split = hex_results_line_strip.split(",")
-            # View the split line
-            # print(hex_results_line_split)
-            # print(len(hex_results_line_split))
-
-            """ Interpretation of GET_LD_TEMP """
-            # Get the ld temp hex code
-            ld_tem_hex = hex_results_line_split[7]
-            # Convert the ntc temp value in deg
-            temp_ntc_deg_value = convert_ld_temp_in_deg(ld_tem_hex)
-
-            """ Interpretation of GET_STATUS """
-            # Get the Status hex code
-            status_hex = hex_results_line_split[14]
-            # Convert the status
-            status_hex_converted = get_errors_and_warnings_from_status_response(status_hex)
-
-            """ Interpretation of GET_LASER_ON_OFF """
-            # Get the laser on off hex code
-            laser_on_off_hex = hex_results_line_split[8]
-            # Convert the laser status
-            laser_on_or_off = get_laser_on_or_off(laser_on_off_hex)
-
-            """ Interpretation of GET_SMCU_STATUS """
-            # Get the smcu status hex code
-            smcu_status_hex = hex_results_line_split[15]
-            # Interpret the smcu status
-            smcu_status_hex_interpreted = interpret_get_smcu_status(smcu_status_hex)
-
-            """ Interpretation of GET_TEMP_ADC """
-            # Get the temp adc hex code
-            tem_adc_hex = hex_results_line_split[get_temp_adc_index]
-            # Convert the ntc temp value in deg
-            temp_adc_deg_value = convert_temp_adc_in_deg(tem_adc_hex)
-
-            """ Interpretation of GET_CURRENT """
-            # Get the current hex code
-            current_hex = hex_results_line_split[2]
-            # Convert the current value in deg
-            current_value = convert_current(current_hex)
-
-            """ Interpretation byte of GET_STATUS """
-            # Get the Status byte hex code
-            status_byte_hex = hex_results_line_split[14]
-            # Convert the status byte
-            status_byte_converted = convert_status_byte(status_byte_hex)
-
-            """ Interpretation byte of GET_MODE """
-            # Get the mode hex code
-            mode_hex = hex_results_line_split[3]
-            # Convert the mode
-            mode_converted = interpret_get_mode(mode_hex)
-
-            """ Interpretation byte of GET_CONFIG_MODE """
-            # Get the config_mode hex code
-            config_mode_hex = hex_results_line_split[4]
-            # Convert the config_mode
-            config_mode_converted = interpret_get_config_mode(config_mode_hex)
-
-            """ Interpretation of GET_CURRENT_DAC_ADC """
-            # Get the current hex code
-            current_dac_adc_hex = hex_results_line_split[30]
-            # Convert the current value in mA
-            current_dac_adc_value = convert_current_dac_adc(current_dac_adc_hex)
-
-            """ Interpretation of GET_POWER_OUT_ABS """
-            # Get the power_out hex code
-            power_out_abs_hex = hex_results_line_split[get_power_out_abs_index]
-            # Convert the power_out value in mw
-            power_out_abs_value = convert_power_out_abs(power_out_abs_hex)
-
-            """ Interpretation of GET_POWER_VAL_IN_PERC """
-            # Get the power_val hex code
-            power_val_in_perc_hex = hex_results_line_split[get_power_val_in_perc_index]
-            # Convert the power_val value in percent
-            power_val_in_perc_value = convert_power_val_in_perc(power_val_in_perc_hex)
-
-            """ Interpretation of GET_LD_LIFETIME """
-            # Get the ld_lifetime hex code
-            ld_lifetime_hex = hex_results_line_split[get_ld_lifetime_index]
-            # Convert the ld_lifetime value in hour and minutes
-            ld_lifetime_value = convert_ld_lifetime(ld_lifetime_hex)
-
-            """ Interpretation of GET_PD_VALUE """
-            # Get the pd_value hex code
-            pd_value_hex = hex_results_line_split[get_pd_value_index]
-            # Convert the pd_value value in mA
-            pd_value_value = convert_pd_value(pd_value_hex)
-
-            """ Interpretation of GET_MODULE_TOTAL_ONTIME """
-            # Get the ontime hex code
-            ontime_hex = hex_results_line_split[get_module_total_ontime_index]
-            # Convert the ontime value in hour and minutes
-            ontime_value = convert_module_total_ontime(ontime_hex)
-
-            """ Interpretation of GET_CAL_LASER """
-            # Get the cal_laser hex code
-            cal_laser_hex = hex_results_line_split[get_cal_laser_index]
-            # Convert the output power in mW and wavelength value in nm
-            cal_laser_value = convert_cal_laser(cal_laser_hex)
-
-            """ Interpretation of GET_COMP_REF """
-            # Get the comp_ref hex code
-            comp_ref_hex = hex_results_line_split[get_comp_ref_index]
-            # Convert the comp REF voltage set by the SMCU current in mV
-            comp_ref_value = convert_comp_ref(comp_ref_hex)
-
-            """ Interpretation of GET_FW_VERSION """
-            # Get the hex code
-            fw_version_hex = hex_results_line_split[get_fw_version_index]
-            # Convert the MMCU and SMCU Firmware Version
-            fw_version_value = interpret_get_fw_version(fw_version_hex)
-
-            """ Interpretation of GET_CURRENT_ADC """
-            # Get the current hex code
-            current_adc_hex = hex_results_line_split[30]
-            # Convert the current value in mA
-            current_adc_value = convert_current_adc(current_adc_hex)
-
-            """ Update the line with additional column's elements"""
-            # Build the line with the additional columns at the end to be written in the file
-            results_line = hex_results_line_strip + "," + temp_ntc_deg_value + "," + status_hex_converted + "," \
-                           + laser_on_or_off + "," + smcu_status_hex_interpreted + "," + temp_adc_deg_value + ","\
-                           + current_value + "," + status_byte_converted + "," + mode_converted + "," \
-                           + config_mode_converted + "," + current_dac_adc_value + "," + power_out_abs_value \
-                           + "," + power_val_in_perc_value + "," + ld_lifetime_value + "," + pd_value_value + "," \
-                           + ontime_value + "," + cal_laser_value + "," + comp_ref_value + "," \
-                           + fw_version_value + "," + current_adc_value + "\n"
-
-            # Write the built line to the file with the deg lines
-            interpreted_results_file.write(results_line)
-
-    # Close the file with Hex code
-    hex_results_file.close()
-    # Close the file with additional interpreted columns
-    interpreted_results_file.close()
+def signed_int_16(unsigned_int_value):
+    """
+    Two complement of a 16 bits integer (same as twos_complement_hex_to_signed_int(hex_string, 16))
+    :param unsigned_int_value: 16 bits integer
+    :return: signed int value
+    """
 
+    return unsigned_int_value - 0x10000 if unsigned_int_value & 0x8000 else unsigned_int_value
 
-if __name__ == "__main__":
 
-    """ Call of the functions """
+class LdTemp(collections.namedtuple("LdTemp", ["raw_temp"])):
+    """
+    GET_LD_TEMP response: raw NTC temperature in 1/100 deg (two complement), str() renders the legacy string
+    """
 
-    """ Test of interpret_get_smcu_status """
-    # print(interpret_get_smcu_status("0030141f601213407f"))
+    __slots__ = ()
 
-    """ Test of convert_status_byte """
-    # print(convert_status_byte("ff0100000000000000000a1a"))
+    @property
+    def temp_in_deg(self):
+        return signed_int_16(self.raw_temp) / 100
 
-    """ Test of convert_pd_value(pd_value) """
-    # print(convert_pd_value(""))
+    def __str__(self):
+        return str(round(self.temp_in_deg, 2))
 
-    """ Test of zx_interpret_results """
-    zx_interpret_results("2300003506_TempZyklen_230727.csv")
+
+class StatusWord(collections.namedtuple("StatusWord", ["status_byte", "error_word", "warning_word"])):
+    """
+    GET_STATUS response: status byte, error word and warning word, str() renders the legacy errors and warnings
+    """
+
+    __slots__ = ()
+
+    @property
+    def errors(self):
+        # Flags of the set bits of the error word, lowest bit first
+        return get_flags_of_flag_word(self.error_word, ERROR_FLAG_TABLES)
+
+    @property
+    def warnings(self):
+        # Flags of the set bits of the warning word, lowest bit first
+        return get_flags_of_flag_word(self.warning_word, WARNING_FLAG_TABLES)
+
+    def errors_and_warnings_string(self):
+        return decode_error_word(self.error_word)[1] + " | " + decode_warning_word(self.warning_word)[1]
+
+    def status_byte_string(self):
+        return STATUS_BYTE_LABELS[self.status_byte] if self.status_byte else "STATUS_OK"
+
+    def __str__(self):
+        return self.errors_and_warnings_string()
+
+
+class SmcuStatus(collections.namedtuple("SmcuStatus", ["start_up_state", "operation_state", "raw_ntc_temp",
+                                                       "raw_si_temp", "calibration_profile"],
+                                        defaults=(DEFAULT_CALIBRATION_PROFILE,))):
+    """
+    GET_SMCU_STATUS response: start-up and operation states as hex (keys of the state dictionaries), raw ADC of
+    the LD temperature, raw Si temperature in 1/100 degC and the CalibrationProfile of the ADC, str() renders the
+    string of the conversion with the same profile
+    """
+
+    __slots__ = ()
+
+    @property
+    def adc_ld_temp_in_v(self):
+        return calibrate_adc_ld_temp(self.calibration_profile, self.raw_ntc_temp)
+
+    @property
+    def si_temp_in_deg(self):
+        return signed_int_16(self.raw_si_temp) / 100
+
+    def __str__(self):
+        return " | ".join([START_UP_STATES_DICT.get(self.start_up_state),
+                           OPERATION_STATES_DICT.get(self.operation_state, self.operation_state + ": Not existing"),
+                           f"{round(self.adc_ld_temp_in_v, 2)} V",
+                           f"{round(self.si_temp_in_deg, 2)} degC"])
+
+
+class CurrentDacAdc(collections.namedtuple("CurrentDacAdc", ["raw_current_dac", "raw_current_adc",
+                                                             "calibration_profile"],
+                                           defaults=(DEFAULT_CALIBRATION_PROFILE,))):
+    """
+    GET_CURRENT_DAC_ADC response: raw current DAC (12 bits) and ADC (16 bits) and the CalibrationProfile of the
+    currents, str() renders the current DAC of the conversion with the same profile
+    """
+
+    __slots__ = ()
+
+    @property
+    def current_dac(self):
+        return calibrate_current_dac(self.calibration_profile, self.raw_current_dac)
+
+    @property
+    def current_adc(self):
+        return calibrate_current_adc(self.calibration_profile, self.raw_current_adc)
+
+    def current_dac_string(self):
+        return str(round(self.current_dac, 2))
+
+    def current_adc_string(self):
+        return str(round(self.current_adc, 2))
+
+    def __str__(self):
+        return self.current_dac_string()
+
+
+class FwVersion(collections.namedtuple("FwVersion", ["mmcu_fw_version", "smcu_fw_version"])):
+    """
+    GET_FW_VERSION response: MMCU and SMCU versions as (major, minor, patch), str() renders the legacy string
+    """
+
+    __slots__ = ()
+
+    def __str__(self):
+        return "MMCU:  %d.%d.%d | SMCU:  %d.%d.%d" % (*self.mmcu_fw_version, *self.smcu_fw_version)
+
+
+class LifeTime(collections.namedtuple("LifeTime", ["hours", "minutes"])):
+    """
+    GET_LD_LIFETIME and GET_MODULE_TOTAL_ONTIME responses: hours and minutes, str() renders the legacy string
+    """
+
+    __slots__ = ()
+
+    @property
+    def total_minutes(self):
+        return self.hours * 60 + self.minutes
+
+    def __str__(self):
+        return f"{self.hours}h {self.minutes}min"
+
+
+class CalLaser(collections.namedtuple("CalLaser", ["raw_nominal_power", "diode_wavelength"])):
+    """
+    GET_CAL_LASER response: calibrated output power in 1/100 mW and wavelength in nm, str() renders the legacy
+    string
+    """
+
+    __slots__ = ()
+
+    @property
+    def nominal_power_in_mw(self):
+        return self.raw_nominal_power / 100
+
+    def __str__(self):
+        return f"{round(self.nominal_power_in_mw)} mw | {self.diode_wavelength} nm"
+
+
+def decode_ld_temp(ld_temp):
+    """
+    Decode the hex code of GET_LD_TEMP without rendering it
+    :param ld_temp: ld temp hex code
+    :return: LdTemp, None if the telegram is too short or wrong (see convert_ld_temp_in_deg)
+    """
+
+    raw_temp = parse_complete_hex_field(ld_temp, 2, 6)
+    return None if raw_temp is None else LdTemp(raw_temp)
+
+
+def decode_status_word(status_response):
+    """
+    Decode the status response without rendering it
+    :param status_response: Status response
+    :return: StatusWord, None if the response is short, wrong or incomplete
+    """
+
+    # Status byte, error word and warning word converted at once
+    status_word = parse_complete_hex_field(status_response, 0, 20)
+    if status_word is None:
+        return None
+    return StatusWord(status_word >> 72, (status_word >> 32) & 0xFFFFFFFF, status_word & 0xFFFFFFFF)
+
+
+def decode_smcu_status(smcu_status, calibration_profile=None):
+    """
+    Decode the hex code of GET_SMCU_STATUS without rendering it
+    :param smcu_status: Status of the SMCU in Hex code
+    :param calibration_profile: CalibrationProfile of the ADC (default: DEFAULT_CALIBRATION_PROFILE)
+    :return: SmcuStatus, None if the telegram is too short or wrong (see interpret_get_smcu_status)
+    """
+
+    # Get the LD temp ADC and the Si temp at once
+    temps = parse_complete_hex_field(smcu_status, 6, 14)
+    if temps is None:
+        return None
+    return SmcuStatus(smcu_status[2:4], smcu_status[4:6], temps >> 16, temps & 0xFFFF,
+                      calibration_profile or DEFAULT_CALIBRATION_PROFILE)
+
+
+def decode_current_dac_adc(current_dac_adc, calibration_profile=None):
+    """
+    Decode the hex code of GET_CURRENT_DAC_ADC without rendering it
+    :param current_dac_adc: current hex code
+    :param calibration_profile: CalibrationProfile of the currents (default: DEFAULT_CALIBRATION_PROFILE)
+    :return: CurrentDacAdc, None if the telegram is too short or wrong (see convert_current_dac_adc)
+    """
+
+    current_dac_adc_as_int = parse_complete_hex_field(current_dac_adc, 2, 10)
+    if current_dac_adc_as_int is None:
+        return None
+    return CurrentDacAdc(current_dac_adc_as_int >> 16, current_dac_adc_as_int & 0xFFFF,
+                         calibration_profile or DEFAULT_CALIBRATION_PROFILE)
+
+
+def decode_fw_version(fw_version):
+    """
+    Decode the hex code of GET_FW_VERSION without rendering it
+    :param fw_version: FW version hex code
+    :return: FwVersion, None if the telegram is too short or wrong (see interpret_get_fw_version)
+    """
+
+    mmcu_fw_version = parse_complete_hex_field(fw_version, 2, 8)
+    smcu_fw_version = parse_complete_hex_field(fw_version, 12, 18)
+    if mmcu_fw_version is None or smcu_fw_version is None:
+        return None
+    return FwVersion(tuple(mmcu_fw_version.to_bytes(3, "big")), tuple(smcu_fw_version.to_bytes(3, "big")))
+
+
+def decode_life_time(life_time):
+    """
+    Decode the hex code of GET_LD_LIFETIME or GET_MODULE_TOTAL_ONTIME without rendering it
+    :param life_time: lifetime or ontime hex code
+    :return: LifeTime, None if the telegram is too short or wrong (see convert_ld_lifetime)
+    """
+
+    # The legacy conversion has no NUL check: only the hours and minutes have to be hex digits
+    hours_and_minutes = parse_complete_hex_field(life_time, 2, 8, reject_nul=False)
+    if hours_and_minutes is None:
+        return None
+    return LifeTime(hours_and_minutes >> 8, hours_and_minutes & 0xFF)
+
+
+def decode_cal_laser(cal_laser):
+    """
+    Decode the hex code of GET_CAL_LASER without rendering it
+    :param cal_laser: cal laser hex code
+    :return: CalLaser, None if the telegram is too short or wrong (see convert_cal_laser)
+    """
+
+    cal_laser_as_int = parse_complete_hex_field(cal_laser, 2, 10)
+    if cal_laser_as_int is None:
+        return None
+    return CalLaser(cal_laser_as_int >> 16, cal_laser_as_int & 0xFFFF)
+
+
+def parse_status_response(status_response):
+    """
+    Parse the status response once for all the columns derived from it (same results as
+    get_errors_and_warnings_from_status_response and convert_status_byte)
+    :param status_response: Status response
+    :return: errors and warnings as string and status byte as string
+    """
+
+    # Status byte, error word and warning word converted at once if they are all ASCII hex digits (int() would also
+    # accept a "0x" prefix)
+    status_word_hex = status_response[:20]
+    if len(status_word_hex) == 20 and status_word_hex.isascii() and status_word_hex.isalnum() \
+            and "x" not in status_word_hex and "X" not in status_word_hex and "\x00" not in status_response:
+        try:
+            status_word = int(status_word_hex, base=16)
+        except ValueError:
+            status_word = None
+
+        if status_word is not None:
+            status_byte = status_word >> 72
+            return (decode_error_word((status_word >> 32) & 0xFFFFFFFF)[1] + " | "
+                    + decode_warning_word(status_word & 0xFFFFFFFF)[1],
+                    STATUS_BYTE_LABELS[status_byte] if status_byte else "STATUS_OK")
+
+    # Short, wrong or incomplete responses field by field
+    return get_errors_and_warnings_from_status_response(status_response), convert_status_byte(status_response)
+
+
+def parse_current_dac_adc(current_dac_adc, calibration_tables=None):
+    """
+    Parse the GET_CURRENT_DAC_ADC response once for all the columns derived from it (same results as
+    convert_current_dac_adc and convert_current_adc)
+    :param current_dac_adc: current hex code
+    :param calibration_tables: CalibrationTables (default: get_calibration_tables(DEFAULT_CALIBRATION_PROFILE))
+    :return: current DAC as string and current ADC as string
+    """
+
+    if calibration_tables is None:
+        calibration_tables = get_calibration_tables()
+
+    # Current DAC and ADC converted at once if they are all ASCII hex digits (int() would also accept a "0x" prefix)
+    current_dac_adc_hex = current_dac_adc[2:10]
+    if len(current_dac_adc_hex) == 8 and current_dac_adc_hex.isascii() and current_dac_adc_hex.isalnum() \
+            and "x" not in current_dac_adc_hex and "X" not in current_dac_adc_hex and "\x00" not in current_dac_adc:
+        try:
+            current_dac_adc_as_int = int(current_dac_adc_hex, base=16)
+        except ValueError:
+            current_dac_adc_as_int = None
+
+        if current_dac_adc_as_int is not None:
+            return (str(round(calibration_tables.current_dac[current_dac_adc_as_int >> 16], 2)),
+                    str(round(calibration_tables.current_adc[current_dac_adc_as_int & 0xFFFF], 2)))
+
+    # Short, wrong or incomplete responses field by field
+    return (convert_current_dac_calibrated(current_dac_adc, calibration_tables),
+            convert_current_adc_calibrated(current_dac_adc, calibration_tables))
+
+
+def parse_fw_version(fw_version):
+    """
+    Interpret the hex code of GET_FW_VERSION with a single conversion of the MMCU and SMCU versions (same result
+    as interpret_get_fw_version)
+    :param fw_version: FW version hex code
+    :return: mmcu_fw_version, smcu_fw_version
+    """
+
+    # The 3 bytes of each version converted at once if they are all hex digits
+    if len(fw_version) >= 18 and "\x00" not in fw_version:
+        try:
+            mmcu_fw_version = bytes.fromhex(fw_version[2:8])
+            smcu_fw_version = bytes.fromhex(fw_version[12:18])
+        except ValueError:
+            mmcu_fw_version = smcu_fw_version = b""
+
+        # bytes.fromhex skips white space: only complete versions
+        if len(mmcu_fw_version) == 3 and len(smcu_fw_version) == 3:
+            return "MMCU:  %d.%d.%d | SMCU:  %d.%d.%d" % (*mmcu_fw_version, *smcu_fw_version)
+
+    return interpret_get_fw_version(fw_version)
+
+
+def get_raw_status_word_field(status_response, start, stop):
+    """
+    Get a field of the status response as integer, without rendering it (used by the row filters)
+    :param status_response: Status response
+    :param start: index of the first hex digit of the field
+    :param stop: index after the last hex digit of the field
+    :return: value of the field (an empty field is 0) or None if the status response is not valid
+    """
+
+    if "\x00" in status_response or len(status_response) <= 6:
+        return None
+
+    field_code = status_response[start:stop]
+    return int(field_code, base=16) if field_code else 0
+
+
+def get_raw_error_word(status_response):
+    """
+    Get the error word of the status response as integer mask
+    :param status_response: Status response
+    :return: error word or None if the status response is not valid
+    """
+
+    return get_raw_status_word_field(status_response, 4, 12)
+
+
+def get_raw_warning_word(status_response):
+    """
+    Get the warning word of the status response as integer mask
+    :param status_response: Status response
+    :return: warning word or None if the status response is not valid
+    """
+
+    return get_raw_status_word_field(status_response, 12, 20)
+
+
+def get_raw_status_byte(status_response):
+    """
+    Get the status byte of the status response as integer
+    :param status_response: Status response
+    :return: status byte or None if the status response is not valid
+    """
+
+    return get_raw_status_word_field(status_response, 0, 2)
+
+
+def get_raw_laser_on_off(laser_status_response):
+    """
+    Get the laser status of the GET_LASER_ON_OFF response without rendering it
+    :param laser_status_response: laser status response
+    :return: "ON", "OFF" or None if the response is not valid
+    """
+
+    if "\x00" in laser_status_response or len(laser_status_response) <= 6:
+        return None
+
+    return "ON" if int(laser_status_response[2:4], base=16) != 0 else "OFF"
+
+
+def get_raw_ld_temp_in_deg(ld_temp):
+    """
+    Get the temperature of the GET_LD_TEMP response in deg (not rounded)
+    :param ld_temp: ld temp hex code
+    :return: temperature in deg or None if the response is not valid
+    """
+
+    if "\x00" in ld_temp or len(ld_temp) <= 6:
+        return None
+
+    return twos_complement_hex_to_signed_int(ld_temp[2:6], 16) / 100
+
+
+def get_raw_current(current):
+    """
+    Get the current of the GET_CURRENT response in mA
+    :param current: current hex code
+    :return: current in mA or None if the response is not valid
+    """
+
+    if "\x00" in current or len(current) <= 6:
+        return None
+
+    return int(current[2:6], base=16)
+
+
+def get_raw_mode(mode):
+    """
+    Get the mode byte of the GET_MODE response as integer mask
+    :param mode: mode in Hex code
+    :return: mode byte or None if the response is not valid
+    """
+
+    if "\x00" in mode or len(mode) <= 6:
+        return None
+
+    return int(mode[2:4], base=16)
+
+
+def get_raw_hex_field_of_bytes(hex_code, start, stop):
+    """
+    Get a field of a hex code read as bytes (memory map) as integer, parsed without decoding the hex code. Same
+    result as the raw value functions of the strings for ASCII hex codes.
+    :param hex_code: hex code as bytes
+    :param start: index of the first hex digit of the field
+    :param stop: index after the last hex digit of the field
+    :return: value of the field (an empty field is 0) or None if the telegram is not valid
+    """
+
+    if b"\x00" in hex_code or len(hex_code) <= 6:
+        return None
+
+    field_code = hex_code[start:stop]
+    return int(field_code, base=16) if field_code else 0
+
+
+def get_raw_laser_on_off_of_bytes(laser_status_response):
+    """
+    Bytes counterpart of get_raw_laser_on_off
+    :param laser_status_response: laser status response as bytes
+    :return: "ON", "OFF" or None if the response is not valid
+    """
+
+    laser_status = get_raw_hex_field_of_bytes(laser_status_response, 2, 4)
+    if laser_status is None:
+        return None
+
+    return "ON" if laser_status != 0 else "OFF"
+
+
+def get_raw_ld_temp_in_deg_of_bytes(ld_temp):
+    """
+    Bytes counterpart of get_raw_ld_temp_in_deg
+    :param ld_temp: ld temp hex code as bytes
+    :return: temperature in deg or None if the response is not valid
+    """
+
+    if b"\x00" in ld_temp or len(ld_temp) <= 6:
+        return None
+
+    return twos_complement_hex_to_signed_int(ld_temp[2:6], 16) / 100
+
+
+# CRC of the response telegrams: CRC-16/CCITT-FALSE (polynomial x^16 + x^12 + x^5 + 1, initial value 0xFFFF,
+# no reflection) over the bytes of the telegram, followed by the CRC itself in the last 2 bytes (big endian)
+CRC_POLYNOMIAL = 0x1021
+CRC_INITIAL_VALUE = 0xFFFF
+
+# Suffix of the title of the validity flag of an interpreted column ("1": CRC of the telegram valid, "0": bad frame)
+CRC_COLUMN_SUFFIX = "_CRC_VALID"
+
+
+def build_crc_16_table(polynomial):
+    """
+    Build the table of the CRC of each byte value, so that the CRC is updated with one lookup per byte
+    :param polynomial: CRC polynomial (without the bit 16)
+    :return: tuple with the 256 CRC values
+    """
+
+    crc_16_table = []
+    for byte_value in range(256):
+        crc = byte_value << 8
+        for _ in range(8):
+            crc = ((crc << 1) ^ polynomial) if crc & 0x8000 else crc << 1
+        crc_16_table.append(crc & 0xFFFF)
+    return tuple(crc_16_table)
+
+
+CRC_16_TABLE = build_crc_16_table(CRC_POLYNOMIAL)
+
+
+def crc_16(data, crc=CRC_INITIAL_VALUE):
+    """
+    Table driven CRC-16 (see CRC_POLYNOMIAL)
+    :param data: bytes
+    :param crc: initial value
+    :return: CRC as integer
+    """
+
+    for byte_value in data:
+        crc = ((crc << 8) & 0xFFFF) ^ CRC_16_TABLE[(crc >> 8) ^ byte_value]
+    return crc
+
+
+def is_telegram_crc_valid(hex_code):
+    """
+    Verify the CRC in the last 2 bytes of a response telegram
+    :param hex_code: hex code of the telegram
+    :return: True if the telegram is complete hex and its CRC is valid
+    """
+
+    # Bad frame if not an even number of hex digits (bytes.fromhex skips white space) or NUL
+    if len(hex_code) % 2 or not hex_code.isascii() or not hex_code.isalnum():
+        return False
+    try:
+        telegram = bytes.fromhex(hex_code)
+    except ValueError:
+        return False
+
+    # At least one byte with the CRC
+    if len(telegram) < 3:
+        return False
+    return crc_16(telegram[:-2]) == int.from_bytes(telegram[-2:], "big")
+
+
+def get_crc_flag(hex_code):
+    """
+    Validity flag of an interpreted column (see CRC_COLUMN_SUFFIX)
+    :param hex_code: hex code of the telegram
+    :return: "1" if the CRC of the telegram is valid, else "0"
+    """
+
+    return "1" if is_telegram_crc_valid(hex_code) else "0"
+
+
+# Registry of the additional columns with the results in clear text (in the order they are written):
+# title of the column, title of the column with the hex code and function converting the hex code
+INTERPRETED_COLUMNS = (("LD_TEMP_IN_DEG", "GET_LD_TEMP", convert_ld_temp_in_deg),
+                       ("STATUS_ERRORS_WARNING", "GET_STATUS", get_errors_and_warnings_from_status_response),
+                       ("LASER_ON_OR_OFF", "GET_LASER_ON_OFF", get_laser_on_or_off),
+                       ("SMCU_STATUS", "GET_SMCU_STATUS", interpret_get_smcu_status),
+                       ("TEMP_ADC", "GET_TEMP_ADC", convert_temp_adc_in_deg),
+                       ("CURRENT", "GET_CURRENT", convert_current),
+                       ("STATUS_BYTE", "GET_STATUS", convert_status_byte),
+                       ("MODE", "GET_MODE", interpret_get_mode),
+                       ("CONFIG_MODE", "GET_CONFIG_MODE", interpret_get_config_mode),
+                       ("GET_CURRENT_DAC_ADC", "GET_CURRENT_DAC_ADC", convert_current_dac_adc),
+                       ("GET_POWER_OUT_ABS", "GET_POWER_OUT_ABS", convert_power_out_abs),
+                       ("POWER_VAL_IN_PERC", "GET_POWER_VAL_IN_PERC", convert_power_val_in_perc),
+                       ("LD_LIFETIME", "GET_LD_LIFETIME", convert_ld_lifetime),
+                       ("GET_PD_VALUE", "GET_PD_VALUE", convert_pd_value),
+                       ("GET_MODULE_TOTAL_ONTIME", "GET_MODULE_TOTAL_ONTIME", convert_module_total_ontime),
+                       ("GET_CAL_LASER", "GET_CAL_LASER", convert_cal_laser),
+                       ("GET_COMP_REF", "GET_COMP_REF", convert_comp_ref),
+                       ("GET_FW_VERSION", "GET_FW_VERSION", parse_fw_version),
+                       ("GET_CURRENT_ADC", "GET_CURRENT_DAC_ADC", convert_current_adc))
+
+# Parsers of the telegrams from which several columns are derived: title of the column with the hex code ->
+# function parsing the telegram once and titles of the interpreted columns in the order of its results
+TELEGRAM_PARSERS = {"GET_STATUS": (parse_status_response, ("STATUS_ERRORS_WARNING", "STATUS_BYTE")),
+                    "GET_CURRENT_DAC_ADC": (parse_current_dac_adc, ("GET_CURRENT_DAC_ADC", "GET_CURRENT_ADC"))}
+
+# Decoders of the telegrams into records with raw integers: title of the column with the hex code -> decode function
+RECORD_DECODERS = {"GET_LD_TEMP": decode_ld_temp,
+                   "GET_STATUS": decode_status_word,
+                   "GET_SMCU_STATUS": decode_smcu_status,
+                   "GET_CURRENT_DAC_ADC": decode_current_dac_adc,
+                   "GET_FW_VERSION": decode_fw_version,
+                   "GET_LD_LIFETIME": decode_life_time,
+                   "GET_MODULE_TOTAL_ONTIME": decode_life_time,
+                   "GET_CAL_LASER": decode_cal_laser}
+
+# Record decoders taking the calibration profile of the hardware variant as keyword argument calibration_profile
+# (see iter_telegram_records)
+CALIBRATED_RECORD_DECODERS = {decode_smcu_status, decode_current_dac_adc}
+
+# Converters using the calibration of the hardware variant: function of the registries -> function taking the
+# calibration tables as keyword argument calibration_tables (see get_converters)
+CALIBRATED_CONVERTERS = {interpret_get_smcu_status: interpret_get_smcu_status_calibrated,
+                         convert_current_dac_adc: convert_current_dac_calibrated,
+                         convert_comp_ref: convert_comp_ref_calibrated,
+                         convert_current_adc: convert_current_adc_calibrated,
+                         parse_current_dac_adc: parse_current_dac_adc}
+
+# Fixed indexes of the columns with hex codes, used when their title is missing in the header of older files
+LEGACY_HEX_COLUMN_INDEXES = {"GET_CURRENT": 2,
+                             "GET_MODE": 3,
+                             "GET_CONFIG_MODE": 4,
+                             "GET_LD_TEMP": 7,
+                             "GET_LASER_ON_OFF": 8,
+                             "GET_STATUS": 14,
+                             "GET_SMCU_STATUS": 15,
+                             "GET_CURRENT_DAC_ADC": 30}
+
+# Registry of the fields the rows can be filtered on (see compile_row_filter): name of the field, title of the
+# column with the hex code, function getting the raw value of the field and type of the value ("int", "float" or
+# a tuple with the possible strings)
+FILTER_FIELDS = {"errors": ("GET_STATUS", get_raw_error_word, "int"),
+                 "warnings": ("GET_STATUS", get_raw_warning_word, "int"),
+                 "status_byte": ("GET_STATUS", get_raw_status_byte, "int"),
+                 "laser": ("GET_LASER_ON_OFF", get_raw_laser_on_off, ("ON", "OFF")),
+                 "ld_temp": ("GET_LD_TEMP", get_raw_ld_temp_in_deg, "float"),
+                 "current": ("GET_CURRENT", get_raw_current, "int"),
+                 "mode": ("GET_MODE", get_raw_mode, "int")}
+
+# Raw value functions of the filter fields for the hex codes read as bytes (see compile_row_filter): function of
+# FILTER_FIELDS -> function taking the hex code as bytes
+RAW_VALUE_FUNCTIONS_OF_BYTES = {get_raw_error_word: functools.partial(get_raw_hex_field_of_bytes, start=4, stop=12),
+                                get_raw_warning_word: functools.partial(get_raw_hex_field_of_bytes, start=12,
+                                                                        stop=20),
+                                get_raw_status_byte: functools.partial(get_raw_hex_field_of_bytes, start=0, stop=2),
+                                get_raw_laser_on_off: get_raw_laser_on_off_of_bytes,
+                                get_raw_ld_temp_in_deg: get_raw_ld_temp_in_deg_of_bytes,
+                                get_raw_current: functools.partial(get_raw_hex_field_of_bytes, start=2, stop=6),
+                                get_raw_mode: functools.partial(get_raw_hex_field_of_bytes, start=2, stop=4)}
+
+# Comparison operators of the row filters ("&": at least one bit of the mask is set)
+FILTER_OPERATORS = {"==": operator.eq,
+                    "=": operator.eq,
+                    "!=": operator.ne,
+                    "<": operator.lt,
+                    "<=": operator.le,
+                    ">": operator.gt,
+                    ">=": operator.ge,
+                    "&": lambda raw_value, mask: raw_value & mask != 0}
+
+# Condition of a row filter: field, operator and value
+FILTER_CONDITION_PATTERN = re.compile(r"^\s*(\w+)\s*(==|!=|<=|>=|=|<|>|&)\s*(\S+)\s*$")
+
+# Compiled plan to interpret the lines of a file: titles of the interpreted columns, the steps
+# (index of the column with the hex code, converter) computing them, the indexes of the columns of the file
+# kept in the output (None: all columns), the filter of the lines (None: all lines) and the dictionary with the
+# bad frames counted by the validity flags (None: not counted)
+RowDecodingPlan = collections.namedtuple("RowDecodingPlan", ["column_names", "steps", "kept_column_indexes",
+                                                             "row_filter", "bad_frames"])
+
+# Titles of the additional columns with the results in clear text (in the order they are written)
+INTERPRETED_COLUMN_NAMES = tuple(column_name for column_name, _, _ in INTERPRETED_COLUMNS)
+
+# Number of converted values of a column kept in its decode cache
+DECODE_CACHE_SIZE = 1024
+
+# Number of converted lines collected before they are written to the file
+LINES_PER_WRITE = 1000
+
+# Size in bytes of the ranges of the file with results in Hex converted by one worker process
+CHUNK_SIZE = 8 * 1024 * 1024
+
+# Size in bytes of the blocks read ahead by the reader thread of the pipelined conversion
+PIPELINE_BLOCK_SIZE = 1024 * 1024
+
+# Number of blocks waiting in each queue of the pipelined conversion (read blocks and converted blocks)
+PIPELINE_QUEUE_DEPTH = 4
+
+# Size in bytes of the buffer of the file written by the writer thread of the pipelined conversion
+PIPELINE_WRITE_BUFFER_SIZE = 4 * 1024 * 1024
+
+# Time in seconds between two checks of the stop of the pipelined conversion by a thread waiting for a full queue
+PIPELINE_POLL_INTERVAL = 0.1
+
+# Name of the manifest written by the conversion of many files
+BATCH_MANIFEST_FILE_NAME = "zx_interpret_results_manifest.csv"
+
+# Name of the cache of the conversions of many files (see zx_interpret_results_batch)
+CONVERSION_CACHE_FILE_NAME = "zx_interpret_results_cache.json"
+
+# Version of the conversions, to change with every change of the converted results so that the cached conversions
+# are converted again
+CONVERTER_VERSION = "1"
+
+# Options of zx_interpret_results changing the converted results (the other ones only change the speed)
+CACHED_CONVERSION_OPTIONS = ("columns", "drop_hex_columns", "where", "check_crc", "calibration_profile", "quarantine")
+
+# Seconds between two refreshes of the file with converted results in follow mode
+FOLLOW_POLL_INTERVAL = 5.0
+
+# Name of the files with results in Hex: <device serial>_TempZyklen_<run date as yymmdd>
+RESULTS_FILE_NAME_PATTERN = re.compile(r"^(?P<serial>\d+)_TempZyklen_(?P<run_date>\d{6})")
+
+# Number of rows inserted at once in the SQLite database
+SQLITE_ROWS_PER_INSERT = 10000
+
+# Title of the column with the time stamp of the lines (stored in the SQLite database and in the row index)
+TIMESTAMP_COLUMN_NAME = "TIMESTAMP"
+
+# Type of the SQLite columns with the raw values of the filter fields (other types are stored as text)
+SQLITE_FILTER_FIELD_TYPES = {"int": "INTEGER", "float": "REAL"}
+
+# End of the name of the index of the error and warning flags of a file (added to the name without ".csv")
+FLAG_INDEX_FILE_SUFFIX = "_converter.flags.json"
+
+# End of the name of the index of the byte offsets of the rows of a file (added to the name without ".csv")
+ROW_INDEX_FILE_SUFFIX = "_converter.rows.json"
+
+# Number of rows between two entries of the row index
+ROW_INDEX_INTERVAL = 10000
+
+# Suffix of the file with the lines that can't be converted in resilient mode (see zx_interpret_results)
+QUARANTINE_FILE_SUFFIX = "_quarantine.csv"
+
+# End of the name of the checkpoint of a conversion to resume (added to the name without ".csv")
+RESUME_CHECKPOINT_FILE_SUFFIX = "_converter.resume.json"
+
+# End of the name of the checkpoint of the follow mode (added to the name without ".csv")
+FOLLOW_CHECKPOINT_FILE_SUFFIX = "_converter.follow.json"
+
+# End of the names of the files generated next to the files with results in Hex (converted results, temporary file,
+# quarantine, indexes, checkpoints), never converted themselves
+GENERATED_FILE_SUFFIXES = ("_converter.csv", "_converter.csv.tmp", QUARANTINE_FILE_SUFFIX, FLAG_INDEX_FILE_SUFFIX,
+                           ROW_INDEX_FILE_SUFFIX, RESUME_CHECKPOINT_FILE_SUFFIX, FOLLOW_CHECKPOINT_FILE_SUFFIX)
+
+# Names of the files generated for the conversion of many files, never converted themselves
+GENERATED_FILE_NAMES = (BATCH_MANIFEST_FILE_NAME, CONVERSION_CACHE_FILE_NAME)
+
+
+def get_hex_column_index(header_hex_results_line_as_list, hex_column_name):
+    """
+    Get the index of a column with hex codes from the header of the file with results in Hex
+    :param header_hex_results_line_as_list: header line of the file with results in Hex split at the comma
+    :param hex_column_name: title of the column with the hex codes
+    :return: index of the column
+    """
+
+    if hex_column_name in header_hex_results_line_as_list:
+        return header_hex_results_line_as_list.index(hex_column_name)
+
+    # Files of older loggers without the title
+    if hex_column_name in LEGACY_HEX_COLUMN_INDEXES:
+        return LEGACY_HEX_COLUMN_INDEXES[hex_column_name]
+
+    raise ValueError(f"Column {hex_column_name} is not in the header of the file with results in Hex")
+
+
+def make_cached_converter(converter, decode_cache_size):
+    """
+    Wrap a converter with a bounded (least recently used) cache of its results. The returned strings are interned,
+    so that equal results of different hex codes are the same object.
+    The hits and misses of the cache are given by cached_converter.cache_info().
+    :param converter: function converting a hex code to a string
+    :param decode_cache_size: number of results kept in the cache
+    :return: cached converter
+    """
+
+    def interned_converter(hex_code):
+        return sys.intern(converter(hex_code))
+
+    return functools.lru_cache(maxsize=decode_cache_size)(interned_converter)
+
+
+def make_bad_frame_counter(crc_flag_converter, bad_frames, hex_column_name):
+    """
+    Wrap the converter of a validity flag to count the telegrams with an invalid CRC while the lines are converted
+    (every line is counted, also the ones answered by the cache of the converter)
+    :param crc_flag_converter: converter of the validity flag (see get_crc_flag)
+    :param bad_frames: dictionary (e.g. collections.Counter) receiving the number of bad frames by hex column
+    :param hex_column_name: title of the column with the hex codes
+    :return: converter of the validity flag counting the bad frames
+    """
+
+    def counted_crc_flag_converter(hex_code):
+        crc_flag = crc_flag_converter(hex_code)
+        if crc_flag == "0":
+            bad_frames[hex_column_name] = bad_frames.get(hex_column_name, 0) + 1
+        return crc_flag
+
+    return counted_crc_flag_converter
+
+
+def make_telegram_column_converter(cached_telegram_parser, result_number):
+    """
+    Make the converter of a column derived from a telegram parsed once for all its columns
+    :param cached_telegram_parser: telegram parser (see TELEGRAM_PARSERS) with a cache of its results
+    :param result_number: position of the column in the results of the parser
+    :return: converter of the column (its cache_info is the one of the shared parser)
+    """
+
+    def telegram_column_converter(hex_code):
+        return cached_telegram_parser(hex_code)[result_number]
+
+    telegram_column_converter.cache_info = cached_telegram_parser.cache_info
+    return telegram_column_converter
+
+
+def get_converters(decode_cache_size=DECODE_CACHE_SIZE, calibration_profile=None):
+    """
+    Get the converters of the interpreted columns, each one with its own decode cache. The columns derived from the
+    same telegram (see TELEGRAM_PARSERS) share the parser of the telegram and its cache (at least the last telegram
+    is kept, so that it is parsed once per line even without cache).
+    :param decode_cache_size: number of results kept in the cache of each column (0: no cache)
+    :param calibration_profile: CalibrationProfile of the analog values (default: DEFAULT_CALIBRATION_PROFILE)
+    :return: tuple with the converter of each column of INTERPRETED_COLUMNS
+    """
+
+    # The analog values are looked up in the tables of the profile (see CALIBRATED_CONVERTERS)
+    calibration_tables = get_calibration_tables(calibration_profile or DEFAULT_CALIBRATION_PROFILE)
+
+    def calibrated(converter):
+        if converter in CALIBRATED_CONVERTERS:
+            return functools.partial(CALIBRATED_CONVERTERS[converter], calibration_tables=calibration_tables)
+        return converter
+
+    # Shared parser of each telegram with the interned results
+    cached_telegram_parsers = {}
+    for hex_column_name, (telegram_parser, _) in TELEGRAM_PARSERS.items():
+        telegram_parser = calibrated(telegram_parser)
+
+        def interned_telegram_parser(hex_code, telegram_parser=telegram_parser):
+            return tuple(map(sys.intern, telegram_parser(hex_code)))
+
+        cached_telegram_parsers[hex_column_name] = functools.lru_cache(maxsize=max(decode_cache_size, 1))(
+            interned_telegram_parser)
+
+    converters = []
+    for column_name, hex_column_name, converter in INTERPRETED_COLUMNS:
+        converter = calibrated(converter)
+        if hex_column_name in TELEGRAM_PARSERS and column_name in TELEGRAM_PARSERS[hex_column_name][1]:
+            converters.append(make_telegram_column_converter(cached_telegram_parsers[hex_column_name],
+                                                             TELEGRAM_PARSERS[hex_column_name][1].index(column_name)))
+        elif decode_cache_size:
+            converters.append(make_cached_converter(converter, decode_cache_size))
+        else:
+            converters.append(converter)
+
+    return tuple(converters)
+
+
+def get_decode_cache_info(converters):
+    """
+    Get the hits and misses of the decode caches
+    :param converters: converters (see get_converters)
+    :return: dictionary with the title of the column as key and the cache info (hits, misses, maxsize, currsize)
+             as value (only the cached converters)
+    """
+
+    return {column_name: converter.cache_info()
+            for (column_name, _, _), converter in zip(INTERPRETED_COLUMNS, converters)
+            if hasattr(converter, "cache_info")}
+
+
+def parse_filter_condition(filter_condition):
+    """
+    Parse a condition of a row filter, e.g. "errors != 0", "laser=ON", "ld_temp > 60" or "warnings & 0x8"
+    :param filter_condition: condition as string
+    :return: name of the field, comparison function and value (converted to the type of the field)
+    """
+
+    condition_match = FILTER_CONDITION_PATTERN.match(filter_condition)
+    if condition_match is None:
+        raise ValueError(f"Invalid filter condition {filter_condition!r}, expected <field> <operator> <value>")
+    field_name, operator_string, value_string = condition_match.groups()
+    field_name = field_name.lower()
+
+    if field_name not in FILTER_FIELDS:
+        raise ValueError(f"Unknown filter field {field_name}, possible fields: {', '.join(FILTER_FIELDS)}")
+    value_type = FILTER_FIELDS[field_name][2]
+
+    try:
+        if value_type == "int":
+            value = int(value_string, base=0)
+        elif value_type == "float":
+            value = float(value_string)
+        else:
+            value = value_string.upper()
+            if value not in value_type:
+                raise ValueError
+    except ValueError:
+        raise ValueError(f"Invalid value {value_string!r} for the filter field {field_name}") from None
+
+    # Strings can only be compared for equality and masks only on integers
+    if (value_type not in ("int", "float") and operator_string not in ("==", "=", "!=")) \
+            or (value_type != "int" and operator_string == "&"):
+        raise ValueError(f"Operator {operator_string} not supported for the filter field {field_name}")
+
+    return field_name, FILTER_OPERATORS[operator_string], value
+
+
+def make_raw_value_function_of_bytes(get_raw_value, encoding):
+    """
+    Make the function getting the raw value of a filter field from its hex code as bytes, parsed without decoding
+    (see RAW_VALUE_FUNCTIONS_OF_BYTES)
+    :param get_raw_value: raw value function of the field (see FILTER_FIELDS)
+    :param encoding: encoding of the file, used for the hex codes with other characters than ASCII
+    :return: function taking the hex code as bytes
+    """
+
+    get_raw_value_of_bytes = RAW_VALUE_FUNCTIONS_OF_BYTES[get_raw_value]
+
+    def raw_value_function_of_bytes(hex_code):
+        # The lengths and digits of the bytes are the ones of the string only for ASCII
+        if hex_code.isascii():
+            return get_raw_value_of_bytes(hex_code)
+        return get_raw_value(hex_code.decode(encoding))
+
+    return raw_value_function_of_bytes
+
+
+def compile_row_filter(header_hex_results_line_as_list, where, encoding=None):
+    """
+    Compile row filters in a function selecting the lines on the raw values of their hex codes, so that the rejected
+    lines are never rendered. A line is selected if it matches all the filters; a filter matches if one of its
+    conditions separated by " or " matches. A condition on a field with a not valid hex code (CRC Error, Wrong Hex
+    value) does not match.
+    :param header_hex_results_line_as_list: header line of the file with results in Hex split at the comma
+    :param where: list of filters, e.g. ["errors != 0 or warnings != 0", "laser=ON"]
+    :param encoding: encoding of the lines split as bytes (e.g. read from a memory map), the fields are parsed
+                     without decoding them (default: lines split as strings)
+    :return: function returning True for the selected lines (split at the comma) or None without filters
+    """
+
+    if not where:
+        return None
+
+    # Conditions of each filter: (index of the column with the hex code, raw value function, comparison, value)
+    filter_conditions = []
+    for row_filter_string in where:
+        conditions = []
+        for filter_condition in re.split(r"\s+or\s+", row_filter_string.strip(), flags=re.IGNORECASE):
+            field_name, compare, value = parse_filter_condition(filter_condition)
+            hex_column_name, get_raw_value, _ = FILTER_FIELDS[field_name]
+            if encoding is not None:
+                get_raw_value = make_raw_value_function_of_bytes(get_raw_value, encoding)
+            conditions.append((get_hex_column_index(header_hex_results_line_as_list, hex_column_name),
+                               get_raw_value, compare, value))
+        filter_conditions.append(tuple(conditions))
+    filter_conditions = tuple(filter_conditions)
+
+    def row_filter(hex_results_line_split):
+        for conditions in filter_conditions:
+            for column_index, get_raw_value, compare, value in conditions:
+                raw_value = get_raw_value(hex_results_line_split[column_index])
+                if raw_value is not None and compare(raw_value, value):
+                    break
+            else:
+                return False
+        return True
+
+    return row_filter
+
+
+def compile_row_decoding_plan(header_hex_results_line_as_list, decode_cache_size=DECODE_CACHE_SIZE, columns=None,
+                              drop_hex_columns=False, converters=None, where=None, check_crc=False,
+                              calibration_profile=None, bad_frames=None):
+    """
+    Compile the registry of the interpreted columns for the header of a file in a flat plan, so that the lines
+    are interpreted without any lookup of columns. Only the converters of the requested columns are run.
+    :param header_hex_results_line_as_list: header line of the file with results in Hex split at the comma
+    :param decode_cache_size: number of results kept in the decode cache of each column (0: no cache)
+    :param columns: titles of the interpreted columns to compute, in the order of the output
+                    (default: all the columns of INTERPRETED_COLUMNS)
+    :param drop_hex_columns: remove the columns with the hex codes interpreted by the registry from the output
+    :param converters: converters of the columns of INTERPRETED_COLUMNS (see get_converters, default:
+                       get_converters(decode_cache_size))
+    :param where: filters of the lines evaluated before the conversion (see compile_row_filter, default: all lines)
+    :param check_crc: add the validity flag of each interpreted column after the interpreted columns
+                      (see CRC_COLUMN_SUFFIX)
+    :param calibration_profile: CalibrationProfile of the analog values when the converters are not given
+                                (default: DEFAULT_CALIBRATION_PROFILE)
+    :param bad_frames: dictionary (e.g. collections.Counter) receiving the number of telegrams with an invalid CRC
+                       of each hex column of the interpreted columns, counted by the validity flags of check_crc
+                       in the lines converted with the plan
+    :return: RowDecodingPlan
+    """
+
+    if converters is None:
+        converters = get_converters(decode_cache_size, calibration_profile)
+
+    if columns is None:
+        columns = INTERPRETED_COLUMN_NAMES
+    if not columns:
+        raise ValueError("No interpreted column selected")
+    for column_name in columns:
+        if column_name not in INTERPRETED_COLUMN_NAMES:
+            raise ValueError(f"Unknown interpreted column {column_name}, possible columns: "
+                             f"{', '.join(INTERPRETED_COLUMN_NAMES)}")
+
+    # Position of the selected columns in the registry
+    registry_positions = [INTERPRETED_COLUMN_NAMES.index(column_name) for column_name in columns]
+
+    steps = tuple((get_hex_column_index(header_hex_results_line_as_list, INTERPRETED_COLUMNS[registry_position][1]),
+                   converters[registry_position])
+                  for registry_position in registry_positions)
+
+    column_names = tuple(columns)
+    if check_crc:
+        # The CRC of a telegram is verified once per hex code for all the columns derived from it
+        crc_flag_converters = {}
+        crc_flag_steps = []
+        for registry_position, (column_index, _) in zip(registry_positions, steps):
+            if column_index in crc_flag_converters:
+                crc_flag_steps.append((column_index, crc_flag_converters[column_index]))
+                continue
+            crc_flag_converters[column_index] = make_cached_converter(get_crc_flag, decode_cache_size) \
+                if decode_cache_size else get_crc_flag
+            # The bad frames of a hex column are counted by its first validity flag only
+            if bad_frames is not None:
+                crc_flag_steps.append((column_index, make_bad_frame_counter(
+                    crc_flag_converters[column_index], bad_frames, INTERPRETED_COLUMNS[registry_position][1])))
+            else:
+                crc_flag_steps.append((column_index, crc_flag_converters[column_index]))
+        steps += tuple(crc_flag_steps)
+        column_names += tuple(column_name + CRC_COLUMN_SUFFIX for column_name in columns)
+
+    kept_column_indexes = None
+    if drop_hex_columns:
+        # Columns with hex codes of the registry which are in the header
+        hex_column_indexes = {header_hex_results_line_as_list.index(hex_column_name)
+                              for _, hex_column_name, _ in INTERPRETED_COLUMNS
+                              if hex_column_name in header_hex_results_line_as_list}
+        hex_column_indexes.update(column_index for column_index, _ in steps)
+        kept_column_indexes = tuple(column_index for column_index in range(len(header_hex_results_line_as_list))
+                                    if column_index not in hex_column_indexes)
+
+    return RowDecodingPlan(column_names, steps, kept_column_indexes,
+                           compile_row_filter(header_hex_results_line_as_list, where),
+                           bad_frames if check_crc else None)
+
+
+def interpret_hex_results_line_split(hex_results_line_split, row_decoding_plan):
+    """
+    Interpret the hex codes of a single line of the test results
+    :param hex_results_line_split: line of the file with results in Hex split at the comma
+    :param row_decoding_plan: plan of the file (see compile_row_decoding_plan)
+    :return: list with the interpreted values in the order of the columns of the plan
+    """
+
+    return [converter(hex_results_line_split[column_index]) for column_index, converter in row_decoding_plan.steps]
+
+
+# Marker of the interpreted values of a lazy row not read yet (see InterpretedRow)
+NOT_INTERPRETED = object()
+
+# Layout of the lazy rows of a file: plan of the file, indexes of the columns of the file in the row, position of
+# each column title in the row (the titles of the interpreted columns win over the titles of the hex columns) and
+# header of the file
+InterpretedRowLayout = collections.namedtuple("InterpretedRowLayout", ["row_decoding_plan", "file_column_indexes",
+                                                                       "column_positions", "header"])
+
+
+def compile_interpreted_row_layout(header_hex_results_line_as_list, row_decoding_plan):
+    """
+    Compile the layout shared by the lazy rows of a file (see InterpretedRow)
+    :param header_hex_results_line_as_list: header line of the file with results in Hex split at the comma
+    :param row_decoding_plan: plan of the file (see compile_row_decoding_plan)
+    :return: InterpretedRowLayout
+    """
+
+    # Columns of the file in the row (all of them if no column is dropped)
+    file_column_indexes = row_decoding_plan.kept_column_indexes
+    if file_column_indexes is None:
+        file_column_indexes = tuple(range(len(header_hex_results_line_as_list)))
+
+    # Position of each title in the row, the interpreted columns last so that they win over the same hex titles
+    column_positions = {}
+    for position, column_index in enumerate(file_column_indexes):
+        column_positions.setdefault(header_hex_results_line_as_list[column_index], position)
+    for position, column_name in enumerate(row_decoding_plan.column_names, len(file_column_indexes)):
+        column_positions[column_name] = position
+
+    return InterpretedRowLayout(row_decoding_plan, file_column_indexes, column_positions,
+                                tuple(header_hex_results_line_as_list))
+
+
+class InterpretedRow:
+    """
+    View of a line of the test results that runs the converter of an interpreted column only the first time the
+    column is read and keeps the result. The row behaves like the list yielded by iter_interpreted_rows (columns of
+    the file followed by the interpreted values): row[3], row[-1], row[2:5], len(row), list(row), row == [...].
+    The columns can also be read by title: row["LD_TEMP_IN_DEG"] or row.LD_TEMP_IN_DEG (or row.ld_temp_in_deg).
+    """
+
+    __slots__ = ("row_layout", "hex_results_line_split", "interpreted_values")
+
+    def __init__(self, row_layout, hex_results_line_split):
+        """
+        :param row_layout: layout of the file (see compile_interpreted_row_layout)
+        :param hex_results_line_split: line of the file with results in Hex split at the comma
+        """
+
+        self.row_layout = row_layout
+        self.hex_results_line_split = hex_results_line_split
+        # Created at the first interpreted column read
+        self.interpreted_values = None
+
+    def get_interpreted_value(self, step_number):
+        """
+        Get an interpreted value, converted at the first read
+        :param step_number: position of the column in the interpreted columns of the plan
+        :return: interpreted value
+        """
+
+        if self.interpreted_values is None:
+            self.interpreted_values = [NOT_INTERPRETED] * len(self.row_layout.row_decoding_plan.steps)
+
+        interpreted_value = self.interpreted_values[step_number]
+        if interpreted_value is NOT_INTERPRETED:
+            column_index, converter = self.row_layout.row_decoding_plan.steps[step_number]
+            interpreted_value = converter(self.hex_results_line_split[column_index])
+            self.interpreted_values[step_number] = interpreted_value
+        return interpreted_value
+
+    def get_hex_code(self, hex_column_name):
+        """
+        Get a column of the file by title, also when an interpreted column has the same title
+        :param hex_column_name: title of the column of the file
+        :return: value of the column in the file
+        """
+
+        return self.hex_results_line_split[get_hex_column_index(self.row_layout.header, hex_column_name)]
+
+    def get_value(self, position):
+        """
+        Get a value of the row
+        :param position: position of the column in the row (negative from the end)
+        :return: value of the file or interpreted value
+        """
+
+        number_of_file_columns = len(self.row_layout.file_column_indexes)
+        if position < 0:
+            position += len(self)
+        if 0 <= position < number_of_file_columns:
+            return self.hex_results_line_split[self.row_layout.file_column_indexes[position]]
+        if number_of_file_columns <= position < len(self):
+            return self.get_interpreted_value(position - number_of_file_columns)
+        raise IndexError("InterpretedRow index out of range")
+
+    def to_list(self):
+        """
+        Interpret all the columns
+        :return: list with the same values as iter_interpreted_rows(lazy=False)
+        """
+
+        return [self.get_value(position) for position in range(len(self))]
+
+    def __len__(self):
+        return len(self.row_layout.file_column_indexes) + len(self.row_layout.row_decoding_plan.steps)
+
+    def __iter__(self):
+        return (self.get_value(position) for position in range(len(self)))
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            if key not in self.row_layout.column_positions:
+                raise KeyError(key)
+            return self.get_value(self.row_layout.column_positions[key])
+        if isinstance(key, slice):
+            return [self.get_value(position) for position in range(*key.indices(len(self)))]
+        return self.get_value(operator.index(key))
+
+    def __getattr__(self, name):
+        # Only called for the names which are not attributes: titles of the columns
+        for column_name in (name, name.upper()):
+            if column_name in self.row_layout.column_positions:
+                return self.get_value(self.row_layout.column_positions[column_name])
+        raise AttributeError(f"{type(self).__name__} has no column {name}")
+
+    def __eq__(self, other):
+        if isinstance(other, (InterpretedRow, list, tuple)):
+            return self.to_list() == list(other)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.to_list()!r})"
+
+
+def iter_interpreted_rows(hex_results_file_path, decode_cache_size=DECODE_CACHE_SIZE, columns=None,
+                          drop_hex_columns=False, where=None, lazy=False, check_crc=False, calibration_profile=None):
+    """
+    Read the test results line by line and yield each line with the additional interpreted columns.
+    Only the current line is kept in memory, the file is never read completely.
+    :param hex_results_file_path: path of the file with results in Hex
+    :param decode_cache_size: number of results kept in the decode cache of each column (0: no cache)
+    :param columns: titles of the interpreted columns to compute (default: all, see compile_row_decoding_plan)
+    :param drop_hex_columns: remove the columns with the hex codes interpreted by the registry
+    :param where: filters of the lines (see compile_row_filter, default: all lines)
+    :param lazy: yield InterpretedRow views which convert each interpreted column only when it is read
+    :param check_crc: add the validity flag of each interpreted column (see CRC_COLUMN_SUFFIX)
+    :param calibration_profile: CalibrationProfile of the analog values (default: DEFAULT_CALIBRATION_PROFILE)
+    :return: generator of lists with the (kept) columns of the line followed by the interpreted values
+             (in the order of columns), or of InterpretedRow with the same values if lazy
+    """
+
+    # Open the file with Hex results in read mode
+    with open(hex_results_file_path, "r") as hex_results_file:
+
+        # Read the header to get the indexes of the columns
+        header_hex_results_line = next(hex_results_file, None)
+        if header_hex_results_line is None:
+            return
+        row_decoding_plan = compile_row_decoding_plan(header_hex_results_line.strip().split(","), decode_cache_size,
+                                                      columns, drop_hex_columns, where=where, check_crc=check_crc,
+                                                      calibration_profile=calibration_profile)
+        kept_column_indexes = row_decoding_plan.kept_column_indexes
+        row_filter = row_decoding_plan.row_filter
+        row_layout = None
+        if lazy:
+            row_layout = compile_interpreted_row_layout(header_hex_results_line.strip().split(","), row_decoding_plan)
+
+        # Navigate lazily through the other lines of the file
+        for hex_results_line in hex_results_file:
+            hex_results_line_split = hex_results_line.strip().split(",")
+            if row_filter is not None and not row_filter(hex_results_line_split):
+                continue
+            if row_layout is not None:
+                yield InterpretedRow(row_layout, hex_results_line_split)
+                continue
+            interpreted_values = interpret_hex_results_line_split(hex_results_line_split, row_decoding_plan)
+            if kept_column_indexes is not None:
+                hex_results_line_split = [hex_results_line_split[column_index] for column_index in kept_column_indexes]
+            yield hex_results_line_split + interpreted_values
+
+
+def iter_telegram_records(hex_results_file_path, hex_column_names=None, calibration_profile=None):
+    """
+    Read the test results line by line and yield the decoded telegrams as records with raw integers. Nothing is
+    rendered: str() of a record gives the legacy string of its column when it is needed.
+    The records are an API for the programs working on the values; the conversion to the CSV file renders every
+    converted line and keeps using the converters with their decode caches (see get_converters).
+    :param hex_results_file_path: path of the file with results in Hex
+    :param hex_column_names: titles of the columns with hex codes to decode (default: all of RECORD_DECODERS)
+    :param calibration_profile: CalibrationProfile of the analog values of the records (default:
+                                DEFAULT_CALIBRATION_PROFILE), the same as the one of the conversion
+    :return: generator of tuples with the records of the line (in the order of hex_column_names), None for the
+             short, wrong or incomplete telegrams
+    """
+
+    if hex_column_names is None:
+        hex_column_names = tuple(RECORD_DECODERS)
+
+    # Open the file with Hex results in read mode
+    with open(hex_results_file_path, "r") as hex_results_file:
+
+        # Read the header to get the indexes of the columns
+        header_hex_results_line = next(hex_results_file, None)
+        if header_hex_results_line is None:
+            return
+        header_hex_results_line_as_list = header_hex_results_line.strip().split(",")
+        decoders = [(get_hex_column_index(header_hex_results_line_as_list, hex_column_name),
+                     functools.partial(RECORD_DECODERS[hex_column_name], calibration_profile=calibration_profile)
+                     if RECORD_DECODERS[hex_column_name] in CALIBRATED_RECORD_DECODERS
+                     else RECORD_DECODERS[hex_column_name]) for hex_column_name in hex_column_names]
+
+        # Navigate lazily through the other lines of the file
+        for hex_results_line in hex_results_file:
+            hex_results_line_split = hex_results_line.strip().split(",")
+            yield tuple(decoder(hex_results_line_split[column_index]) for column_index, decoder in decoders)
+
+
+def convert_header_hex_results_line(header_hex_results_line, plan_options=None):
+    """
+    Compile the plan of the file and add the titles of the new columns to the header of the file with results in Hex
+    :param header_hex_results_line: header line of the file with results in Hex
+    :param plan_options: dictionary with the keyword arguments of compile_row_decoding_plan
+    :return: plan of the file (see compile_row_decoding_plan) and the converted header line
+    """
+
+    header_hex_results_line_strip = header_hex_results_line.strip()
+    header_hex_results_line_as_list = header_hex_results_line_strip.split(",")
+    row_decoding_plan = compile_row_decoding_plan(header_hex_results_line_as_list, **(plan_options or {}))
+
+    # Remove the columns that are not kept
+    if row_decoding_plan.kept_column_indexes is not None:
+        header_hex_results_line_strip = ",".join([header_hex_results_line_as_list[column_index]
+                                                  for column_index in row_decoding_plan.kept_column_indexes])
+
+    # rewrite the header with the titles of the new columns and the new line character
+    return row_decoding_plan, header_hex_results_line_strip + "," + ",".join(row_decoding_plan.column_names) + "\n"
+
+
+def iter_converted_lines(hex_results_lines, row_decoding_plan):
+    """
+    Convert the lines (without header) of the test results to the lines with additional interpreted columns
+    :param hex_results_lines: iterable with the lines of the file with results in Hex (without header)
+    :param row_decoding_plan: plan of the file (see compile_row_decoding_plan)
+    :return: generator of the converted lines (with the new line character), without the lines rejected by the
+             filter of the plan
+    """
+
+    steps = row_decoding_plan.steps
+    kept_column_indexes = row_decoding_plan.kept_column_indexes
+    row_filter = row_decoding_plan.row_filter
+
+    if kept_column_indexes is None:
+        for hex_results_line in hex_results_lines:
+            # Remove the new line ("\n") at the end of the line
+            hex_results_line_strip = hex_results_line.strip()
+            # Split at the comma to get each column element in the list
+            hex_results_line_split = hex_results_line_strip.split(",")
+            # Skip the rejected lines before any conversion
+            if row_filter is not None and not row_filter(hex_results_line_split):
+                continue
+            # Build the line with the additional columns at the end
+            yield hex_results_line_strip + "," + ",".join([converter(hex_results_line_split[column_index])
+                                                           for column_index, converter in steps]) + "\n"
+
+    else:
+        for hex_results_line in hex_results_lines:
+            hex_results_line_split = hex_results_line.strip().split(",")
+            if row_filter is not None and not row_filter(hex_results_line_split):
+                continue
+            # Build the line with the kept columns and the additional columns at the end
+            yield ",".join([hex_results_line_split[column_index] for column_index in kept_column_indexes]
+                           + [converter(hex_results_line_split[column_index])
+                              for column_index, converter in steps]) + "\n"
+
+
+def iter_converted_lines_resilient(hex_results_lines, row_decoding_plan, quarantine_writer, error_summary,
+                                   first_line_number=2, lines_per_block=LINES_PER_WRITE):
+    """
+    Convert the lines like iter_converted_lines, but the lines that can't be converted are written to the
+    quarantine instead of stopping the conversion. The lines are converted in blocks at the speed of
+    iter_converted_lines, only a block with an error is converted again line by line.
+    :param hex_results_lines: iterable with the lines of the file with results in Hex (without header)
+    :param row_decoding_plan: plan of the file (see compile_row_decoding_plan)
+    :param quarantine_writer: csv writer receiving the line number, the reason and the line of the bad lines
+    :param error_summary: dictionary (e.g. collections.Counter) counting the bad lines by error type
+    :param first_line_number: line number of the first line in the file (the header is the line 1)
+    :param lines_per_block: number of lines converted at once
+    :return: generator of the converted lines (with the new line character)
+    """
+
+    hex_results_lines = iter(hex_results_lines)
+    line_number = first_line_number
+    bad_frames = row_decoding_plan.bad_frames
+
+    for hex_results_lines_block in iter(lambda: list(itertools.islice(hex_results_lines, lines_per_block)), []):
+        # Bad frames before the block, the lines converted again are not counted twice
+        block_start_bad_frames = dict(bad_frames) if bad_frames is not None else None
+        try:
+            converted_lines = list(iter_converted_lines(hex_results_lines_block, row_decoding_plan))
+        except Exception:
+            if bad_frames is not None:
+                bad_frames.clear()
+                bad_frames.update(block_start_bad_frames)
+            # Find the bad lines of the block
+            converted_lines = []
+            for block_line_number, hex_results_line in enumerate(hex_results_lines_block, line_number):
+                try:
+                    converted_lines.extend(iter_converted_lines((hex_results_line,), row_decoding_plan))
+                except Exception as error:
+                    quarantine_writer.writerow([block_line_number, f"{type(error).__name__}: {error}",
+                                                hex_results_line.rstrip("\r\n")])
+                    error_summary[type(error).__name__] = error_summary.get(type(error).__name__, 0) + 1
+
+        yield from converted_lines
+        line_number += len(hex_results_lines_block)
+
+
+def iter_interpreted_results_lines(hex_results_lines, plan_options=None, quarantine_writer=None, error_summary=None):
+    """
+    Convert the lines of the test results to the lines of the file with additional interpreted columns
+    :param hex_results_lines: iterable with the lines of the file with results in Hex (header first)
+    :param plan_options: dictionary with the keyword arguments of compile_row_decoding_plan
+    :param quarantine_writer: csv writer of the quarantine, the bad lines are skipped instead of stopping the
+                              conversion (see iter_converted_lines_resilient, default: no quarantine)
+    :param error_summary: dictionary counting the bad lines by error type (with quarantine_writer)
+    :return: generator of the converted lines (with the new line character)
+    """
+
+    hex_results_lines = iter(hex_results_lines)
+
+    # The first line is the header
+    header_hex_results_line = next(hex_results_lines, None)
+    if header_hex_results_line is None:
+        return
+    row_decoding_plan, converted_header_line = convert_header_hex_results_line(header_hex_results_line, plan_options)
+    yield converted_header_line
+
+    # Other lines
+    if quarantine_writer is not None:
+        yield from iter_converted_lines_resilient(hex_results_lines, row_decoding_plan, quarantine_writer,
+                                                  {} if error_summary is None else error_summary)
+    else:
+        yield from iter_converted_lines(hex_results_lines, row_decoding_plan)
+
+
+def write_lines_in_batches(lines, output_file, lines_per_write=LINES_PER_WRITE):
+    """
+    Write the lines to the file, collecting at most lines_per_write lines in memory
+    :param lines: iterable with the lines to write
+    :param output_file: file opened in write mode
+    :param lines_per_write: number of lines collected before writing them
+    :return: number of written lines
+    """
+
+    number_of_lines = 0
+    lines_to_write = []
+
+    for line in lines:
+        lines_to_write.append(line)
+        if len(lines_to_write) >= lines_per_write:
+            output_file.writelines(lines_to_write)
+            number_of_lines += len(lines_to_write)
+            lines_to_write = []
+
+    # Write the remaining lines
+    output_file.writelines(lines_to_write)
+    number_of_lines += len(lines_to_write)
+
+    return number_of_lines
+
+
+def convert_hex_results_file_mmap(hex_results_file_path, interpreted_results_file_path, plan_options=None,
+                                  lines_per_write=LINES_PER_WRITE):
+    """
+    Convert the file with results in Hex from a memory map of the file: the lines are split on bytes, the filters
+    parse their hex fields from the bytes (see compile_row_filter) and only the fields with hex codes converted by
+    the plan are decoded to strings for the converters (all at once per selected line). The columns which are not
+    converted are written back as bytes. Lines ending with a single carriage return are not supported.
+    :param hex_results_file_path: path of the file with results in Hex
+    :param interpreted_results_file_path: path of the file with the converted results
+    :param plan_options: dictionary with the keyword arguments of compile_row_decoding_plan
+    :param lines_per_write: number of converted lines collected before they are written
+    :return: number of converted lines (without the header)
+    """
+
+    # Same encoding as the files opened in text mode
+    encoding = locale.getpreferredencoding(False)
+
+    with open(hex_results_file_path, "rb") as hex_results_file, \
+            open(interpreted_results_file_path, "wb") as interpreted_results_file:
+
+        # An empty file can't be mapped
+        if not os.fstat(hex_results_file.fileno()).st_size:
+            return 0
+
+        with mmap.mmap(hex_results_file.fileno(), 0, access=mmap.ACCESS_READ) as hex_results_map:
+            header_hex_results_line = hex_results_map.readline().decode(encoding)
+            row_decoding_plan, converted_header_line = convert_header_hex_results_line(header_hex_results_line,
+                                                                                       plan_options)
+            interpreted_results_file.write(converted_header_line.encode(encoding))
+
+            # Columns with hex codes decoded to strings and the position of each one in the decoded fields
+            decoded_column_indexes = sorted({column_index for column_index, _ in row_decoding_plan.steps})
+            get_decoded_fields = operator.itemgetter(*decoded_column_indexes)
+            if len(decoded_column_indexes) == 1:
+                # A single field also as a sequence
+                get_decoded_fields = operator.itemgetter(slice(decoded_column_indexes[0],
+                                                               decoded_column_indexes[0] + 1))
+            steps = tuple((decoded_column_indexes.index(column_index), converter)
+                          for column_index, converter in row_decoding_plan.steps)
+            kept_column_indexes = row_decoding_plan.kept_column_indexes
+
+            # The filters parse the raw values from the fields as bytes
+            row_filter = compile_row_filter(header_hex_results_line.strip().split(","),
+                                            (plan_options or {}).get("where"), encoding)
+
+            number_of_lines = 0
+            converted_lines = []
+            for hex_results_line in iter(hex_results_map.readline, b""):
+                hex_results_line_strip = hex_results_line.strip()
+                line_fields = hex_results_line_strip.split(b",")
+                if row_filter is not None and not row_filter(line_fields):
+                    continue
+
+                # Decode only the converted fields of the selected lines, in a single call (faster than decoding
+                # the fields one by one)
+                decoded_fields = b",".join(get_decoded_fields(line_fields)).decode(encoding).split(",")
+                converted_values = ",".join([converter(decoded_fields[field_index])
+                                             for field_index, converter in steps])
+
+                if kept_column_indexes is not None:
+                    hex_results_line_strip = b",".join([line_fields[column_index]
+                                                        for column_index in kept_column_indexes])
+                converted_lines.append(hex_results_line_strip + b"," + converted_values.encode(encoding) + b"\n")
+
+                # Write the converted lines in batches
+                if len(converted_lines) >= lines_per_write:
+                    interpreted_results_file.writelines(converted_lines)
+                    number_of_lines += len(converted_lines)
+                    converted_lines = []
+
+            interpreted_results_file.writelines(converted_lines)
+            number_of_lines += len(converted_lines)
+
+    return number_of_lines
+
+
+def get_line_aligned_byte_ranges(file_path, start_offset, chunk_size=CHUNK_SIZE, file_end_offset=None):
+    """
+    Split a file in byte ranges of about chunk_size bytes, each ending at the end of a line
+    :param file_path: path of the file
+    :param start_offset: byte offset of the first range
+    :param chunk_size: minimal size of a range in bytes (except the last one)
+    :param file_end_offset: byte offset of the end of the last range (default: size of the file)
+    :return: generator of (start offset, end offset)
+    """
+
+    file_size = os.path.getsize(file_path) if file_end_offset is None else file_end_offset
+
+    with open(file_path, "rb") as file:
+        range_start_offset = start_offset
+        while range_start_offset < file_size:
+            range_end_offset = range_start_offset + chunk_size
+            if range_end_offset >= file_size:
+                range_end_offset = file_size
+            else:
+                # Move the end of the range to the end of the line
+                file.seek(range_end_offset - 1)
+                file.readline()
+                range_end_offset = file.tell()
+
+            yield range_start_offset, range_end_offset
+            range_start_offset = range_end_offset
+
+
+def convert_hex_results_byte_range(hex_results_file_path, header_hex_results_line, start_offset, end_offset,
+                                   plan_options=None):
+    """
+    Convert the lines of a byte range of the file with results in Hex (executed by the worker processes)
+    :param hex_results_file_path: path of the file with results in Hex
+    :param header_hex_results_line: header line of the file with results in Hex
+    :param start_offset: byte offset of the start of the first line
+    :param end_offset: byte offset of the end of the last line
+    :param plan_options: dictionary with the keyword arguments of compile_row_decoding_plan
+    :return: converted lines as a single string, the number of lines and the number of bad frames by hex column
+             (see convert_hex_results_bytes)
+    """
+
+    # Read the byte range
+    with open(hex_results_file_path, "rb") as hex_results_file:
+        hex_results_file.seek(start_offset)
+        hex_results_bytes = hex_results_file.read(end_offset - start_offset)
+
+    return convert_hex_results_bytes(header_hex_results_line, hex_results_bytes, plan_options)
+
+
+def convert_hex_results_bytes(header_hex_results_line, hex_results_bytes, plan_options=None):
+    """
+    Convert the complete lines of a block of the file with results in Hex (executed by the worker processes)
+    :param header_hex_results_line: header line of the file with results in Hex
+    :param hex_results_bytes: bytes of the lines, ending at the end of a line
+    :param plan_options: dictionary with the keyword arguments of compile_row_decoding_plan, the bad frames of the
+                         block are counted separately if bad_frames is given (added by the caller, see
+                         add_bad_frames)
+    :return: converted lines as a single string, the number of lines and the dictionary with the number of bad
+             frames of the block by hex column (None without bad_frames in plan_options)
+    """
+
+    # The bad frames of the block are returned to the process converting the file
+    plan_options = plan_options or {}
+    block_bad_frames = None
+    if plan_options.get("bad_frames") is not None:
+        block_bad_frames = {}
+        plan_options = dict(plan_options, bad_frames=block_bad_frames)
+
+    # Every worker compiles the plan of the file
+    row_decoding_plan = compile_row_decoding_plan(header_hex_results_line.strip().split(","), **plan_options)
+
+    # Decode the bytes like a file opened in read mode
+    hex_results_lines = io.TextIOWrapper(io.BytesIO(hex_results_bytes))
+    converted_lines = list(iter_converted_lines(hex_results_lines, row_decoding_plan))
+
+    return "".join(converted_lines), len(converted_lines), block_bad_frames
+
+
+def add_bad_frames(bad_frames, block_bad_frames):
+    """
+    Add the bad frames of a converted block to the ones of the file
+    :param bad_frames: dictionary with the number of bad frames of the file by hex column (None: not counted)
+    :param block_bad_frames: dictionary with the number of bad frames of the block by hex column (None: not counted)
+    """
+
+    if bad_frames is None or not block_bad_frames:
+        return
+    for hex_column_name, number_of_bad_frames in block_bad_frames.items():
+        bad_frames[hex_column_name] = bad_frames.get(hex_column_name, 0) + number_of_bad_frames
+
+
+def convert_hex_results_file_parallel(hex_results_file_path, interpreted_results_file, workers,
+                                      chunk_size=CHUNK_SIZE, plan_options=None):
+    """
+    Convert the file with results in Hex in byte ranges converted by a pool of worker processes.
+    The converted ranges are written in the original order, at most 2 ranges per worker are kept in memory.
+    :param hex_results_file_path: path of the file with results in Hex
+    :param interpreted_results_file: file opened in write mode for the converted lines
+    :param workers: number of worker processes
+    :param chunk_size: size of the byte ranges converted by a worker
+    :param plan_options: dictionary with the keyword arguments of compile_row_decoding_plan
+    :return: number of converted lines (without the header)
+    """
+
+    # Get the header and the byte offset of the first line after the header
+    with open(hex_results_file_path, "rb") as hex_results_file:
+        header_hex_results_bytes = hex_results_file.readline()
+    if not header_hex_results_bytes:
+        return 0
+    header_hex_results_line = io.TextIOWrapper(io.BytesIO(header_hex_results_bytes)).readline()
+
+    # Rewrite the header with the titles of the new columns
+    interpreted_results_file.write(convert_header_hex_results_line(header_hex_results_line, plan_options)[1])
+
+    number_of_lines = 0
+    pending_ranges = collections.deque()
+    bad_frames = (plan_options or {}).get("bad_frames")
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        for start_offset, end_offset in get_line_aligned_byte_ranges(hex_results_file_path,
+                                                                     len(header_hex_results_bytes), chunk_size):
+            pending_ranges.append(executor.submit(convert_hex_results_byte_range, hex_results_file_path,
+                                                  header_hex_results_line, start_offset, end_offset,
+                                                  plan_options))
+
+            # Write the oldest range if enough ranges are pending
+            if len(pending_ranges) >= 2 * workers:
+                converted_lines, number_of_range_lines, range_bad_frames = pending_ranges.popleft().result()
+                interpreted_results_file.write(converted_lines)
+                number_of_lines += number_of_range_lines
+                add_bad_frames(bad_frames, range_bad_frames)
+
+        # Write the remaining ranges
+        while pending_ranges:
+            converted_lines, number_of_range_lines, range_bad_frames = pending_ranges.popleft().result()
+            interpreted_results_file.write(converted_lines)
+            number_of_lines += number_of_range_lines
+            add_bad_frames(bad_frames, range_bad_frames)
+
+    return number_of_lines
+
+
+def iter_line_aligned_blocks(hex_results_file, block_size=PIPELINE_BLOCK_SIZE):
+    """
+    Read a file in blocks of about block_size bytes, each ending at the end of a line
+    :param hex_results_file: file opened in binary read mode
+    :param block_size: number of bytes read at once
+    :return: generator of the blocks (bytes), the last one may end without new line
+    """
+
+    remaining_bytes = b""
+    for read_bytes in iter(lambda: hex_results_file.read(block_size), b""):
+        read_bytes = remaining_bytes + read_bytes
+        # Keep the incomplete last line for the next block
+        block_end_offset = read_bytes.rfind(b"\n") + 1
+        remaining_bytes = read_bytes[block_end_offset:]
+        if block_end_offset:
+            yield read_bytes[:block_end_offset]
+
+    if remaining_bytes:
+        yield remaining_bytes
+
+
+def put_in_pipeline_queue(pipeline_queue, item, stop_event):
+    """
+    Put an item in a queue of the pipelined conversion, waiting while the queue is full until the conversion stops
+    :param pipeline_queue: queue.Queue of the pipeline
+    :param item: item to put
+    :param stop_event: threading.Event set when the conversion stops
+    :return: True if the item was put, False if the conversion stopped before
+    """
+
+    while not stop_event.is_set():
+        try:
+            pipeline_queue.put(item, timeout=PIPELINE_POLL_INTERVAL)
+            return True
+        except queue.Full:
+            pass
+    return False
+
+
+def read_blocks_to_queue(hex_results_file, block_size, block_queue, stop_event, errors):
+    """
+    Reader thread of the pipelined conversion: put the line aligned blocks of the file in the queue, then None
+    :param hex_results_file: file opened in binary read mode, after the header
+    :param block_size: number of bytes read at once
+    :param block_queue: queue.Queue receiving the blocks
+    :param stop_event: threading.Event set when the conversion stops
+    :param errors: list receiving the exception of the thread
+    """
+
+    try:
+        for hex_results_block in iter_line_aligned_blocks(hex_results_file, block_size):
+            if not put_in_pipeline_queue(block_queue, hex_results_block, stop_event):
+                return
+    except BaseException as error:
+        errors.append(error)
+    finally:
+        # End of the blocks (also after an error)
+        put_in_pipeline_queue(block_queue, None, stop_event)
+
+
+def write_blocks_from_queue(interpreted_results_file, converted_queue, errors):
+    """
+    Writer thread of the pipelined conversion: write the converted blocks of the queue until None. After an error,
+    the blocks are still taken from the queue (not written) so that the decode stage is never blocked.
+    :param interpreted_results_file: file opened in write mode
+    :param converted_queue: queue.Queue with the converted blocks (strings)
+    :param errors: list receiving the exception of the thread
+    """
+
+    for converted_block in iter(converted_queue.get, None):
+        if errors:
+            continue
+        try:
+            interpreted_results_file.write(converted_block)
+        except BaseException as error:
+            errors.append(error)
+
+
+def iter_converted_blocks(block_queue, header_hex_results_line, row_decoding_plan, plan_options=None, workers=1):
+    """
+    Decode stage of the pipelined conversion: convert the blocks of the queue in their order, in this thread or by a
+    pool of worker processes (at most 2 blocks per worker pending)
+    :param block_queue: queue.Queue with the blocks read from the file, None at the end
+    :param header_hex_results_line: header line of the file with results in Hex
+    :param row_decoding_plan: plan of the file used in this thread (see compile_row_decoding_plan)
+    :param plan_options: dictionary with the keyword arguments of compile_row_decoding_plan used by the workers
+                         (the bad frames of the blocks are added to its bad_frames)
+    :param workers: number of worker processes (1: blocks converted in this thread)
+    :return: generator of the converted blocks (string) and their number of lines
+    """
+
+    if workers <= 1:
+        for hex_results_block in iter(block_queue.get, None):
+            # Decode the bytes like a file opened in read mode
+            converted_lines = list(iter_converted_lines(io.TextIOWrapper(io.BytesIO(hex_results_block)),
+                                                        row_decoding_plan))
+            yield "".join(converted_lines), len(converted_lines)
+        return
+
+    plan_options = plan_options or {}
+    pending_blocks = collections.deque()
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        for hex_results_block in iter(block_queue.get, None):
+            pending_blocks.append(executor.submit(convert_hex_results_bytes, header_hex_results_line,
+                                                  hex_results_block, plan_options))
+
+            # Hand over the oldest block if enough blocks are pending
+            if len(pending_blocks) >= 2 * workers:
+                converted_block, number_of_block_lines, block_bad_frames = pending_blocks.popleft().result()
+                add_bad_frames(plan_options.get("bad_frames"), block_bad_frames)
+                yield converted_block, number_of_block_lines
+
+        while pending_blocks:
+            converted_block, number_of_block_lines, block_bad_frames = pending_blocks.popleft().result()
+            add_bad_frames(plan_options.get("bad_frames"), block_bad_frames)
+            yield converted_block, number_of_block_lines
+
+
+def convert_hex_results_file_pipelined(hex_results_file_path, interpreted_results_file_path, plan_options=None,
+                                       workers=1, block_size=PIPELINE_BLOCK_SIZE, queue_depth=PIPELINE_QUEUE_DEPTH,
+                                       write_buffer_size=PIPELINE_WRITE_BUFFER_SIZE):
+    """
+    Convert the file with results in Hex in a pipeline overlapping the I/O with the decoding: a reader thread reads
+    the file ahead in blocks, the blocks are converted in this thread (or by worker processes) and a writer thread
+    writes the converted blocks through a large buffer. The bounded queues between the stages keep at most
+    queue_depth blocks each in memory.
+    :param hex_results_file_path: path of the file with results in Hex
+    :param interpreted_results_file_path: path of the file with the converted results
+    :param plan_options: dictionary with the keyword arguments of compile_row_decoding_plan
+    :param workers: number of worker processes converting the blocks (1: blocks converted in this thread)
+    :param block_size: size in bytes of the blocks read at once
+    :param queue_depth: number of blocks waiting in the queue of the read blocks and in the one of the converted
+                        blocks
+    :param write_buffer_size: size in bytes of the buffer of the file with the converted results
+    :return: number of converted lines (without the header)
+    """
+
+    with open(hex_results_file_path, "rb") as hex_results_file, \
+            open(interpreted_results_file_path, "w", buffering=write_buffer_size) as interpreted_results_file:
+
+        # Rewrite the header with the titles of the new columns
+        header_hex_results_bytes = hex_results_file.readline()
+        if not header_hex_results_bytes:
+            return 0
+        header_hex_results_line = io.TextIOWrapper(io.BytesIO(header_hex_results_bytes)).readline()
+        row_decoding_plan, converted_header_line = convert_header_hex_results_line(header_hex_results_line,
+                                                                                   plan_options)
+        interpreted_results_file.write(converted_header_line)
+
+        # The worker processes compile their own plan, without the converters of this process
+        worker_plan_options = dict(plan_options or {}, converters=None)
+
+        block_queue = queue.Queue(maxsize=queue_depth)
+        converted_queue = queue.Queue(maxsize=queue_depth)
+        stop_event = threading.Event()
+        reader_errors = []
+        writer_errors = []
+        reader_thread = threading.Thread(target=read_blocks_to_queue, daemon=True,
+                                         args=(hex_results_file, block_size, block_queue, stop_event, reader_errors))
+        writer_thread = threading.Thread(target=write_blocks_from_queue, daemon=True,
+                                         args=(interpreted_results_file, converted_queue, writer_errors))
+        reader_thread.start()
+        writer_thread.start()
+
+        number_of_lines = 0
+        converted_blocks = iter_converted_blocks(block_queue, header_hex_results_line, row_decoding_plan,
+                                                 worker_plan_options, workers)
+        try:
+            for converted_block, number_of_block_lines in converted_blocks:
+                if writer_errors:
+                    break
+                # The writer thread always empties the queue until the end
+                converted_queue.put(converted_block)
+                number_of_lines += number_of_block_lines
+
+        finally:
+            # Stop the threads (also if the decoding failed) before the files are closed
+            stop_event.set()
+            # Shut down the worker processes of a decode stage left early (e.g. after an error of the writer)
+            converted_blocks.close()
+            # Free the blocks read ahead, the reader thread is never blocked on a full queue
+            while True:
+                try:
+                    block_queue.get_nowait()
+                except queue.Empty:
+                    break
+            converted_queue.put(None)
+            writer_thread.join()
+            reader_thread.join()
+
+        # Errors of the reading and of the writing
+        for errors in (reader_errors, writer_errors):
+            if errors:
+                raise errors[0]
+
+    return number_of_lines
+
+
+def get_row_decoding_plan_hash(header_hex_results_line, plan_options=None):
+    """
+    Hash of the plan compiled for a header: the header, the converted header (interpreted, kept and validity
+    columns), the filters and the calibration profile. Converted lines only fit together with the same hash.
+    :param header_hex_results_line: header line of the file with results in Hex
+    :param plan_options: dictionary with the keyword arguments of compile_row_decoding_plan
+    :return: hash as hex string
+    """
+
+    plan_options = plan_options or {}
+    converted_header_line = convert_header_hex_results_line(header_hex_results_line, plan_options)[1]
+    calibration_profile = plan_options.get("calibration_profile") or DEFAULT_CALIBRATION_PROFILE
+
+    plan_description = json.dumps([header_hex_results_line, converted_header_line,
+                                   list(plan_options.get("where") or []), list(calibration_profile)])
+    return hashlib.sha256(plan_description.encode("utf-8")).hexdigest()
+
+
+def convert_hex_results_file_resumable(hex_results_file_path, temporary_file_path, checkpoint_file_path, workers=1,
+                                       chunk_size=CHUNK_SIZE, plan_options=None):
+    """
+    Convert the file with results in Hex in byte ranges appended to the temporary file, with a checkpoint after
+    each range (input byte offset, output byte offset, number of lines and hash of the plan). A conversion
+    interrupted with the same file and the same plan continues at the last checkpoint and gives the same output as
+    an uninterrupted one.
+    :param hex_results_file_path: path of the file with results in Hex
+    :param temporary_file_path: path of the file receiving the converted lines
+    :param checkpoint_file_path: path of the checkpoint
+    :param workers: number of worker processes (1: ranges converted in this process)
+    :param chunk_size: size in bytes of the ranges between two checkpoints
+    :param plan_options: dictionary with the keyword arguments of compile_row_decoding_plan (the bad frames of
+                         all the ranges are added to its bad_frames)
+    :return: number of converted lines (without the header)
+    """
+
+    hex_results_file_stat = os.stat(hex_results_file_path)
+    with open(hex_results_file_path, "rb") as hex_results_file:
+        header_hex_results_bytes = hex_results_file.readline()
+
+    # An empty file gives an empty converted file like the other conversions, there is nothing to resume
+    if not header_hex_results_bytes:
+        open(temporary_file_path, "w").close()
+        if os.path.exists(checkpoint_file_path):
+            os.remove(checkpoint_file_path)
+        return 0
+
+    header_hex_results_line = io.TextIOWrapper(io.BytesIO(header_hex_results_bytes)).readline()
+    plan_hash = get_row_decoding_plan_hash(header_hex_results_line, plan_options)
+
+    # Check if the checkpoint belongs to the same file with results in Hex, the same plan and the temporary file
+    # (a checkpoint with missing or wrong values is stale too)
+    checkpoint = load_json_sidecar(checkpoint_file_path)
+    if not isinstance(checkpoint, dict):
+        checkpoint = None
+    if checkpoint is not None:
+        if checkpoint.get("plan_hash") != plan_hash \
+                or checkpoint.get("size") != hex_results_file_stat.st_size \
+                or checkpoint.get("mtime_ns") != hex_results_file_stat.st_mtime_ns \
+                or not all(isinstance(checkpoint.get(key), int) for key in ("input_offset", "output_offset", "lines")) \
+                or not isinstance(checkpoint.get("bad_frames"), dict) \
+                or not os.path.exists(temporary_file_path) \
+                or os.path.getsize(temporary_file_path) < checkpoint["output_offset"]:
+            checkpoint = None
+
+    if checkpoint is None:
+        # Start from the beginning
+        with open(temporary_file_path, "w") as temporary_file:
+            temporary_file.write(convert_header_hex_results_line(header_hex_results_line, plan_options)[1])
+
+        checkpoint = {"plan_hash": plan_hash,
+                      "size": hex_results_file_stat.st_size,
+                      "mtime_ns": hex_results_file_stat.st_mtime_ns,
+                      "input_offset": len(header_hex_results_bytes),
+                      "output_offset": os.path.getsize(temporary_file_path),
+                      "lines": 0,
+                      "bad_frames": {}}
+        save_json_sidecar(checkpoint_file_path, checkpoint, durable=True)
+
+    # Remove what was written after the last checkpoint
+    os.truncate(temporary_file_path, checkpoint["output_offset"])
+
+    def save_converted_range(converted_range, range_end_offset):
+        converted_lines, number_of_range_lines, range_bad_frames = converted_range
+        with open(temporary_file_path, "a") as temporary_file:
+            temporary_file.write(converted_lines)
+            # The converted lines are on the disk before the checkpoint refers to them
+            temporary_file.flush()
+            os.fsync(temporary_file.fileno())
+        checkpoint["input_offset"] = range_end_offset
+        checkpoint["output_offset"] = os.path.getsize(temporary_file_path)
+        checkpoint["lines"] += number_of_range_lines
+        add_bad_frames(checkpoint["bad_frames"], range_bad_frames)
+        # The checkpoint is on the disk before the next range is written (see save_json_sidecar)
+        save_json_sidecar(checkpoint_file_path, checkpoint, durable=True)
+
+    byte_ranges = get_line_aligned_byte_ranges(hex_results_file_path, checkpoint["input_offset"], chunk_size,
+                                               hex_results_file_stat.st_size)
+
+    # The bad frames of every range are kept in the checkpoint, also if the interrupted conversion didn't ask for
+    # them, so that the counts of a resumed conversion are complete
+    range_plan_options = dict(plan_options or {}, bad_frames={})
+
+    if workers > 1:
+        pending_ranges = collections.deque()
+        with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+            for start_offset, end_offset in byte_ranges:
+                pending_ranges.append((executor.submit(convert_hex_results_byte_range, hex_results_file_path,
+                                                       header_hex_results_line, start_offset, end_offset,
+                                                       range_plan_options), end_offset))
+                # Save the oldest range if enough ranges are pending (the checkpoints stay in order)
+                if len(pending_ranges) >= 2 * workers:
+                    future, end_offset = pending_ranges.popleft()
+                    save_converted_range(future.result(), end_offset)
+            while pending_ranges:
+                future, end_offset = pending_ranges.popleft()
+                save_converted_range(future.result(), end_offset)
+    else:
+        for start_offset, end_offset in byte_ranges:
+            converted_range = convert_hex_results_byte_range(hex_results_file_path, header_hex_results_line,
+                                                             start_offset, end_offset, range_plan_options)
+            save_converted_range(converted_range, end_offset)
+
+    # Bad frames of all the ranges, also the ones converted before an interruption
+    add_bad_frames((plan_options or {}).get("bad_frames"), checkpoint["bad_frames"])
+
+    return checkpoint["lines"]
+
+
+def zx_interpret_results(hex_results_file_path, lines_per_write=LINES_PER_WRITE, workers=1, chunk_size=CHUNK_SIZE,
+                         decode_cache_size=DECODE_CACHE_SIZE, converters=None, columns=None, drop_hex_columns=False,
+                         where=None, use_mmap=False, check_crc=False, calibration_profile=None, quarantine=False,
+                         error_summary=None, resume=False, pipeline=False, block_size=PIPELINE_BLOCK_SIZE,
+                         queue_depth=PIPELINE_QUEUE_DEPTH, bad_frames=None):
+    """
+    Convert some columns of the test results from hex in clear text.
+    The file is streamed (read -> interpret -> write), only lines_per_write lines are kept in memory.
+    With more than one worker the file is converted in byte ranges by a pool of processes (same output).
+    The pipelined conversion reads and writes the file in threads while the blocks are converted (same output).
+    The converted results are written to a temporary file renamed at the end, so that the file with the converted
+    results is always complete. If the conversion fails, the temporary file is removed (except with resume).
+    :param hex_results_file_path: path of the file with results in Hex
+    :param lines_per_write: number of converted lines collected before they are written
+    :param workers: number of worker processes (0: number of CPUs)
+    :param chunk_size: size in bytes of the ranges converted by a worker process (and between two checkpoints)
+    :param decode_cache_size: number of results kept in the decode cache of each column (0: no cache)
+    :param converters: converters of the interpreted columns used by the serial conversion, e.g. to read the
+                       statistics of their decode caches afterwards (default: get_converters(decode_cache_size))
+    :param columns: titles of the interpreted columns to compute (default: all, see compile_row_decoding_plan)
+    :param drop_hex_columns: remove the columns with the hex codes interpreted by the registry from the output
+    :param where: filters of the lines converted (see compile_row_filter, default: all lines)
+    :param use_mmap: the serial conversion reads the file from a memory map and only decodes the converted fields
+                     (see convert_hex_results_file_mmap)
+    :param check_crc: add the validity flag of each interpreted column (see CRC_COLUMN_SUFFIX)
+    :param calibration_profile: CalibrationProfile of the analog values (default: DEFAULT_CALIBRATION_PROFILE)
+    :param quarantine: resilient mode: the lines that can't be converted (e.g. wrong hex value, missing columns)
+                       are written with their line number and the reason to the quarantine file
+                       (see get_quarantine_file_path, only kept if there are bad lines) instead of stopping the
+                       conversion. Always a serial conversion of the text file.
+    :param error_summary: dictionary (e.g. collections.Counter) receiving the number of bad lines by error type in
+                          resilient mode
+    :param resume: save a checkpoint after each range of chunk_size bytes and continue an interrupted conversion
+                   of the same file with the same options at its last checkpoint
+                   (see convert_hex_results_file_resumable)
+    :param pipeline: pipelined conversion hiding the latency of the reads and writes (e.g. network share) behind the
+                     decoding, with the workers converting the blocks (see convert_hex_results_file_pipelined)
+    :param block_size: size in bytes of the blocks read ahead by the pipelined conversion
+    :param queue_depth: number of blocks waiting between two stages of the pipelined conversion
+    :param bad_frames: dictionary (e.g. collections.Counter) receiving the number of telegrams with an invalid CRC
+                       of each hex column of the converted lines, counted by the validity flags of check_crc in the
+                       same pass (see compile_row_decoding_plan)
+    :return: number of converted lines (without the header, the lines rejected by the filters and the bad lines)
+    """
+
+    plan_options = {"decode_cache_size": decode_cache_size, "columns": columns, "drop_hex_columns": drop_hex_columns,
+                    "where": where, "check_crc": check_crc, "calibration_profile": calibration_profile,
+                    "bad_frames": bad_frames}
+
+    if quarantine and resume:
+        raise ValueError("The resilient mode (quarantine) can't resume a conversion")
+
+    if workers == 0:
+        workers = os.cpu_count() or 1
+
+    # The bad lines are only found by the serial conversion
+    if quarantine:
+        workers = 1
+        use_mmap = False
+        pipeline = False
+
+    # Create the name of the file that will contain additional columns with results in clear text, written to a
+    # temporary file first
+    interpreted_results_file_path = hex_results_file_path[:-4] + "_converter.csv"
+    temporary_file_path = interpreted_results_file_path + ".tmp"
+    checkpoint_file_path = hex_results_file_path[:-4] + RESUME_CHECKPOINT_FILE_SUFFIX
+
+    # Lines ending with a single carriage return can only be split by the serial conversion of the text file
+    if workers > 1 or use_mmap or resume or pipeline:
+        with open(hex_results_file_path, "rb") as hex_results_file:
+            if b"\r" in hex_results_file.readline().rstrip(b"\r\n"):
+                workers = 1
+                use_mmap = False
+                resume = False
+                pipeline = False
+
+    try:
+        if resume:
+            number_of_lines = convert_hex_results_file_resumable(hex_results_file_path, temporary_file_path,
+                                                                 checkpoint_file_path, workers, chunk_size,
+                                                                 plan_options)
+
+        elif pipeline:
+            number_of_lines = convert_hex_results_file_pipelined(hex_results_file_path, temporary_file_path,
+                                                                 dict(plan_options, converters=converters), workers,
+                                                                 block_size, queue_depth)
+
+        elif workers > 1:
+            with open(temporary_file_path, "w") as interpreted_results_file:
+                number_of_lines = convert_hex_results_file_parallel(hex_results_file_path, interpreted_results_file,
+                                                                    workers, chunk_size, plan_options)
+
+        elif use_mmap:
+            number_of_lines = convert_hex_results_file_mmap(hex_results_file_path, temporary_file_path,
+                                                            dict(plan_options, converters=converters),
+                                                            lines_per_write)
+
+        elif quarantine:
+            number_of_lines = convert_hex_results_file_resilient(hex_results_file_path, temporary_file_path,
+                                                                 dict(plan_options, converters=converters),
+                                                                 lines_per_write, error_summary)
+
+        else:
+            # Open the file with Hex results in read mode and the file that will contain additional columns with
+            # results in clear text in write mode
+            with open(hex_results_file_path, "r") as hex_results_file, \
+                    open(temporary_file_path, "w") as interpreted_results_file:
+
+                number_of_lines = write_lines_in_batches(iter_interpreted_results_lines(hex_results_file,
+                                                                                        dict(plan_options,
+                                                                                             converters=converters)),
+                                                         interpreted_results_file, lines_per_write)
+
+            # Do not count the header
+            number_of_lines = max(number_of_lines - 1, 0)
+
+    except BaseException:
+        # Don't leave partial files behind (also if interrupted), except the ones of a conversion to resume
+        for partial_file_path in (None if resume else temporary_file_path,
+                                  get_quarantine_file_path(hex_results_file_path) if quarantine else None):
+            if partial_file_path is not None and os.path.exists(partial_file_path):
+                os.remove(partial_file_path)
+        raise
+
+    # The converted file appears complete
+    os.replace(temporary_file_path, interpreted_results_file_path)
+    if resume and os.path.exists(checkpoint_file_path):
+        os.remove(checkpoint_file_path)
+
+    return number_of_lines
+
+
+def get_quarantine_file_path(hex_results_file_path):
+    """
+    Get the path of the quarantine file of a file with results in Hex (see QUARANTINE_FILE_SUFFIX)
+    :param hex_results_file_path: path of the file with results in Hex
+    :return: path of the quarantine file
+    """
+
+    return hex_results_file_path[:-4] + QUARANTINE_FILE_SUFFIX
+
+
+def convert_hex_results_file_resilient(hex_results_file_path, interpreted_results_file_path, plan_options=None,
+                                       lines_per_write=LINES_PER_WRITE, error_summary=None):
+    """
+    Convert the file with results in Hex and write the lines that can't be converted to the quarantine file
+    (LINE_NUMBER, REASON, LINE) instead of stopping the conversion. The quarantine file is removed if there is no
+    bad line.
+    :param hex_results_file_path: path of the file with results in Hex
+    :param interpreted_results_file_path: path of the file with the converted results
+    :param plan_options: dictionary with the keyword arguments of compile_row_decoding_plan
+    :param lines_per_write: number of converted lines collected before they are written
+    :param error_summary: dictionary receiving the number of bad lines by error type
+    :return: number of converted lines (without the header and the bad lines)
+    """
+
+    if error_summary is None:
+        error_summary = {}
+    number_of_bad_lines = sum(error_summary.values())
+    quarantine_file_path = get_quarantine_file_path(hex_results_file_path)
+
+    with open(hex_results_file_path, "r") as hex_results_file, \
+            open(interpreted_results_file_path, "w") as interpreted_results_file, \
+            open(quarantine_file_path, "w", newline="") as quarantine_file:
+
+        quarantine_writer = csv.writer(quarantine_file)
+        quarantine_writer.writerow(["LINE_NUMBER", "REASON", "LINE"])
+
+        number_of_lines = write_lines_in_batches(iter_interpreted_results_lines(hex_results_file, plan_options,
+                                                                                quarantine_writer, error_summary),
+                                                 interpreted_results_file, lines_per_write)
+
+    # Keep the quarantine file only with bad lines (no stale file of a previous conversion)
+    if sum(error_summary.values()) == number_of_bad_lines:
+        os.remove(quarantine_file_path)
+
+    # Do not count the header
+    return max(number_of_lines - 1, 0)
+
+
+def count_bad_frames(hex_results_file_path, hex_column_names=None):
+    """
+    Count the telegrams with an invalid CRC (see is_telegram_crc_valid) in each column with hex codes
+    :param hex_results_file_path: path of the file with results in Hex
+    :param hex_column_names: titles of the columns with hex codes to verify (default: all the columns of
+                             INTERPRETED_COLUMNS)
+    :return: number of lines (without the header and the lines too short for the hex columns, e.g. truncated),
+             dictionary title of the hex column -> number of bad frames
+    """
+
+    if hex_column_names is None:
+        hex_column_names = tuple(dict.fromkeys(hex_column_name for _, hex_column_name, _ in INTERPRETED_COLUMNS))
+
+    bad_frames = dict.fromkeys(hex_column_names, 0)
+    number_of_lines = 0
+
+    with open(hex_results_file_path, "r") as hex_results_file:
+        header_hex_results_line = next(hex_results_file, None)
+        if header_hex_results_line is None:
+            return number_of_lines, bad_frames
+        header_hex_results_line_as_list = header_hex_results_line.strip().split(",")
+        hex_column_indexes = [(hex_column_name, get_hex_column_index(header_hex_results_line_as_list,
+                                                                     hex_column_name))
+                              for hex_column_name in hex_column_names]
+        number_of_columns = max([column_index for _, column_index in hex_column_indexes], default=-1) + 1
+        # Repeated telegrams are verified once
+        cached_crc_check = functools.lru_cache(maxsize=DECODE_CACHE_SIZE)(is_telegram_crc_valid)
+
+        for hex_results_line in hex_results_file:
+            hex_results_line_split = hex_results_line.strip().split(",")
+            # Skip the lines without all the hex columns (quarantined by the resilient mode)
+            if len(hex_results_line_split) < number_of_columns:
+                continue
+            number_of_lines += 1
+            for hex_column_name, column_index in hex_column_indexes:
+                if not cached_crc_check(hex_results_line_split[column_index]):
+                    bad_frames[hex_column_name] += 1
+
+    return number_of_lines, bad_frames
+
+
+def get_hex_results_file_paths(directory_or_pattern):
+    """
+    Get the files with results in Hex of a directory or matching a glob pattern, largest file first
+    :param directory_or_pattern: directory (all *.csv files) or glob pattern
+    :return: list with the paths of the files (the generated files are skipped, see GENERATED_FILE_SUFFIXES and
+             GENERATED_FILE_NAMES)
+    """
+
+    if os.path.isdir(directory_or_pattern):
+        directory_or_pattern = os.path.join(directory_or_pattern, "*.csv")
+
+    hex_results_file_paths = [file_path for file_path in glob.glob(directory_or_pattern)
+                              if os.path.isfile(file_path) and not file_path.endswith(GENERATED_FILE_SUFFIXES)
+                              and os.path.basename(file_path) not in GENERATED_FILE_NAMES]
+
+    # Largest file first, so that no single file holds up the end of the batch
+    hex_results_file_paths.sort(key=os.path.getsize, reverse=True)
+    return hex_results_file_paths
+
+
+def get_conversion_cache_key(conversion_options):
+    """
+    Get the key of the conversions with the same converted results: hash of CONVERTER_VERSION and of the options
+    changing the results (see CACHED_CONVERSION_OPTIONS)
+    :param conversion_options: dictionary with the keyword arguments of zx_interpret_results
+    :return: key as hex string
+    """
+
+    cached_options = {}
+    for option_name in CACHED_CONVERSION_OPTIONS:
+        option_value = conversion_options.get(option_name)
+        if option_name == "calibration_profile":
+            option_value = list(option_value or DEFAULT_CALIBRATION_PROFILE)
+        elif isinstance(option_value, (tuple, list)):
+            option_value = list(option_value)
+        cached_options[option_name] = option_value
+
+    return hashlib.sha256(json.dumps([CONVERTER_VERSION, cached_options]).encode("utf-8")).hexdigest()
+
+
+def get_file_content_hash(file_path):
+    """
+    Hash of the content of a file, read in chunks of CHUNK_SIZE bytes
+    :param file_path: path of the file
+    :return: SHA-256 as hex string
+    """
+
+    content_hash = hashlib.sha256()
+    with open(file_path, "rb") as file:
+        for chunk in iter(lambda: file.read(CHUNK_SIZE), b""):
+            content_hash.update(chunk)
+    return content_hash.hexdigest()
+
+
+def make_conversion_cache_entry(hex_results_file_path, hex_results_file_stat, content_hash, cache_key, rows,
+                                bad_frames=""):
+    """
+    Make the cache entry of a converted file
+    :param hex_results_file_path: path of the file with results in Hex
+    :param hex_results_file_stat: os.stat of the file with results in Hex before the conversion
+    :param content_hash: hash of the content of the file with results in Hex (see get_file_content_hash)
+    :param cache_key: key of the conversion (see get_conversion_cache_key)
+    :param rows: number of converted lines
+    :param bad_frames: bad frames of the manifest entry (JSON of the dictionary, "": not counted)
+    :return: dictionary with the cache entry
+    """
+
+    interpreted_results_file_stat = os.stat(hex_results_file_path[:-4] + "_converter.csv")
+    return {"size": hex_results_file_stat.st_size,
+            "mtime_ns": hex_results_file_stat.st_mtime_ns,
+            "content_hash": content_hash,
+            "cache_key": cache_key,
+            "rows": rows,
+            "bad_frames": bad_frames,
+            "output_size": interpreted_results_file_stat.st_size,
+            "output_mtime_ns": interpreted_results_file_stat.st_mtime_ns}
+
+
+def is_conversion_cached(cache_entry, hex_results_file_path, cache_key):
+    """
+    Check if the converted file of a file with results in Hex is up to date. The content of the file is only
+    hashed if its size is unchanged but not its modification time (e.g. copied again), an unchanged content
+    updates the modification time of the cache entry.
+    :param cache_entry: cache entry of the file (see make_conversion_cache_entry, None: not converted yet)
+    :param hex_results_file_path: path of the file with results in Hex
+    :param cache_key: key of the conversion (see get_conversion_cache_key)
+    :return: True if the converted file is up to date
+    """
+
+    if cache_entry is None or cache_entry.get("cache_key") != cache_key:
+        return False
+
+    # The converted file itself has to be the one of the conversion
+    interpreted_results_file_path = hex_results_file_path[:-4] + "_converter.csv"
+    try:
+        interpreted_results_file_stat = os.stat(interpreted_results_file_path)
+        hex_results_file_stat = os.stat(hex_results_file_path)
+    except OSError:
+        return False
+    if interpreted_results_file_stat.st_size != cache_entry["output_size"] \
+            or interpreted_results_file_stat.st_mtime_ns != cache_entry["output_mtime_ns"]:
+        return False
+
+    # Fast check without reading the file
+    if hex_results_file_stat.st_size != cache_entry["size"]:
+        return False
+    if hex_results_file_stat.st_mtime_ns == cache_entry["mtime_ns"]:
+        return True
+
+    # Same size, other modification time: compare the content
+    if get_file_content_hash(hex_results_file_path) != cache_entry["content_hash"]:
+        return False
+    cache_entry["mtime_ns"] = hex_results_file_stat.st_mtime_ns
+    return True
+
+
+def convert_hex_results_file_of_batch(hex_results_file_path, conversion_options=None):
+    """
+    Convert a file of a batch and catch the errors (executed by the worker processes)
+    :param hex_results_file_path: path of the file with results in Hex
+    :param conversion_options: dictionary with the keyword arguments of zx_interpret_results, the
+                               CalibrationProfiles under calibration_profiles (profile chosen by device serial) and
+                               the key of the conversion cache under cache_key (see get_conversion_cache_key)
+    :return: dictionary with the manifest entry of the file, with the new cache entry under CACHE_ENTRY if
+             cache_key is given
+    """
+
+    start_time = time.perf_counter()
+    manifest_entry = {"FILE": hex_results_file_path, "ROWS": "", "ELAPSED_S": "", "STATUS": "OK", "ERROR": "",
+                      "BAD_LINES": "", "BAD_FRAMES": ""}
+
+    try:
+        conversion_options = dict(conversion_options or {})
+        if conversion_options.get("quarantine"):
+            # Number of bad lines of the file in the manifest
+            error_summary = conversion_options["error_summary"] = collections.Counter()
+        if conversion_options.get("check_crc"):
+            # Number of bad frames of each hex column of the file in the manifest
+            bad_frames = conversion_options["bad_frames"] = collections.Counter()
+        calibration_profiles = conversion_options.pop("calibration_profiles", None)
+        if calibration_profiles is not None:
+            conversion_options["calibration_profile"] = get_calibration_profile(calibration_profiles,
+                                                                                hex_results_file_path)
+        cache_key = conversion_options.pop("cache_key", None)
+        if cache_key is not None:
+            # Content of the file which is converted
+            hex_results_file_stat = os.stat(hex_results_file_path)
+            content_hash = get_file_content_hash(hex_results_file_path)
+
+        manifest_entry["ROWS"] = zx_interpret_results(hex_results_file_path, **conversion_options)
+        if conversion_options.get("quarantine"):
+            manifest_entry["BAD_LINES"] = sum(error_summary.values())
+        if conversion_options.get("check_crc"):
+            manifest_entry["BAD_FRAMES"] = json.dumps(dict(bad_frames))
+        if cache_key is not None:
+            manifest_entry["CACHE_ENTRY"] = make_conversion_cache_entry(hex_results_file_path, hex_results_file_stat,
+                                                                        content_hash, cache_key,
+                                                                        manifest_entry["ROWS"],
+                                                                        manifest_entry["BAD_FRAMES"])
+    except Exception as error:
+        # A bad file doesn't abort the batch
+        manifest_entry["STATUS"] = "FAILED"
+        manifest_entry["ERROR"] = f"{type(error).__name__}: {error}"
+
+    manifest_entry["ELAPSED_S"] = f"{time.perf_counter() - start_time:.3f}"
+    return manifest_entry
+
+
+def zx_interpret_results_batch(directory_or_pattern, workers=0, manifest_file_path=None,
+                               decode_cache_size=DECODE_CACHE_SIZE, columns=None, drop_hex_columns=False, where=None,
+                               check_crc=False, calibration_profiles=None, quarantine=False, use_cache=False,
+                               cache_file_path=None):
+    """
+    Convert many files with results in Hex concurrently, one file per worker process at a time.
+    A manifest with the number of rows, the elapsed time and the error of every file is written.
+    With the cache, the files already converted with the same content, converter version and options are skipped
+    (status CACHED in the manifest).
+    :param directory_or_pattern: directory (all *.csv files) or glob pattern of the files with results in Hex
+    :param workers: number of worker processes (0: number of CPUs)
+    :param manifest_file_path: path of the manifest (default: BATCH_MANIFEST_FILE_NAME in the directory of the
+                               first file)
+    :param decode_cache_size: number of results kept in the decode cache of each column (0: no cache)
+    :param columns: titles of the interpreted columns to compute (default: all, see compile_row_decoding_plan)
+    :param drop_hex_columns: remove the columns with the hex codes interpreted by the registry from the output
+    :param where: filters of the lines converted (see compile_row_filter, default: all lines)
+    :param check_crc: add the validity flag of each interpreted column (see CRC_COLUMN_SUFFIX), the number of bad
+                      frames of each hex column of a file is in the manifest (JSON)
+    :param calibration_profiles: CalibrationProfiles of the devices (see load_calibration_profiles, default: the
+                                 constants of DEFAULT_CALIBRATION_PROFILE for all the files)
+    :param quarantine: resilient mode, the number of bad lines of each file is in the manifest (see
+                       zx_interpret_results)
+    :param use_cache: skip the files with an up to date converted file (see is_conversion_cached)
+    :param cache_file_path: path of the cache (default: CONVERSION_CACHE_FILE_NAME in the directory of the first
+                            file)
+    :return: list with the manifest entries (dictionaries) in the order the files were finished
+    """
+
+    conversion_options = {"decode_cache_size": decode_cache_size, "columns": columns,
+                          "drop_hex_columns": drop_hex_columns, "where": where, "check_crc": check_crc,
+                          "calibration_profiles": calibration_profiles, "quarantine": quarantine}
+
+    if workers == 0:
+        workers = os.cpu_count() or 1
+
+    hex_results_file_paths = get_hex_results_file_paths(directory_or_pattern)
+    if manifest_file_path is None:
+        manifest_directory = os.path.dirname(hex_results_file_paths[0]) if hex_results_file_paths else "."
+        manifest_file_path = os.path.join(manifest_directory, BATCH_MANIFEST_FILE_NAME)
+
+    manifest_entries = []
+
+    # Files to convert with their conversion options and cache key
+    file_conversion_options = {hex_results_file_path: conversion_options
+                               for hex_results_file_path in hex_results_file_paths}
+    conversion_cache = None
+    if use_cache:
+        if cache_file_path is None:
+            cache_directory = os.path.dirname(hex_results_file_paths[0]) if hex_results_file_paths else "."
+            cache_file_path = os.path.join(cache_directory, CONVERSION_CACHE_FILE_NAME)
+        conversion_cache = load_json_sidecar(cache_file_path) or {"entries": {}}
+
+        for hex_results_file_path in hex_results_file_paths:
+            # The calibration profile of the file is part of the key
+            cache_key_options = dict(conversion_options)
+            if calibration_profiles is not None:
+                cache_key_options["calibration_profile"] = get_calibration_profile(calibration_profiles,
+                                                                                   hex_results_file_path)
+            cache_key = get_conversion_cache_key(cache_key_options)
+
+            cache_entry = conversion_cache["entries"].get(os.path.abspath(hex_results_file_path))
+            if is_conversion_cached(cache_entry, hex_results_file_path, cache_key):
+                del file_conversion_options[hex_results_file_path]
+                manifest_entries.append({"FILE": hex_results_file_path, "ROWS": cache_entry["rows"], "ELAPSED_S": "",
+                                         "STATUS": "CACHED", "ERROR": "", "BAD_LINES": "",
+                                         "BAD_FRAMES": cache_entry.get("bad_frames", "")})
+            else:
+                file_conversion_options[hex_results_file_path] = dict(conversion_options, cache_key=cache_key)
+
+    with open(manifest_file_path, "w", newline="") as manifest_file:
+        manifest_writer = csv.DictWriter(manifest_file, fieldnames=["FILE", "ROWS", "ELAPSED_S", "STATUS", "ERROR",
+                                                                    "BAD_LINES", "BAD_FRAMES"])
+        manifest_writer.writeheader()
+        manifest_writer.writerows(manifest_entries)
+
+        try:
+            with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+                # The files are submitted largest first
+                futures = {executor.submit(convert_hex_results_file_of_batch, hex_results_file_path,
+                                           file_conversion_options[hex_results_file_path]): hex_results_file_path
+                           for hex_results_file_path in hex_results_file_paths
+                           if hex_results_file_path in file_conversion_options}
+
+                for future in concurrent.futures.as_completed(futures):
+                    try:
+                        manifest_entry = future.result()
+                    except Exception as error:
+                        # The worker process itself failed
+                        manifest_entry = {"FILE": futures[future], "ROWS": "", "ELAPSED_S": "", "STATUS": "FAILED",
+                                          "ERROR": f"{type(error).__name__}: {error}", "BAD_LINES": "",
+                                          "BAD_FRAMES": ""}
+
+                    # Keep the cache entry of the converted file
+                    cache_entry = manifest_entry.pop("CACHE_ENTRY", None)
+                    if conversion_cache is not None:
+                        if cache_entry is not None:
+                            conversion_cache["entries"][os.path.abspath(futures[future])] = cache_entry
+                        else:
+                            conversion_cache["entries"].pop(os.path.abspath(futures[future]), None)
+
+                    # Write the entry as soon as the file is finished
+                    manifest_writer.writerow(manifest_entry)
+                    manifest_file.flush()
+                    manifest_entries.append(manifest_entry)
+
+        finally:
+            # Also the files converted before an interruption are kept in the cache
+            if conversion_cache is not None:
+                save_json_sidecar(cache_file_path, conversion_cache)
+
+    return manifest_entries
+
+
+def get_serial_and_run_date(hex_results_file_path):
+    """
+    Get the device serial and the run date from the name of a file with results in Hex,
+    e.g. 2300003506_TempZyklen_230727.csv -> ("2300003506", "2023-07-27")
+    :param hex_results_file_path: path of the file with results in Hex
+    :return: device serial and run date (ISO format)
+    """
+
+    file_name_match = RESULTS_FILE_NAME_PATTERN.match(os.path.basename(hex_results_file_path))
+    if file_name_match is None:
+        raise ValueError(f"No device serial and run date in the file name {hex_results_file_path}, expected "
+                         f"<serial>_TempZyklen_<yymmdd>.csv")
+
+    run_date = datetime.datetime.strptime(file_name_match.group("run_date"), "%y%m%d").date()
+    return file_name_match.group("serial"), run_date.isoformat()
+
+
+def create_results_database(database_connection):
+    """
+    Create the tables and indexes of the SQLite database with the test results (if they don't exist).
+    The table results contains for every line the device serial, the time stamp, the raw values of the filter fields
+    (see FILTER_FIELDS) in the columns raw_<field> (e.g. raw_errors and raw_warnings with the error and warning masks
+    as integers) and the interpreted columns as text.
+    :param database_connection: connection to the SQLite database
+    :return:
+    """
+
+    filter_field_columns = [f"raw_{field_name} {SQLITE_FILTER_FIELD_TYPES.get(value_type, 'TEXT')}"
+                            for field_name, (_, _, value_type) in FILTER_FIELDS.items()]
+    interpreted_columns = [f"{column_name} TEXT" for column_name in INTERPRETED_COLUMN_NAMES]
+
+    database_connection.executescript(f"""
+        CREATE TABLE IF NOT EXISTS source_files (
+            source_file_id INTEGER PRIMARY KEY,
+            path TEXT UNIQUE NOT NULL,
+            device TEXT,
+            run_date TEXT,
+            size INTEGER,
+            mtime REAL,
+            rows INTEGER);
+        CREATE TABLE IF NOT EXISTS results (
+            source_file_id INTEGER NOT NULL REFERENCES source_files(source_file_id),
+            line_number INTEGER NOT NULL,
+            device TEXT,
+            timestamp TEXT,
+            {", ".join(filter_field_columns + interpreted_columns)});
+        CREATE INDEX IF NOT EXISTS results_source_file ON results (source_file_id);
+        CREATE INDEX IF NOT EXISTS results_device_timestamp ON results (device, timestamp);
+        CREATE INDEX IF NOT EXISTS results_timestamp ON results (timestamp);
+        CREATE INDEX IF NOT EXISTS results_raw_errors ON results (raw_errors);
+        CREATE INDEX IF NOT EXISTS results_raw_warnings ON results (raw_warnings);
+        """)
+
+
+def iter_results_database_rows(hex_results_lines, header_hex_results_line_as_list, source_file_id, device,
+                               decode_cache_size=DECODE_CACHE_SIZE, where=None, calibration_profile=None):
+    """
+    Convert the lines of the test results to the rows of the table results (see create_results_database)
+    :param hex_results_lines: iterable with the lines of the file with results in Hex (without header)
+    :param header_hex_results_line_as_list: header line of the file with results in Hex split at the comma
+    :param source_file_id: id of the file in the table source_files
+    :param device: device serial
+    :param decode_cache_size: number of results kept in the decode cache of each column (0: no cache)
+    :param where: filters of the lines stored (see compile_row_filter, default: all lines)
+    :param calibration_profile: CalibrationProfile of the analog values (default: DEFAULT_CALIBRATION_PROFILE)
+    :return: generator of tuples with the values of the columns of the table results
+    """
+
+    row_decoding_plan = compile_row_decoding_plan(header_hex_results_line_as_list, decode_cache_size, where=where,
+                                                  calibration_profile=calibration_profile)
+    steps = row_decoding_plan.steps
+    row_filter = row_decoding_plan.row_filter
+
+    # Index of the time stamp and raw value functions of the filter fields
+    timestamp_column_index = header_hex_results_line_as_list.index(TIMESTAMP_COLUMN_NAME) \
+        if TIMESTAMP_COLUMN_NAME in header_hex_results_line_as_list else None
+    raw_value_steps = tuple((get_hex_column_index(header_hex_results_line_as_list, hex_column_name), get_raw_value)
+                            for hex_column_name, get_raw_value, _ in FILTER_FIELDS.values())
+
+    # The first line after the header is the line 2 of the file
+    for line_number, hex_results_line in enumerate(hex_results_lines, start=2):
+        hex_results_line_split = hex_results_line.strip().split(",")
+        if row_filter is not None and not row_filter(hex_results_line_split):
+            continue
+
+        timestamp = hex_results_line_split[timestamp_column_index] if timestamp_column_index is not None else None
+        yield (source_file_id, line_number, device, timestamp,
+               *[get_raw_value(hex_results_line_split[column_index])
+                 for column_index, get_raw_value in raw_value_steps],
+               *[converter(hex_results_line_split[column_index]) for column_index, converter in steps])
+
+
+def zx_results_to_sqlite(hex_results_file_path, database_path, decode_cache_size=DECODE_CACHE_SIZE, where=None,
+                         calibration_profile=None):
+    """
+    Store the test results of a file in a SQLite database (see create_results_database), in a single transaction
+    with inserts of SQLITE_ROWS_PER_INSERT rows. Storing a file again replaces its rows.
+    :param hex_results_file_path: path of the file with results in Hex (named <serial>_TempZyklen_<yymmdd>.csv)
+    :param database_path: path of the SQLite database (created if it doesn't exist)
+    :param decode_cache_size: number of results kept in the decode cache of each column (0: no cache)
+    :param where: filters of the lines stored (see compile_row_filter, default: all lines)
+    :param calibration_profile: CalibrationProfile of the analog values (default: DEFAULT_CALIBRATION_PROFILE)
+    :return: number of stored lines
+    """
+
+    device, run_date = get_serial_and_run_date(hex_results_file_path)
+    source_file_path = os.path.abspath(hex_results_file_path)
+    source_file_stat = os.stat(hex_results_file_path)
+    number_of_database_columns = 4 + len(FILTER_FIELDS) + len(INTERPRETED_COLUMN_NAMES)
+    insert_statement = f"INSERT INTO results VALUES ({', '.join(['?'] * number_of_database_columns)})"
+
+    database_connection = sqlite3.connect(database_path)
+    try:
+        create_results_database(database_connection)
+
+        # Single transaction: the previous rows of the file are replaced by the new ones, or nothing changes
+        with database_connection, open(hex_results_file_path, "r") as hex_results_file:
+            database_connection.execute("INSERT OR IGNORE INTO source_files (path) VALUES (?)", (source_file_path,))
+            source_file_id = database_connection.execute("SELECT source_file_id FROM source_files WHERE path = ?",
+                                                         (source_file_path,)).fetchone()[0]
+            database_connection.execute("DELETE FROM results WHERE source_file_id = ?", (source_file_id,))
+
+            number_of_lines = 0
+            header_hex_results_line = next(hex_results_file, None)
+            if header_hex_results_line is not None:
+                database_rows = iter_results_database_rows(hex_results_file,
+                                                           header_hex_results_line.strip().split(","),
+                                                           source_file_id, device, decode_cache_size, where,
+                                                           calibration_profile)
+                while True:
+                    database_rows_to_insert = list(itertools.islice(database_rows, SQLITE_ROWS_PER_INSERT))
+                    if not database_rows_to_insert:
+                        break
+                    database_connection.executemany(insert_statement, database_rows_to_insert)
+                    number_of_lines += len(database_rows_to_insert)
+
+            database_connection.execute("UPDATE source_files SET device = ?, run_date = ?, size = ?, mtime = ?, "
+                                        "rows = ? WHERE source_file_id = ?",
+                                        (device, run_date, source_file_stat.st_size, source_file_stat.st_mtime,
+                                         number_of_lines, source_file_id))
+    finally:
+        database_connection.close()
+
+    return number_of_lines
+
+
+def load_json_sidecar(sidecar_file_path):
+    """
+    Load a JSON file saved next to a file with results in Hex (checkpoint, index)
+    :param sidecar_file_path: path of the JSON file
+    :return: content of the file (None if there is no valid file)
+    """
+
+    try:
+        with open(sidecar_file_path, "r") as sidecar_file:
+            return json.load(sidecar_file)
+    except (OSError, ValueError):
+        return None
+
+
+def fsync_directory(directory_path):
+    """
+    Flush the entries of a directory (e.g. a file renamed in it) to the disk. Directories can't be opened on Windows,
+    where nothing is done.
+    :param directory_path: path of the directory ("" is the current directory)
+    :return: NONE
+    """
+
+    if os.name == "nt":
+        return
+
+    directory_file_descriptor = os.open(directory_path or ".", os.O_RDONLY)
+    try:
+        os.fsync(directory_file_descriptor)
+    finally:
+        os.close(directory_file_descriptor)
+
+
+def save_json_sidecar(sidecar_file_path, sidecar, durable=False):
+    """
+    Save a JSON file next to a file with results in Hex (replaced atomically)
+    :param sidecar_file_path: path of the JSON file
+    :param sidecar: content of the file
+    :param durable: the new content and its rename are on the disk when the function returns (checkpoints which
+                    must survive a power loss)
+    :return: NONE
+    """
+
+    with open(sidecar_file_path + ".tmp", "w") as sidecar_file:
+        json.dump(sidecar, sidecar_file)
+        if durable:
+            sidecar_file.flush()
+            os.fsync(sidecar_file.fileno())
+    os.replace(sidecar_file_path + ".tmp", sidecar_file_path)
+    if durable:
+        fsync_directory(os.path.dirname(sidecar_file_path))
+
+
+def is_index_up_to_date(index, hex_results_file_stat):
+    """
+    Check if an index was built for the current content of the file (same size and modification time)
+    :param index: dictionary with the index (None if there is no index)
+    :param hex_results_file_stat: os.stat of the file with results in Hex
+    :return: True if the index can be used
+    """
+
+    return index is not None and index.get("source_size") == hex_results_file_stat.st_size \
+        and index.get("source_mtime") == hex_results_file_stat.st_mtime
+
+
+def get_flag_index_file_path(hex_results_file_path):
+    """
+    Get the path of the index of the error and warning flags of a file with results in Hex
+    :param hex_results_file_path: path of the file with results in Hex
+    :return: path of the index
+    """
+
+    return hex_results_file_path[:-4] + FLAG_INDEX_FILE_SUFFIX
+
+
+def row_ids_to_bitmap(row_ids, number_of_rows):
+    """
+    Convert sorted row ids to a bitmap (bit row_id % 8 of the byte row_id // 8)
+    :param row_ids: row ids
+    :param number_of_rows: number of rows of the file
+    :return: bitmap as bytes
+    """
+
+    bitmap = bytearray((number_of_rows + 7) // 8)
+    for row_id in row_ids:
+        bitmap[row_id >> 3] |= 1 << (row_id & 7)
+    return bytes(bitmap)
+
+
+def bitmap_to_row_ids(bitmap):
+    """
+    Convert a bitmap (as int, bit n set for the row n) to the sorted row ids
+    :param bitmap: bitmap as int
+    :return: list with the row ids
+    """
+
+    row_ids = []
+    for byte_number, byte_value in enumerate(bitmap.to_bytes((bitmap.bit_length() + 7) // 8, "little")):
+        if byte_value:
+            row_ids.extend(byte_number * 8 + bit_number for bit_number in range(8) if byte_value & (1 << bit_number))
+    return row_ids
+
+
+def zx_build_flag_index(hex_results_file_path):
+    """
+    Build the index of the error and warning flags of a file with results in Hex: for every flag set at least once,
+    the zlib compressed bitmap of the rows with the flag, the number of rows and the first row.
+    The rows whose flags are unknown (truncated line, status response with wrong hex digits) are not aborting the
+    build, they are in the bitmap of the bad rows (see get_bad_row_ids).
+    The rows are numbered from 0 (first line after the header). The index is saved next to the file
+    (see get_flag_index_file_path) with the size and modification time of the file.
+    :param hex_results_file_path: path of the file with results in Hex
+    :return: dictionary with the index (see load_flag_index)
+    """
+
+    hex_results_file_stat = os.stat(hex_results_file_path)
+
+    # Row ids of every error and warning bit
+    error_row_ids = [[] for _ in ERROR_FLAG_NAMES]
+    warning_row_ids = [[] for _ in WARNING_FLAG_NAMES]
+    bad_row_ids = []
+    number_of_rows = 0
+
+    with open(hex_results_file_path, "r") as hex_results_file:
+        header_hex_results_line = next(hex_results_file, None)
+        if header_hex_results_line is not None:
+            status_column_index = get_hex_column_index(header_hex_results_line.strip().split(","), "GET_STATUS")
+
+            for row_id, hex_results_line in enumerate(hex_results_file):
+                number_of_rows = row_id + 1
+                try:
+                    status_response = hex_results_line.strip().split(",")[status_column_index]
+                    error_word = get_raw_error_word(status_response)
+                    warning_word = get_raw_warning_word(status_response)
+                except (IndexError, ValueError):
+                    bad_row_ids.append(row_id)
+                    continue
+                # A sign is not a hex digit, but int accepts it
+                if error_word is not None and (error_word < 0 or warning_word < 0):
+                    bad_row_ids.append(row_id)
+                    continue
+
+                for flag_word, flag_row_ids in ((error_word, error_row_ids), (warning_word, warning_row_ids)):
+                    # Only the set bits (no flag word without valid status response)
+                    while flag_word:
+                        lowest_bit = flag_word & -flag_word
+                        flag_row_ids[lowest_bit.bit_length() - 1].append(row_id)
+                        flag_word ^= lowest_bit
+
+    flags = {}
+    for flag_names, flags_row_ids in ((ERROR_FLAG_NAMES, error_row_ids), (WARNING_FLAG_NAMES, warning_row_ids)):
+        for flag_name, row_ids in zip(flag_names, flags_row_ids):
+            if row_ids:
+                bitmap = zlib.compress(row_ids_to_bitmap(row_ids, number_of_rows), 9)
+                flags[flag_name] = {"count": len(row_ids),
+                                    "first_row": row_ids[0],
+                                    "bitmap": base64.b64encode(bitmap).decode("ascii")}
+
+    flag_index = {"source_size": hex_results_file_stat.st_size,
+                  "source_mtime": hex_results_file_stat.st_mtime,
+                  "rows": number_of_rows,
+                  "flags": flags,
+                  "bad_rows": {"count": len(bad_row_ids),
+                               "bitmap": base64.b64encode(zlib.compress(row_ids_to_bitmap(bad_row_ids, number_of_rows),
+                                                                        9)).decode("ascii")}}
+
+    save_json_sidecar(get_flag_index_file_path(hex_results_file_path), flag_index)
+
+    return flag_index
+
+
+def load_flag_index(hex_results_file_path):
+    """
+    Load the index of the error and warning flags of a file, built again if it is missing or out of date
+    :param hex_results_file_path: path of the file with results in Hex
+    :return: dictionary with the index: size and modification time of the file, number of rows, for each flag
+             set at least once a dictionary with the number of rows (count), the first row (first_row) and the
+             compressed bitmap (bitmap) and the number and compressed bitmap of the bad rows (bad_rows)
+    """
+
+    flag_index = load_json_sidecar(get_flag_index_file_path(hex_results_file_path))
+    # Index built before the bad rows were counted
+    if not is_index_up_to_date(flag_index, os.stat(hex_results_file_path)) or "bad_rows" not in flag_index:
+        flag_index = zx_build_flag_index(hex_results_file_path)
+
+    return flag_index
+
+
+def get_flag_bitmap(flag_index, flag_name):
+    """
+    Get the bitmap of the rows with a flag
+    :param flag_index: index of the flags (see load_flag_index)
+    :param flag_name: error or warning flag, e.g. ERROR_OVER_CURRENT
+    :return: bitmap as int (bit n set for the row n)
+    """
+
+    if flag_name not in ERROR_FLAG_NAMES and flag_name not in WARNING_FLAG_NAMES:
+        raise ValueError(f"Unknown flag {flag_name}")
+
+    if flag_name not in flag_index["flags"]:
+        return 0
+    return int.from_bytes(zlib.decompress(base64.b64decode(flag_index["flags"][flag_name]["bitmap"])), "little")
+
+
+def query_flag_index(flag_index, flag_names):
+    """
+    Get the rows with all the flags set, e.g. ["ERROR_OVER_CURRENT", "WARNING_EXTRAPOLATION"]
+    :param flag_index: index of the flags (see load_flag_index)
+    :param flag_names: error and warning flags
+    :return: list with the sorted row ids (0: first line after the header)
+    """
+
+    bitmap = -1
+    for flag_name in flag_names:
+        bitmap &= get_flag_bitmap(flag_index, flag_name)
+        if not bitmap:
+            return []
+    return bitmap_to_row_ids(bitmap) if flag_names else []
+
+
+def get_bad_row_ids(flag_index):
+    """
+    Get the rows whose flags are unknown (truncated line, status response with wrong hex digits), never returned by
+    query_flag_index
+    :param flag_index: index of the flags (see load_flag_index)
+    :return: list with the sorted row ids
+    """
+
+    return bitmap_to_row_ids(int.from_bytes(zlib.decompress(base64.b64decode(flag_index["bad_rows"]["bitmap"])),
+                                            "little"))
+
+
+def get_first_flag_occurrences(flag_index):
+    """
+    Get the first row of each flag set at least once
+    :param flag_index: index of the flags (see load_flag_index)
+    :return: dictionary flag -> first row id
+    """
+
+    return {flag_name: flag_entry["first_row"] for flag_name, flag_entry in flag_index["flags"].items()}
+
+
+def get_row_index_file_path(hex_results_file_path):
+    """
+    Get the path of the index of the byte offsets of the rows of a file with results in Hex
+    :param hex_results_file_path: path of the file with results in Hex
+    :return: path of the index
+    """
+
+    return hex_results_file_path[:-4] + ROW_INDEX_FILE_SUFFIX
+
+
+def zx_build_row_index(hex_results_file_path, row_index_interval=ROW_INDEX_INTERVAL):
+    """
+    Build the sparse index of the rows of a file with results in Hex: every row_index_interval rows the row id
+    (0: first line after the header), the byte offset of the line and its time stamp (column TIMESTAMP_COLUMN_NAME,
+    None without this column). The index is saved next to the file (see get_row_index_file_path) with the size and
+    modification time of the file.
+    :param hex_results_file_path: path of the file with results in Hex
+    :param row_index_interval: number of rows between two entries
+    :return: dictionary with the index (see load_row_index)
+    """
+
+    hex_results_file_stat = os.stat(hex_results_file_path)
+    row_index_entries = []
+    number_of_rows = 0
+
+    with open(hex_results_file_path, "rb") as hex_results_file:
+        header_hex_results_bytes = hex_results_file.readline()
+        header_hex_results_line_as_list = header_hex_results_bytes.decode("latin-1").strip().split(",")
+        timestamp_column_index = header_hex_results_line_as_list.index(TIMESTAMP_COLUMN_NAME) \
+            if TIMESTAMP_COLUMN_NAME in header_hex_results_line_as_list else None
+
+        line_offset = len(header_hex_results_bytes)
+        for row_id, hex_results_line_bytes in enumerate(hex_results_file):
+            if row_id % row_index_interval == 0:
+                timestamp = None
+                if timestamp_column_index is not None:
+                    timestamp = hex_results_line_bytes.decode("latin-1").strip().split(",")[timestamp_column_index]
+                row_index_entries.append([row_id, line_offset, timestamp])
+            line_offset += len(hex_results_line_bytes)
+            number_of_rows = row_id + 1
+
+    row_index = {"source_size": hex_results_file_stat.st_size,
+                 "source_mtime": hex_results_file_stat.st_mtime,
+                 "interval": row_index_interval,
+                 "rows": number_of_rows,
+                 "entries": row_index_entries}
+    save_json_sidecar(get_row_index_file_path(hex_results_file_path), row_index)
+
+    return row_index
+
+
+def load_row_index(hex_results_file_path, row_index_interval=ROW_INDEX_INTERVAL):
+    """
+    Load the sparse index of the rows of a file, built again if it is missing, out of date or has another interval
+    :param hex_results_file_path: path of the file with results in Hex
+    :param row_index_interval: number of rows between two entries
+    :return: dictionary with the index: size and modification time of the file, interval, number of rows and the
+             entries [row id, byte offset, time stamp]
+    """
+
+    row_index = load_json_sidecar(get_row_index_file_path(hex_results_file_path))
+    if not is_index_up_to_date(row_index, os.stat(hex_results_file_path)) \
+            or row_index.get("interval") != row_index_interval:
+        row_index = zx_build_row_index(hex_results_file_path, row_index_interval)
+
+    return row_index
+
+
+def iter_interpreted_rows_from_entry(hex_results_file_path, row_index_entry, plan_options=None):
+    """
+    Read the file with results in Hex from an entry of the row index and yield the interpreted rows
+    :param hex_results_file_path: path of the file with results in Hex
+    :param row_index_entry: entry of the row index [row id, byte offset, time stamp]
+    :param plan_options: dictionary with the keyword arguments of compile_row_decoding_plan (no filters)
+    :return: generator of (row id, time stamp, list with the (kept) columns of the line followed by the interpreted
+             values)
+    """
+
+    # The lines end with "\n" like the lines of the row index (see zx_build_row_index), a lone "\r" is in a line
+    with open(hex_results_file_path, "r", newline="\n") as hex_results_file:
+        header_hex_results_line_as_list = next(hex_results_file).strip().split(",")
+    row_decoding_plan = compile_row_decoding_plan(header_hex_results_line_as_list, **(plan_options or {}))
+    kept_column_indexes = row_decoding_plan.kept_column_indexes
+    timestamp_column_index = header_hex_results_line_as_list.index(TIMESTAMP_COLUMN_NAME) \
+        if TIMESTAMP_COLUMN_NAME in header_hex_results_line_as_list else None
+
+    with open(hex_results_file_path, "rb") as hex_results_file:
+        # Decode the lines from the offset of the entry, split at the same new lines as the index
+        hex_results_file.seek(row_index_entry[1])
+        for row_id, hex_results_line in enumerate(io.TextIOWrapper(hex_results_file, newline="\n"),
+                                                  start=row_index_entry[0]):
+            hex_results_line_split = hex_results_line.strip().split(",")
+            timestamp = hex_results_line_split[timestamp_column_index] if timestamp_column_index is not None else None
+            interpreted_values = interpret_hex_results_line_split(hex_results_line_split, row_decoding_plan)
+            if kept_column_indexes is not None:
+                hex_results_line_split = [hex_results_line_split[column_index] for column_index in kept_column_indexes]
+            yield row_id, timestamp, hex_results_line_split + interpreted_values
+
+
+def read_interpreted_rows_by_row_range(hex_results_file_path, start_row, stop_row, plan_options=None,
+                                       row_index_interval=ROW_INDEX_INTERVAL):
+    """
+    Interpret only the rows start_row <= row id < stop_row of a file, read from the nearest entry of the row index
+    :param hex_results_file_path: path of the file with results in Hex
+    :param start_row: first row id (0: first line after the header)
+    :param stop_row: row id after the last row
+    :param plan_options: dictionary with the keyword arguments of compile_row_decoding_plan (no filters)
+    :param row_index_interval: number of rows between two entries of the row index
+    :return: list of (row id, list with the (kept) columns of the line followed by the interpreted values)
+    """
+
+    row_index_entries = load_row_index(hex_results_file_path, row_index_interval)["entries"]
+    if start_row >= stop_row or not row_index_entries:
+        return []
+
+    # Last entry before the first row
+    entry_number = bisect.bisect_right([row_index_entry[0] for row_index_entry in row_index_entries], start_row) - 1
+    interpreted_rows = []
+    for row_id, _, interpreted_row in iter_interpreted_rows_from_entry(hex_results_file_path,
+                                                                       row_index_entries[max(entry_number, 0)],
+                                                                       plan_options):
+        if row_id >= stop_row:
+            break
+        if row_id >= start_row:
+            interpreted_rows.append((row_id, interpreted_row))
+
+    return interpreted_rows
+
+
+def read_interpreted_rows_by_time_range(hex_results_file_path, start_time, stop_time, plan_options=None,
+                                        row_index_interval=ROW_INDEX_INTERVAL):
+    """
+    Interpret only the rows with start_time <= time stamp <= stop_time of a file, read from the nearest entry of the
+    row index. The time stamps are compared as strings and have to increase with the rows.
+    :param hex_results_file_path: path of the file with results in Hex (with the column TIMESTAMP_COLUMN_NAME)
+    :param start_time: first time stamp, e.g. "2023-07-27 01:00:00"
+    :param stop_time: last time stamp
+    :param plan_options: dictionary with the keyword arguments of compile_row_decoding_plan (no filters)
+    :param row_index_interval: number of rows between two entries of the row index
+    :return: list of (row id, list with the (kept) columns of the line followed by the interpreted values)
+    """
+
+    row_index_entries = load_row_index(hex_results_file_path, row_index_interval)["entries"]
+    if not row_index_entries:
+        return []
+    if row_index_entries[0][2] is None:
+        raise ValueError(f"No column {TIMESTAMP_COLUMN_NAME} in {hex_results_file_path}")
+
+    # Last entry before the first time stamp
+    entry_number = bisect.bisect_left([row_index_entry[2] for row_index_entry in row_index_entries], start_time) - 1
+    interpreted_rows = []
+    for row_id, timestamp, interpreted_row in iter_interpreted_rows_from_entry(hex_results_file_path,
+                                                                               row_index_entries[max(entry_number, 0)],
+                                                                               plan_options):
+        if timestamp > stop_time:
+            break
+        if timestamp >= start_time:
+            interpreted_rows.append((row_id, interpreted_row))
+
+    return interpreted_rows
+
+
+def get_end_of_last_complete_line(file_path, start_offset, end_offset):
+    """
+    Get the byte offset after the last new line character between two offsets of a file
+    :param file_path: path of the file
+    :param start_offset: byte offset of the start of the searched range
+    :param end_offset: byte offset of the end of the searched range
+    :return: byte offset after the last new line character (start_offset if there is none)
+    """
+
+    block_size = 64 * 1024
+
+    with open(file_path, "rb") as file:
+        # Search backwards block by block
+        block_end_offset = end_offset
+        while block_end_offset > start_offset:
+            block_start_offset = max(start_offset, block_end_offset - block_size)
+            file.seek(block_start_offset)
+            new_line_index = file.read(block_end_offset - block_start_offset).rfind(b"\n")
+            if new_line_index >= 0:
+                return block_start_offset + new_line_index + 1
+            block_end_offset = block_start_offset
+
+    return start_offset
+
+
+def load_follow_checkpoint(follow_checkpoint_file_path):
+    """
+    Load the checkpoint of the follow mode
+    :param follow_checkpoint_file_path: path of the checkpoint
+    :return: dictionary with the checkpoint (None if there is no valid checkpoint)
+    """
+
+    follow_checkpoint = load_json_sidecar(follow_checkpoint_file_path)
+    return follow_checkpoint if isinstance(follow_checkpoint, dict) else None
+
+
+def save_follow_checkpoint(follow_checkpoint_file_path, follow_checkpoint):
+    """
+    Save the checkpoint of the follow mode (replaced atomically)
+    :param follow_checkpoint_file_path: path of the checkpoint
+    :param follow_checkpoint: dictionary with the checkpoint
+    :return: NONE
+    """
+
+    save_json_sidecar(follow_checkpoint_file_path, follow_checkpoint)
+
+
+def zx_interpret_results_increment(hex_results_file_path, chunk_size=CHUNK_SIZE, decode_cache_size=DECODE_CACHE_SIZE,
+                                   columns=None, drop_hex_columns=False, where=None, calibration_profile=None):
+    """
+    Convert only the complete lines appended to the file with results in Hex since the last call and append them
+    to the file with converted results. The byte offset reached is kept in a checkpoint next to the converted file.
+    A partial last line is converted with the next call; a rotated (replaced or truncated) file or a change of the
+    selected columns, filters or calibration profile converts the file again from the start.
+    :param hex_results_file_path: path of the file with results in Hex
+    :param chunk_size: size in bytes of the ranges converted at once (a checkpoint is saved after each range)
+    :param decode_cache_size: number of results kept in the decode cache of each column (0: no cache)
+    :param columns: titles of the interpreted columns to compute (default: all, see compile_row_decoding_plan)
+    :param drop_hex_columns: remove the columns with the hex codes interpreted by the registry from the output
+    :param where: filters of the lines converted (see compile_row_filter, default: all lines)
+    :param calibration_profile: CalibrationProfile of the analog values (default: DEFAULT_CALIBRATION_PROFILE)
+    :return: number of converted lines (without the header)
+    """
+
+    plan_options = {"decode_cache_size": decode_cache_size, "columns": columns, "drop_hex_columns": drop_hex_columns,
+                    "where": where, "calibration_profile": calibration_profile}
+    # Options changing the content of the converted file
+    output_options = {"columns": list(columns) if columns is not None else None,
+                      "drop_hex_columns": drop_hex_columns,
+                      "where": list(where) if where else None,
+                      "calibration_profile": list(calibration_profile or DEFAULT_CALIBRATION_PROFILE)}
+
+    interpreted_results_file_path = hex_results_file_path[:-4] + "_converter.csv"
+    follow_checkpoint_file_path = hex_results_file_path[:-4] + FOLLOW_CHECKPOINT_FILE_SUFFIX
+
+    hex_results_file_stat = os.stat(hex_results_file_path)
+    with open(hex_results_file_path, "rb") as hex_results_file:
+        header_hex_results_bytes = hex_results_file.readline()
+
+    # Wait for a complete header line
+    if not header_hex_results_bytes.endswith(b"\n"):
+        return 0
+
+    # Check if the checkpoint still belongs to the file with results in Hex and to the converted file (a checkpoint
+    # with missing values, e.g. of an older version or edited, is stale too)
+    follow_checkpoint = load_follow_checkpoint(follow_checkpoint_file_path)
+    if follow_checkpoint is not None:
+        if follow_checkpoint.get("file_id") != [hex_results_file_stat.st_dev, hex_results_file_stat.st_ino] \
+                or not isinstance(follow_checkpoint.get("input_offset"), int) \
+                or not isinstance(follow_checkpoint.get("output_offset"), int) \
+                or hex_results_file_stat.st_size < follow_checkpoint["input_offset"] \
+                or header_hex_results_bytes.decode("latin-1") != follow_checkpoint.get("header") \
+                or follow_checkpoint.get("output_options") != output_options \
+                or not os.path.exists(interpreted_results_file_path) \
+                or os.path.getsize(interpreted_results_file_path) < follow_checkpoint["output_offset"]:
+            follow_checkpoint = None
+
+    header_hex_results_line = io.TextIOWrapper(io.BytesIO(header_hex_results_bytes)).readline()
+
+    if follow_checkpoint is None:
+        # Start from the beginning
+        with open(interpreted_results_file_path, "w") as interpreted_results_file:
+            interpreted_results_file.write(convert_header_hex_results_line(header_hex_results_line, plan_options)[1])
+
+        follow_checkpoint = {"file_id": [hex_results_file_stat.st_dev, hex_results_file_stat.st_ino],
+                             "header": header_hex_results_bytes.decode("latin-1"),
+                             "output_options": output_options,
+                             "input_offset": len(header_hex_results_bytes),
+                             "output_offset": os.path.getsize(interpreted_results_file_path)}
+        save_follow_checkpoint(follow_checkpoint_file_path, follow_checkpoint)
+
+    # Remove what was written after the last checkpoint (interrupted refresh)
+    os.truncate(interpreted_results_file_path, follow_checkpoint["output_offset"])
+
+    # Only complete lines are converted
+    end_offset = get_end_of_last_complete_line(hex_results_file_path, follow_checkpoint["input_offset"],
+                                               hex_results_file_stat.st_size)
+
+    number_of_lines = 0
+
+    for start_offset, range_end_offset in get_line_aligned_byte_ranges(hex_results_file_path,
+                                                                       follow_checkpoint["input_offset"],
+                                                                       chunk_size, end_offset):
+        converted_lines, number_of_range_lines, _ = convert_hex_results_byte_range(hex_results_file_path,
+                                                                                   header_hex_results_line,
+                                                                                   start_offset, range_end_offset,
+                                                                                   plan_options)
+        with open(interpreted_results_file_path, "a") as interpreted_results_file:
+            interpreted_results_file.write(converted_lines)
+        number_of_lines += number_of_range_lines
+
+        # Save the reached offsets
+        follow_checkpoint["input_offset"] = range_end_offset
+        follow_checkpoint["output_offset"] = os.path.getsize(interpreted_results_file_path)
+        save_follow_checkpoint(follow_checkpoint_file_path, follow_checkpoint)
+
+    return number_of_lines
+
+
+def zx_follow_results(hex_results_file_path, poll_interval=FOLLOW_POLL_INTERVAL, number_of_refreshes=None,
+                      decode_cache_size=DECODE_CACHE_SIZE, columns=None, drop_hex_columns=False, where=None,
+                      calibration_profile=None):
+    """
+    Follow a file with results in Hex while the test is running: the newly appended lines are converted every
+    poll_interval seconds (see zx_interpret_results_increment). Stops with Ctrl-C.
+    :param hex_results_file_path: path of the file with results in Hex
+    :param poll_interval: seconds between two refreshes
+    :param number_of_refreshes: number of refreshes before returning (None: until interrupted)
+    :param decode_cache_size: number of results kept in the decode cache of each column (0: no cache)
+    :param columns: titles of the interpreted columns to compute (default: all, see compile_row_decoding_plan)
+    :param drop_hex_columns: remove the columns with the hex codes interpreted by the registry from the output
+    :param where: filters of the lines converted (see compile_row_filter, default: all lines)
+    :param calibration_profile: CalibrationProfile of the analog values (default: DEFAULT_CALIBRATION_PROFILE)
+    :return: number of converted lines (without the header)
+    """
+
+    number_of_lines = 0
+    refresh_counter = 0
+
+    try:
+        while number_of_refreshes is None or refresh_counter < number_of_refreshes:
+            if refresh_counter:
+                time.sleep(poll_interval)
+            if os.path.exists(hex_results_file_path):
+                number_of_lines += zx_interpret_results_increment(hex_results_file_path,
+                                                                  decode_cache_size=decode_cache_size,
+                                                                  columns=columns, drop_hex_columns=drop_hex_columns,
+                                                                  where=where, calibration_profile=calibration_profile)
+            refresh_counter += 1
+    except KeyboardInterrupt:
+        pass
+
+    return number_of_lines
+
+
+if __name__ == "__main__":
+
+    """ Call of the functions """
+
+    """ Test of interpret_get_smcu_status """
+    # print(interpret_get_smcu_status("0030141f601213407f"))
+
+    """ Test of convert_status_byte """
+    # print(convert_status_byte("ff0100000000000000000a1a"))
+
+    """ Test of convert_pd_value(pd_value) """
+    # print(convert_pd_value(""))
+
+    """ Test of zx_interpret_results """
+    parser = argparse.ArgumentParser(description="Convert some columns of the ZX test results from hex in clear text")
+    parser.add_argument("hex_results_file_path", nargs="?", default="2300003506_TempZyklen_230727.csv",
+                        help="path of the file with results in Hex, or a directory or glob pattern to convert "
+                             "many files")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="number of worker processes converting the file (or the files) in parallel "
+                             "(0: number of CPUs)")
+    parser.add_argument("--manifest", default=None,
+                        help="path of the manifest written when converting a directory or glob pattern")
+    parser.add_argument("--follow", action="store_true",
+                        help="keep converting the lines appended to the file until interrupted with Ctrl-C")
+    parser.add_argument("--poll-interval", type=float, default=FOLLOW_POLL_INTERVAL,
+                        help="seconds between two refreshes in follow mode")
+    parser.add_argument("--cache-size", type=int, default=DECODE_CACHE_SIZE,
+                        help="number of converted values kept in the decode cache of each column (0: no cache)")
+    parser.add_argument("--columns", default=None,
+                        help="comma separated titles of the interpreted columns to compute (default: all): "
+                             + ",".join(INTERPRETED_COLUMN_NAMES))
+    parser.add_argument("--drop-hex-columns", action="store_true",
+                        help="remove the columns with the interpreted hex codes from the output")
+    parser.add_argument("--where", action="append", default=None,
+                        help="convert only the lines matching the filter, e.g. \"errors != 0 or warnings != 0\", "
+                             "laser=ON or \"ld_temp > 60\" (repeat for several filters which must all match), "
+                             "fields: " + ", ".join(FILTER_FIELDS))
+    parser.add_argument("--parquet", default=None, metavar="DATASET_DIRECTORY",
+                        help="write the typed columns to a Parquet dataset partitioned by device serial and run date "
+                             "instead of the converted csv files (requires numpy and pyarrow)")
+    parser.add_argument("--row-group-size", type=int, default=None,
+                        help="number of rows of a row group of the Parquet files (default: 131072)")
+    parser.add_argument("--compression", default=None,
+                        help="compression of the Parquet files: zstd (default), snappy, gzip or none")
+    parser.add_argument("--sqlite", default=None, metavar="DATABASE",
+                        help="store the results in a SQLite database instead of the converted csv files "
+                             "(the rows of a file stored again are replaced)")
+    parser.add_argument("--flag-index", action="store_true",
+                        help="build the index of the error and warning flags of the file (or the files) instead of "
+                             "converting it")
+    parser.add_argument("--query-flags", default=None,
+                        help="comma separated error and warning flags: print the rows (0: first line after the header) "
+                             "with all the flags set, using the index of the flags")
+    parser.add_argument("--rows", default=None, metavar="START:STOP",
+                        help="print only the interpreted rows START <= row < STOP (0: first line after the header), "
+                             "read from the nearest entry of the row index")
+    parser.add_argument("--time-range", default=None, nargs=2, metavar=("START_TIME", "STOP_TIME"),
+                        help="print only the interpreted rows with START_TIME <= time stamp <= STOP_TIME, read from "
+                             "the nearest entry of the row index")
+    parser.add_argument("--mmap", action="store_true",
+                        help="read the file from a memory map and decode only the converted fields (serial "
+                             "conversion of a single file)")
+    parser.add_argument("--check-crc", action="store_true",
+                        help="verify the CRC-16 in the last 2 bytes of each telegram: add a validity flag after the "
+                             "interpreted columns and print the number of bad frames of each hex column")
+    parser.add_argument("--calibration", default=None, metavar="CALIBRATION_FILE",
+                        help="JSON file with the calibration profiles of the hardware variants and the profile of "
+                             "each device serial (default: the constants of the legacy conversions)")
+    parser.add_argument("--quarantine", action="store_true",
+                        help="resilient mode: write the lines that can't be converted to <file>_quarantine.csv with "
+                             "their line number and the reason instead of stopping, and print a summary of the errors")
+    parser.add_argument("--resume", action="store_true",
+                        help="save a checkpoint after each range of the file and continue an interrupted conversion "
+                             "of the file where it stopped")
+    parser.add_argument("--cache", action="store_true",
+                        help="skip the files of a directory or glob pattern whose converted file is up to date "
+                             "(same content, converter version and options, see " + CONVERSION_CACHE_FILE_NAME + ")")
+    parser.add_argument("--pipeline", action="store_true",
+                        help="pipelined conversion: read ahead and write in threads while the blocks are converted "
+                             "(with --workers by worker processes), e.g. for files on a network share")
+    parser.add_argument("--block-size", type=int, default=PIPELINE_BLOCK_SIZE,
+                        help="size in bytes of the blocks read ahead by the pipelined conversion")
+    parser.add_argument("--queue-depth", type=int, default=PIPELINE_QUEUE_DEPTH,
+                        help="number of blocks waiting between two stages of the pipelined conversion")
+    arguments = parser.parse_args()
+
+    selected_columns = arguments.columns.split(",") if arguments.columns else None
+    calibration_profiles = load_calibration_profiles(arguments.calibration) if arguments.calibration else None
+
+    if arguments.rows or arguments.time_range:
+        row_plan_options = {"decode_cache_size": arguments.cache_size, "columns": selected_columns,
+                            "drop_hex_columns": arguments.drop_hex_columns,
+                            "calibration_profile": get_calibration_profile(calibration_profiles,
+                                                                           arguments.hex_results_file_path)
+                            if calibration_profiles else None}
+        if arguments.rows:
+            start_row, stop_row = (int(row) for row in arguments.rows.split(":"))
+            interpreted_rows = read_interpreted_rows_by_row_range(arguments.hex_results_file_path, start_row,
+                                                                  stop_row, row_plan_options)
+        else:
+            interpreted_rows = read_interpreted_rows_by_time_range(arguments.hex_results_file_path,
+                                                                   *arguments.time_range, row_plan_options)
+        for row_id, interpreted_row in interpreted_rows:
+            print(row_id, ",".join(interpreted_row))
+    elif arguments.flag_index or arguments.query_flags:
+        if os.path.isdir(arguments.hex_results_file_path) or glob.has_magic(arguments.hex_results_file_path):
+            hex_results_file_paths = get_hex_results_file_paths(arguments.hex_results_file_path)
+        else:
+            hex_results_file_paths = [arguments.hex_results_file_path]
+        for hex_results_file_path in hex_results_file_paths:
+            if arguments.query_flags:
+                print(hex_results_file_path, *query_flag_index(load_flag_index(hex_results_file_path),
+                                                               arguments.query_flags.split(",")))
+            else:
+                print(hex_results_file_path, get_first_flag_occurrences(zx_build_flag_index(hex_results_file_path)))
+    elif arguments.parquet:
+        import zx_ruler_results_vectorized
+
+        if os.path.isdir(arguments.hex_results_file_path) or glob.has_magic(arguments.hex_results_file_path):
+            hex_results_file_paths = get_hex_results_file_paths(arguments.hex_results_file_path)
+        else:
+            hex_results_file_paths = [arguments.hex_results_file_path]
+        for hex_results_file_path in hex_results_file_paths:
+            print(*zx_ruler_results_vectorized.zx_results_to_parquet(
+                hex_results_file_path, arguments.parquet,
+                arguments.row_group_size or zx_ruler_results_vectorized.PARQUET_ROW_GROUP_SIZE,
+                arguments.compression or zx_ruler_results_vectorized.PARQUET_COMPRESSION, calibration_profiles))
+    elif arguments.sqlite:
+        if os.path.isdir(arguments.hex_results_file_path) or glob.has_magic(arguments.hex_results_file_path):
+            hex_results_file_paths = get_hex_results_file_paths(arguments.hex_results_file_path)
+        else:
+            hex_results_file_paths = [arguments.hex_results_file_path]
+        for hex_results_file_path in hex_results_file_paths:
+            print(hex_results_file_path, zx_results_to_sqlite(
+                hex_results_file_path, arguments.sqlite, arguments.cache_size, arguments.where,
+                get_calibration_profile(calibration_profiles, hex_results_file_path) if calibration_profiles else None))
+    elif os.path.isdir(arguments.hex_results_file_path) or glob.has_magic(arguments.hex_results_file_path):
+        for batch_manifest_entry in zx_interpret_results_batch(arguments.hex_results_file_path, arguments.workers,
+                                                               arguments.manifest, arguments.cache_size,
+                                                               selected_columns, arguments.drop_hex_columns,
+                                                               arguments.where, arguments.check_crc,
+                                                               calibration_profiles, arguments.quarantine,
+                                                               arguments.cache):
+            print(batch_manifest_entry["STATUS"], batch_manifest_entry["FILE"], batch_manifest_entry["ERROR"],
+                  batch_manifest_entry["BAD_LINES"])
+            if arguments.check_crc and batch_manifest_entry["STATUS"] != "FAILED":
+                print(batch_manifest_entry["ROWS"], batch_manifest_entry["BAD_FRAMES"])
+    elif arguments.follow:
+        zx_follow_results(arguments.hex_results_file_path, arguments.poll_interval,
+                          decode_cache_size=arguments.cache_size, columns=selected_columns,
+                          drop_hex_columns=arguments.drop_hex_columns, where=arguments.where,
+                          calibration_profile=get_calibration_profile(calibration_profiles,
+                                                                      arguments.hex_results_file_path)
+                          if calibration_profiles else None)
+    else:
+        error_summary = collections.Counter()
+        bad_frames = collections.Counter()
+        number_of_converted_lines = zx_interpret_results(
+            arguments.hex_results_file_path, workers=arguments.workers, decode_cache_size=arguments.cache_size,
+            columns=selected_columns, drop_hex_columns=arguments.drop_hex_columns, where=arguments.where,
+            use_mmap=arguments.mmap, check_crc=arguments.check_crc,
+            calibration_profile=get_calibration_profile(calibration_profiles, arguments.hex_results_file_path)
+            if calibration_profiles else None, quarantine=arguments.quarantine, error_summary=error_summary,
+            resume=arguments.resume, pipeline=arguments.pipeline, block_size=arguments.block_size,
+            queue_depth=arguments.queue_depth, bad_frames=bad_frames)
+        if arguments.check_crc:
+            # Bad frames counted during the conversion
+            print(number_of_converted_lines, dict(bad_frames))
+        if arguments.quarantine:
+            # Error summary of the run
+            print(number_of_converted_lines, "converted lines,", sum(error_summary.values()), "bad lines",
+                  dict(error_summary) or "")
+            if error_summary:
+                print("Bad lines in", get_quarantine_file_path(arguments.hex_results_file_path))
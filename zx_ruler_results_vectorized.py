@@ -0,0 +1,748 @@
+"""
+This module defines batch (column) counterparts of the functions interpreting the ZX results.
+Every function takes a whole column of telegrams (hex strings) and returns NumPy arrays instead of
+interpreting one hex string per call. read_results_table returns the whole file as a table of typed
+columns (NumPy arrays, optionally converted to Arrow), iter_results_tables the same tables for blocks of lines,
+and zx_results_to_parquet appends a file block by block to a Parquet dataset.
+Requires numpy (and pyarrow for the Arrow and Parquet functions).
+CEK
+Created: 18.10.2026
+Last modify: 18.10.2026
+"""
+
+import itertools
+import operator
+import os
+
+import numpy as np
+
+import zx_ruler_results_interpreter
+
+
+# Status codes of the decoded values (same meaning as the strings returned by the single value functions)
+STATUS_OK = 0
+STATUS_CRC_ERROR = 1  # "CRC Error": telegram too short
+STATUS_WRONG_HEX_VALUE = 2  # "Wrong Hex value": telegram contains the character NUL = \x00
+STATUS_INVALID_HEX = 3  # Not a hex value (the single value functions raise a ValueError)
+STATUS_NO_VALUE = 4  # "No Value": empty status byte
+
+# Strings of the single value functions corresponding to the status codes
+STATUS_STRINGS = {STATUS_CRC_ERROR: "CRC Error",
+                  STATUS_WRONG_HEX_VALUE: "Wrong Hex value",
+                  STATUS_NO_VALUE: "No Value"}
+
+# Parameter to calculate the voltages and currents of the default hardware variant (the batch functions take a
+# CalibrationProfile, see zx_ruler_results_interpreter.DEFAULT_CALIBRATION_PROFILE)
+U_REF_SMCU = zx_ruler_results_interpreter.DEFAULT_CALIBRATION_PROFILE.u_ref_smcu  # [V] Reference voltage
+ADC_MAX_16_BIT = zx_ruler_results_interpreter.DEFAULT_CALIBRATION_PROFILE.adc_max  # [-] ADC/DAC max value
+U_REF_DAC = zx_ruler_results_interpreter.DEFAULT_CALIBRATION_PROFILE.u_ref_dac  # [V] Reference voltage of the DAC
+DAC_MAX_12_BIT = zx_ruler_results_interpreter.DEFAULT_CALIBRATION_PROFILE.dac_max  # [-] DAC max value for 12 bits
+R_SHUNT = zx_ruler_results_interpreter.DEFAULT_CALIBRATION_PROFILE.r_shunt  # [Ohm] Shunt resistor
+XR_OPV = zx_ruler_results_interpreter.DEFAULT_CALIBRATION_PROFILE.xr_opv  # 3,3k / 8k
+
+# Lookup table ASCII character -> value of the hex digit (255 if not a hex digit)
+_HEX_DIGIT_VALUES = np.full(256, 255, dtype=np.uint8)
+_HEX_DIGIT_VALUES[np.frombuffer(b"0123456789", dtype=np.uint8)] = np.arange(10, dtype=np.uint8)
+_HEX_DIGIT_VALUES[np.frombuffer(b"abcdef", dtype=np.uint8)] = np.arange(10, 16, dtype=np.uint8)
+_HEX_DIGIT_VALUES[np.frombuffer(b"ABCDEF", dtype=np.uint8)] = np.arange(10, 16, dtype=np.uint8)
+
+
+def hex_column_to_digits(hex_column, number_of_characters):
+    """
+    Convert a column of hex strings to a matrix with the values of the hex digits
+    :param hex_column: sequence of hex strings (telegrams)
+    :param number_of_characters: number of characters to keep from the start of every hex string
+    :return: digits (uint8 matrix, 255 for non hex characters), lengths of the strings, mask of strings with NUL
+    """
+
+    number_of_rows = len(hex_column)
+    # Length of every hex string
+    lengths = np.fromiter(map(len, hex_column), dtype=np.int64, count=number_of_rows)
+    # Check if the character NUL = \x00 is contained in the hex strings
+    has_nul = np.fromiter(map(operator.contains, hex_column, itertools.repeat("\x00")), dtype=bool,
+                          count=number_of_rows)
+
+    # Fixed width unicode strings (longer strings are cut, shorter are filled with NUL) as matrix of code points
+    width = max(number_of_characters, 1)
+    characters = np.array(hex_column, dtype=f"U{width}").view(np.uint32).reshape(number_of_rows, width)
+    # Code points outside of ASCII aren't hex digits
+    characters = np.minimum(characters, 255)
+
+    return _HEX_DIGIT_VALUES[characters], lengths, has_nul
+
+
+def slice_hex_field(digits, lengths, start, stop, empty_is_zero=False):
+    """
+    Parse the hex field hex_string[start:stop] of every row like int(hex_string[start:stop], base=16)
+    :param digits: digits matrix (see hex_column_to_digits)
+    :param lengths: lengths of the hex strings
+    :param start: index of the first character of the field
+    :param stop: index after the last character of the field
+    :param empty_is_zero: an empty field is 0 instead of invalid
+    :return: values (int64) and mask of the rows where the field isn't a hex value
+    """
+
+    number_of_digits = stop - start
+    field_digits = digits[:, start:stop].astype(np.int64)
+
+    # Only the characters inside the hex string belong to the field (like the slice of a string)
+    number_of_digits_in_string = np.clip(lengths - start, 0, number_of_digits)
+    in_string = np.arange(number_of_digits) < number_of_digits_in_string[:, None]
+    invalid = (in_string & (field_digits == 255)).any(axis=1)
+
+    # Weight the digits like a number with all digits, then remove the missing digits at the end
+    weights = 16 ** np.arange(number_of_digits - 1, -1, -1, dtype=np.int64)
+    values = (np.where(in_string, field_digits & 0xF, 0) * weights).sum(axis=1)
+    values >>= 4 * (number_of_digits - number_of_digits_in_string)
+
+    if not empty_is_zero:
+        # int("", base=16) is not a valid conversion
+        invalid |= lengths <= start
+
+    return values, invalid
+
+
+# Table of the CRC of each byte value (see zx_ruler_results_interpreter.CRC_16_TABLE)
+_CRC_16_TABLE = np.array(zx_ruler_results_interpreter.CRC_16_TABLE, dtype=np.uint32)
+
+
+def check_crc_column(hex_column):
+    """
+    Batch counterpart of is_telegram_crc_valid: the CRC of all the telegrams with the same length is updated byte
+    position by byte position with the precomputed table
+    :param hex_column: sequence of hex strings (telegrams)
+    :return: mask of the telegrams with a valid CRC
+    """
+
+    number_of_characters = max((len(hex_string) for hex_string in hex_column), default=0)
+    digits, lengths, has_nul = hex_column_to_digits(hex_column, number_of_characters)
+
+    valid = np.zeros(len(hex_column), dtype=bool)
+    for length in np.unique(lengths):
+        # Bad frame if not complete bytes or shorter than one byte with the CRC
+        if length % 2 or length < 6:
+            continue
+        rows = np.flatnonzero(lengths == length)
+        telegram_digits = digits[rows, :length]
+        complete = (telegram_digits != 255).all(axis=1) & ~has_nul[rows]
+
+        # Bytes of the telegrams (garbage for the incomplete ones, which are invalid anyway)
+        telegrams = ((telegram_digits[:, 0::2].astype(np.uint32) << 4) | telegram_digits[:, 1::2]) & 0xFF
+
+        crc = np.full(len(rows), zx_ruler_results_interpreter.CRC_INITIAL_VALUE, dtype=np.uint32)
+        for byte_values in telegrams[:, :-2].T:
+            crc = ((crc << 8) & 0xFFFF) ^ _CRC_16_TABLE[(crc >> 8) ^ byte_values]
+
+        valid[rows] = complete & (crc == ((telegrams[:, -2] << 8) | telegrams[:, -1]))
+
+    return valid
+
+
+def twos_complement_array_to_signed_int(values, number_of_bits):
+    """
+    Batch counterpart of twos_complement_hex_to_signed_int for already parsed values
+    :param values: array with the unsigned values
+    :param number_of_bits: Number of bit
+    :return: array with the signed values
+    """
+
+    values = np.asarray(values, dtype=np.int64)
+    # Check if the bit far left (number_of_bits - 1) is set and subtract the maximum (2^(number_of_bits))
+    return np.where(values & (1 << (number_of_bits - 1)), values - (1 << number_of_bits), values)
+
+
+def twos_complement_hex_column_to_signed_int(hex_column, number_of_bits):
+    """
+    Batch counterpart of twos_complement_hex_to_signed_int
+    :param hex_column: sequence of hex strings
+    :param number_of_bits: Number of bit
+    :return: signed values (int64) and status codes
+    """
+
+    number_of_characters = max((len(hex_string) for hex_string in hex_column), default=0)
+    digits, lengths, has_nul = hex_column_to_digits(hex_column, number_of_characters)
+    values, invalid = slice_hex_field(digits, lengths, 0, number_of_characters)
+
+    status = np.where(invalid, STATUS_INVALID_HEX, STATUS_OK).astype(np.int8)
+    return twos_complement_array_to_signed_int(values, number_of_bits), status
+
+
+def _get_status(lengths, has_nul, invalid, nul_status=STATUS_WRONG_HEX_VALUE):
+    """
+    Get the status codes of the rows like the single value functions
+    :param lengths: lengths of the hex strings
+    :param has_nul: mask of the hex strings containing NUL (None if the function doesn't check it)
+    :param invalid: mask of the rows where a field isn't a hex value
+    :param nul_status: status of the hex strings containing NUL
+    :return: status codes (int8)
+    """
+
+    status = np.full(len(lengths), STATUS_OK, dtype=np.int8)
+    status[invalid] = STATUS_INVALID_HEX
+    # Telegram too short
+    status[lengths <= 6] = STATUS_CRC_ERROR
+    if has_nul is not None:
+        status[has_nul] = nul_status
+    return status
+
+
+def _decode_single_field(hex_column, start, stop, check_nul=True, nul_status=STATUS_WRONG_HEX_VALUE):
+    """
+    Parse a single hex field of every telegram of the column
+    :param hex_column: sequence of hex strings
+    :param start: index of the first character of the field
+    :param stop: index after the last character of the field
+    :param check_nul: the single value function checks the character NUL
+    :param nul_status: status of the hex strings containing NUL
+    :return: values (int64) and status codes
+    """
+
+    digits, lengths, has_nul = hex_column_to_digits(hex_column, stop)
+    values, invalid = slice_hex_field(digits, lengths, start, stop)
+    return values, _get_status(lengths, has_nul if check_nul else None, invalid, nul_status)
+
+
+def decode_ld_temp_column(ld_temp_column):
+    """
+    Batch counterpart of convert_ld_temp_in_deg
+    :param ld_temp_column: ld temp hex codes
+    :return: temperature in deg (float64) and status codes
+    """
+
+    values, status = _decode_single_field(ld_temp_column, 2, 6)
+    return twos_complement_array_to_signed_int(values, 16) / 100, status
+
+
+def decode_status_column(status_column):
+    """
+    Batch counterpart of get_errors_and_warnings_from_status_response and convert_status_byte
+    :param status_column: status responses
+    :return: status byte (uint8), error code (uint32), warning code (uint32), status codes of the error and
+             warning codes and status codes of the status byte
+    """
+
+    digits, lengths, has_nul = hex_column_to_digits(status_column, 20)
+
+    # Error and warning codes (empty codes are "No Errors"/"No Warnings")
+    error_codes, error_invalid = slice_hex_field(digits, lengths, 4, 12, empty_is_zero=True)
+    warning_codes, warning_invalid = slice_hex_field(digits, lengths, 12, 20, empty_is_zero=True)
+    status = _get_status(lengths, has_nul, error_invalid | warning_invalid)
+
+    # The status byte is interpreted independently of the length of the response
+    status_bytes, status_byte_invalid = slice_hex_field(digits, lengths, 0, 2)
+    status_byte_status = np.where(status_byte_invalid, STATUS_INVALID_HEX, STATUS_OK).astype(np.int8)
+    status_byte_status[lengths == 0] = STATUS_NO_VALUE
+    # Only the (rare) responses with NUL are checked one by one
+    for row_index in np.flatnonzero(has_nul):
+        if "\x00" in status_column[row_index][:2]:
+            status_byte_status[row_index] = STATUS_WRONG_HEX_VALUE
+
+    return (status_bytes.astype(np.uint8), error_codes.astype(np.uint32), warning_codes.astype(np.uint32), status,
+            status_byte_status)
+
+
+def decode_laser_on_off_column(laser_status_column):
+    """
+    Batch counterpart of get_laser_on_or_off
+    :param laser_status_column: laser status responses
+    :return: laser on (bool) and status codes
+    """
+
+    values, status = _decode_single_field(laser_status_column, 2, 4)
+    return values != 0, status
+
+
+def decode_smcu_status_column(smcu_status_column,
+                              calibration_profile=zx_ruler_results_interpreter.DEFAULT_CALIBRATION_PROFILE):
+    """
+    Batch counterpart of interpret_get_smcu_status
+    :param smcu_status_column: SMCU status in Hex code
+    :param calibration_profile: CalibrationProfile of the analog values
+    :return: start-up state (uint8), operation state (uint8), ADC LD_TEMP in V (float64), Si temp in deg (float64)
+             and status codes
+    """
+
+    digits, lengths, has_nul = hex_column_to_digits(smcu_status_column, 14)
+    start_up_states, start_up_invalid = slice_hex_field(digits, lengths, 2, 4)
+    operation_states, operation_invalid = slice_hex_field(digits, lengths, 4, 6)
+    ntc_temps, ntc_temp_invalid = slice_hex_field(digits, lengths, 6, 10)
+    si_temps, si_temp_invalid = slice_hex_field(digits, lengths, 10, 14)
+
+    # The start-up and operation states are looked up as strings, they don't have to be hex values
+    status = _get_status(lengths, has_nul, ntc_temp_invalid | si_temp_invalid)
+
+    return (start_up_states.astype(np.uint8), operation_states.astype(np.uint8),
+            zx_ruler_results_interpreter.calibrate_adc_ld_temp(calibration_profile, ntc_temps),
+            twos_complement_array_to_signed_int(si_temps, 16) / 100,
+            status)
+
+
+def decode_temp_adc_column(temp_adc_column):
+    """
+    Batch counterpart of convert_temp_adc_in_deg
+    :param temp_adc_column: temp adc hex codes
+    :return: temp adc in mV (float64) and status codes
+    """
+
+    values, status = _decode_single_field(temp_adc_column, 2, 6)
+    return values / 100, status
+
+
+def decode_current_column(current_column):
+    """
+    Batch counterpart of convert_current
+    :param current_column: current hex codes
+    :return: current in mA (int64) and status codes
+    """
+
+    return _decode_single_field(current_column, 2, 6)
+
+
+def decode_mode_column(mode_column):
+    """
+    Batch counterpart of interpret_get_mode
+    :param mode_column: modes in Hex code
+    :return: mode bits (uint8) and status codes
+    """
+
+    values, status = _decode_single_field(mode_column, 2, 4)
+    return values.astype(np.uint8), status
+
+
+def decode_config_mode_column(config_mode_column):
+    """
+    Batch counterpart of interpret_get_config_mode
+    :param config_mode_column: config modes in Hex code
+    :return: config mode (uint8) and status codes
+    """
+
+    values, status = _decode_single_field(config_mode_column, 2, 4)
+    return values.astype(np.uint8), status
+
+
+def decode_fw_version_column(fw_version_column):
+    """
+    Batch counterpart of interpret_get_fw_version
+    :param fw_version_column: FW version hex codes
+    :return: MMCU FW version (uint8 matrix with major, minor, intern), SMCU FW version (same) and status codes
+    """
+
+    digits, lengths, has_nul = hex_column_to_digits(fw_version_column, 18)
+    fw_versions = []
+    invalid = np.zeros(len(lengths), dtype=bool)
+    for start in (2, 4, 6, 12, 14, 16):
+        values, field_invalid = slice_hex_field(digits, lengths, start, start + 2)
+        fw_versions.append(values)
+        invalid |= field_invalid
+
+    fw_versions = np.stack(fw_versions, axis=1).astype(np.uint8) if len(lengths) else np.zeros((0, 6), np.uint8)
+    return fw_versions[:, :3], fw_versions[:, 3:], _get_status(lengths, has_nul, invalid)
+
+
+def decode_current_dac_adc_column(current_dac_column,
+                                  calibration_profile=zx_ruler_results_interpreter.DEFAULT_CALIBRATION_PROFILE):
+    """
+    Batch counterpart of convert_current_dac_adc
+    :param current_dac_column: current hex codes
+    :param calibration_profile: CalibrationProfile of the analog values
+    :return: current in mA (float64) and status codes
+    """
+
+    # convert_current_dac_adc returns "CRC Error" for hex values with NUL
+    values, status = _decode_single_field(current_dac_column, 2, 6, nul_status=STATUS_CRC_ERROR)
+    return zx_ruler_results_interpreter.calibrate_current_dac(calibration_profile, values), status
+
+
+def decode_power_out_abs_column(power_out_abs_column):
+    """
+    Batch counterpart of convert_power_out_abs
+    :param power_out_abs_column: power hex codes
+    :return: power in mW (float64) and status codes
+    """
+
+    values, status = _decode_single_field(power_out_abs_column, 2, 6, check_nul=False)
+    return values / 100, status
+
+
+def decode_power_val_in_perc_column(power_val_in_perc_column):
+    """
+    Batch counterpart of convert_power_val_in_perc
+    :param power_val_in_perc_column: power hex codes
+    :return: power value (float64) and status codes
+    """
+
+    values, status = _decode_single_field(power_val_in_perc_column, 2, 4)
+    return values / 100, status
+
+
+def _decode_hours_and_minutes(time_column):
+    """
+    Parse the hours and minutes of every telegram of the column
+    :param time_column: time hex codes
+    :return: hours (int64), minutes (int64) and status codes
+    """
+
+    digits, lengths, has_nul = hex_column_to_digits(time_column, 8)
+    hours, hours_invalid = slice_hex_field(digits, lengths, 2, 6)
+    minutes, minutes_invalid = slice_hex_field(digits, lengths, 6, 8)
+    return hours, minutes, _get_status(lengths, None, hours_invalid | minutes_invalid)
+
+
+def decode_ld_lifetime_column(ld_lifetime_column):
+    """
+    Batch counterpart of convert_ld_lifetime
+    :param ld_lifetime_column: ld lifetime hex codes
+    :return: hours (int64), minutes (int64) and status codes
+    """
+
+    return _decode_hours_and_minutes(ld_lifetime_column)
+
+
+def decode_pd_value_column(pd_value_column):
+    """
+    Batch counterpart of convert_pd_value
+    :param pd_value_column: pd value hex codes
+    :return: pd value (int64) and status codes
+    """
+
+    return _decode_single_field(pd_value_column, 2, 6)
+
+
+def decode_module_total_ontime_column(ontime_column):
+    """
+    Batch counterpart of convert_module_total_ontime
+    :param ontime_column: ontime hex codes
+    :return: hours (int64), minutes (int64) and status codes
+    """
+
+    return _decode_hours_and_minutes(ontime_column)
+
+
+def decode_cal_laser_column(cal_laser_column):
+    """
+    Batch counterpart of convert_cal_laser
+    :param cal_laser_column: cal laser hex codes
+    :return: nominal power in mW (float64), diode wavelength in nm (int64) and status codes
+    """
+
+    digits, lengths, has_nul = hex_column_to_digits(cal_laser_column, 10)
+    nominal_powers, nominal_power_invalid = slice_hex_field(digits, lengths, 2, 6)
+    diode_wavelengths, diode_wavelength_invalid = slice_hex_field(digits, lengths, 6, 10)
+
+    # convert_cal_laser returns "CRC Error" for hex values with NUL
+    status = _get_status(lengths, has_nul, nominal_power_invalid | diode_wavelength_invalid, STATUS_CRC_ERROR)
+    return nominal_powers / 100, diode_wavelengths, status
+
+
+def decode_comp_ref_column(comp_ref_column,
+                           calibration_profile=zx_ruler_results_interpreter.DEFAULT_CALIBRATION_PROFILE):
+    """
+    Batch counterpart of convert_comp_ref
+    :param comp_ref_column: voltage hex codes
+    :param calibration_profile: CalibrationProfile of the analog values
+    :return: comp REF voltage in mV (float64) and status codes
+    """
+
+    values, status = _decode_single_field(comp_ref_column, 2, 6, check_nul=False)
+    return zx_ruler_results_interpreter.calibrate_comp_ref(calibration_profile, values), status
+
+
+def decode_current_adc_column(current_adc_column,
+                              calibration_profile=zx_ruler_results_interpreter.DEFAULT_CALIBRATION_PROFILE):
+    """
+    Batch counterpart of convert_current_adc
+    :param current_adc_column: current hex codes
+    :param calibration_profile: CalibrationProfile of the analog values
+    :return: current in mA (float64) and status codes
+    """
+
+    # convert_current_adc returns "CRC Error" for hex values with NUL
+    values, status = _decode_single_field(current_adc_column, 6, 10, nul_status=STATUS_CRC_ERROR)
+    return zx_ruler_results_interpreter.calibrate_current_adc(calibration_profile, values), status
+
+
+# Registry of the typed columns of the result table (see decode_results_table): title of the column with the hex
+# code, batch function decoding it and titles of the arrays it returns (the status codes are always last)
+TYPED_COLUMNS = (("GET_LD_TEMP", decode_ld_temp_column, ("LD_TEMP_IN_DEG", "LD_TEMP_STATUS")),
+                 ("GET_STATUS", decode_status_column, ("STATUS_BYTE", "ERROR_WORD", "WARNING_WORD",
+                                                       "ERRORS_WARNINGS_STATUS", "STATUS_BYTE_STATUS")),
+                 ("GET_LASER_ON_OFF", decode_laser_on_off_column, ("LASER_ON", "LASER_ON_OFF_STATUS")),
+                 ("GET_SMCU_STATUS", decode_smcu_status_column, ("SMCU_START_UP_STATE", "SMCU_OPERATION_STATE",
+                                                                 "SMCU_ADC_LD_TEMP_IN_V", "SMCU_SI_TEMP_IN_DEG",
+                                                                 "SMCU_STATUS_STATUS")),
+                 ("GET_TEMP_ADC", decode_temp_adc_column, ("TEMP_ADC_IN_MV", "TEMP_ADC_STATUS")),
+                 ("GET_CURRENT", decode_current_column, ("CURRENT_IN_MA", "CURRENT_STATUS")),
+                 ("GET_MODE", decode_mode_column, ("MODE_BITS", "MODE_STATUS")),
+                 ("GET_CONFIG_MODE", decode_config_mode_column, ("CONFIG_MODE_CODE", "CONFIG_MODE_STATUS")),
+                 ("GET_CURRENT_DAC_ADC", decode_current_dac_adc_column, ("CURRENT_DAC_IN_MA", "CURRENT_DAC_STATUS")),
+                 ("GET_POWER_OUT_ABS", decode_power_out_abs_column, ("POWER_OUT_ABS_IN_MW", "POWER_OUT_ABS_STATUS")),
+                 ("GET_POWER_VAL_IN_PERC", decode_power_val_in_perc_column, ("POWER_VAL_IN_PERC",
+                                                                             "POWER_VAL_IN_PERC_STATUS")),
+                 ("GET_LD_LIFETIME", decode_ld_lifetime_column, ("LD_LIFETIME_HOURS", "LD_LIFETIME_MINUTES",
+                                                                 "LD_LIFETIME_STATUS")),
+                 ("GET_PD_VALUE", decode_pd_value_column, ("PD_VALUE", "PD_VALUE_STATUS")),
+                 ("GET_MODULE_TOTAL_ONTIME", decode_module_total_ontime_column, ("MODULE_TOTAL_ONTIME_HOURS",
+                                                                                 "MODULE_TOTAL_ONTIME_MINUTES",
+                                                                                 "MODULE_TOTAL_ONTIME_STATUS")),
+                 ("GET_CAL_LASER", decode_cal_laser_column, ("CAL_NOMINAL_POWER_IN_MW", "CAL_DIODE_WAVELENGTH_IN_NM",
+                                                             "CAL_LASER_STATUS")),
+                 ("GET_COMP_REF", decode_comp_ref_column, ("COMP_REF_IN_MV", "COMP_REF_STATUS")),
+                 ("GET_FW_VERSION", decode_fw_version_column, ("MMCU_FW_VERSION", "SMCU_FW_VERSION",
+                                                               "FW_VERSION_STATUS")),
+                 ("GET_CURRENT_DAC_ADC", decode_current_adc_column, ("CURRENT_ADC_IN_MA", "CURRENT_ADC_STATUS")))
+
+# Batch functions of TYPED_COLUMNS taking the CalibrationProfile of the analog values
+CALIBRATED_COLUMN_DECODERS = {decode_smcu_status_column, decode_current_dac_adc_column, decode_comp_ref_column,
+                              decode_current_adc_column}
+
+# Title of the status column of every typed value column (the last array returned by the batch function, except
+# for the status response which has separate status codes for the status byte)
+TYPED_COLUMN_STATUS_COLUMNS = {typed_column_name: typed_column_names[-1]
+                               for _, _, typed_column_names in TYPED_COLUMNS
+                               for typed_column_name in typed_column_names[:-1]
+                               if not typed_column_name.endswith("_STATUS")}
+TYPED_COLUMN_STATUS_COLUMNS.update({"STATUS_BYTE": "STATUS_BYTE_STATUS",
+                                    "ERROR_WORD": "ERRORS_WARNINGS_STATUS",
+                                    "WARNING_WORD": "ERRORS_WARNINGS_STATUS"})
+
+# Title of the column which is True for the rows where all the decoded hex codes are valid
+VALID_COLUMN_NAME = "VALID"
+
+
+def decode_results_table(header_hex_results_line_as_list, hex_results_lines_split, hex_column_names=None,
+                         check_crc=False, calibration_profile=None):
+    """
+    Decode the lines of the test results in a table of typed columns. The columns without hex code are kept as
+    strings, each hex code is replaced by its typed values and its status codes (see TYPED_COLUMNS).
+    The values of a row with another status than STATUS_OK are undefined.
+    :param header_hex_results_line_as_list: header line of the file with results in Hex split at the comma
+    :param hex_results_lines_split: list of the lines (without header) split at the comma
+    :param hex_column_names: titles of the columns with hex codes to decode (default: all the columns of
+                             TYPED_COLUMNS in the header)
+    :param check_crc: add the CRC validity of each hex column (title with CRC_COLUMN_SUFFIX), also required for
+                      the rows of the VALID column
+    :param calibration_profile: CalibrationProfile of the analog values (default: DEFAULT_CALIBRATION_PROFILE)
+    :return: dictionary title of the column -> NumPy array, in the order of the columns
+    """
+
+    if calibration_profile is None:
+        calibration_profile = zx_ruler_results_interpreter.DEFAULT_CALIBRATION_PROFILE
+
+    if hex_column_names is None:
+        hex_column_names = [hex_column_name for hex_column_name, _, _ in TYPED_COLUMNS
+                            if hex_column_name in header_hex_results_line_as_list]
+
+    # Get the indexes of the columns with hex codes (like the conversion, with the legacy indexes of older files)
+    hex_column_indexes = {hex_column_name: zx_ruler_results_interpreter.get_hex_column_index(
+        header_hex_results_line_as_list, hex_column_name) for hex_column_name in hex_column_names}
+    decoded_column_indexes = set(hex_column_indexes.values())
+
+    def get_column(column_index):
+        return [hex_results_line_split[column_index] for hex_results_line_split in hex_results_lines_split]
+
+    # Columns without hex code as strings
+    results_table = {column_name: np.array(get_column(column_index), dtype=str)
+                     for column_index, column_name in enumerate(header_hex_results_line_as_list)
+                     if column_index not in decoded_column_indexes}
+
+    valid = np.ones(len(hex_results_lines_split), dtype=bool)
+    for hex_column_name, decode_column, typed_column_names in TYPED_COLUMNS:
+        if hex_column_name not in hex_column_indexes:
+            continue
+        if decode_column in CALIBRATED_COLUMN_DECODERS:
+            typed_columns = decode_column(get_column(hex_column_indexes[hex_column_name]), calibration_profile)
+        else:
+            typed_columns = decode_column(get_column(hex_column_indexes[hex_column_name]))
+        for typed_column_name, typed_column in zip(typed_column_names, typed_columns):
+            results_table[typed_column_name] = typed_column
+            if typed_column_name.endswith("_STATUS"):
+                valid &= typed_column == STATUS_OK
+
+    if check_crc:
+        for hex_column_name, column_index in hex_column_indexes.items():
+            crc_valid = check_crc_column(get_column(column_index))
+            results_table[hex_column_name + zx_ruler_results_interpreter.CRC_COLUMN_SUFFIX] = crc_valid
+            valid &= crc_valid
+
+    results_table[VALID_COLUMN_NAME] = valid
+    return results_table
+
+
+def read_results_table(hex_results_file_path, hex_column_names=None, check_crc=False, calibration_profile=None):
+    """
+    Read the file with the test results in a table of typed columns (see decode_results_table)
+    :param hex_results_file_path: path of the file with results in Hex
+    :param hex_column_names: titles of the columns with hex codes to decode (default: all)
+    :param check_crc: add the CRC validity of each hex column
+    :param calibration_profile: CalibrationProfile of the analog values (default: DEFAULT_CALIBRATION_PROFILE)
+    :return: dictionary title of the column -> NumPy array
+    """
+
+    with open(hex_results_file_path, "r") as hex_results_file:
+        header_hex_results_line = next(hex_results_file, "")
+        hex_results_lines_split = [hex_results_line.strip().split(",") for hex_results_line in hex_results_file]
+
+    return decode_results_table(header_hex_results_line.strip().split(","), hex_results_lines_split,
+                                hex_column_names, check_crc, calibration_profile)
+
+
+def iter_results_tables(hex_results_file_path, rows_per_table, hex_column_names=None, check_crc=False,
+                        calibration_profile=None):
+    """
+    Read the file with the test results in tables of typed columns of at most rows_per_table lines each (see
+    decode_results_table), so that only one block of lines is in memory at a time
+    :param hex_results_file_path: path of the file with results in Hex
+    :param rows_per_table: number of lines of a table
+    :param hex_column_names: titles of the columns with hex codes to decode (default: all)
+    :param check_crc: add the CRC validity of each hex column
+    :param calibration_profile: CalibrationProfile of the analog values (default: DEFAULT_CALIBRATION_PROFILE)
+    :return: generator of dictionaries title of the column -> NumPy array (a single empty table for a file
+             without lines)
+    """
+
+    with open(hex_results_file_path, "r") as hex_results_file:
+        header_hex_results_line_as_list = next(hex_results_file, "").strip().split(",")
+
+        number_of_tables = 0
+        while True:
+            hex_results_lines_split = [hex_results_line.strip().split(",")
+                                       for hex_results_line in itertools.islice(hex_results_file, rows_per_table)]
+            # The empty table of a file without lines still has all the columns
+            if not hex_results_lines_split and number_of_tables:
+                return
+
+            yield decode_results_table(header_hex_results_line_as_list, hex_results_lines_split, hex_column_names,
+                                       check_crc, calibration_profile)
+            number_of_tables += 1
+
+            if len(hex_results_lines_split) < rows_per_table:
+                return
+
+
+def count_bad_frames_of_table(results_table):
+    """
+    Batch counterpart of count_bad_frames for a table decoded with check_crc
+    :param results_table: dictionary title of the column -> NumPy array (see decode_results_table)
+    :return: dictionary title of the hex column -> number of bad frames
+    """
+
+    crc_column_suffix = zx_ruler_results_interpreter.CRC_COLUMN_SUFFIX
+    return {column_name[:-len(crc_column_suffix)]: int(np.count_nonzero(~column))
+            for column_name, column in results_table.items() if column_name.endswith(crc_column_suffix)}
+
+
+def results_table_to_arrow(results_table):
+    """
+    Convert a table of typed columns to an Arrow table (the numeric columns without invalid values are not copied).
+    The values of a row with another status than STATUS_OK are null. Requires pyarrow.
+    :param results_table: dictionary title of the column -> NumPy array (see decode_results_table)
+    :return: pyarrow.Table
+    """
+
+    import pyarrow
+
+    arrow_columns = []
+    for column_name, column in results_table.items():
+        # Mask of the invalid values of a typed column
+        null_mask = None
+        if TYPED_COLUMN_STATUS_COLUMNS.get(column_name) in results_table:
+            null_mask = results_table[TYPED_COLUMN_STATUS_COLUMNS[column_name]] != STATUS_OK
+
+        if column.ndim == 2:
+            # FW versions (major, minor, intern) as fixed size lists
+            arrow_column = pyarrow.FixedSizeListArray.from_arrays(pyarrow.array(column.ravel()), column.shape[1])
+            if null_mask is not None and null_mask.any():
+                arrow_column = pyarrow.FixedSizeListArray.from_arrays(
+                    arrow_column.values, column.shape[1], mask=pyarrow.array(null_mask))
+        else:
+            arrow_column = pyarrow.array(column, mask=null_mask if null_mask is not None and null_mask.any()
+                                         else None)
+        arrow_columns.append(arrow_column)
+
+    return pyarrow.Table.from_arrays(arrow_columns, names=list(results_table))
+
+
+# Number of rows of a row group of the Parquet files
+PARQUET_ROW_GROUP_SIZE = 128 * 1024
+
+# Compression of the Parquet files
+PARQUET_COMPRESSION = "zstd"
+
+# Number of lines decoded at once before they are collected (as Arrow tables) in the row groups of the Parquet files
+PARQUET_LINES_PER_BLOCK = 16 * 1024
+
+
+def zx_results_to_parquet(hex_results_file_path, dataset_directory, row_group_size=PARQUET_ROW_GROUP_SIZE,
+                          compression=PARQUET_COMPRESSION, calibration_profiles=None):
+    """
+    Decode a file with results in Hex in typed columns and add it to a Parquet dataset partitioned by device serial
+    and run date: <dataset_directory>/serial=<serial>/date=<yyyy-mm-dd>/<name>.parquet.
+    The file is read and decoded in blocks of at most PARQUET_LINES_PER_BLOCK lines (see iter_results_tables),
+    collected as Arrow tables and written as soon as they fill a row group, so that the memory doesn't grow with
+    the size of the file.
+    Converting a file again replaces its Parquet file. Requires pyarrow.
+    :param hex_results_file_path: path of the file with results in Hex
+    :param dataset_directory: directory of the Parquet dataset
+    :param row_group_size: number of rows of a row group
+    :param compression: compression of the columns (e.g. "zstd", "snappy", "gzip" or "none")
+    :param calibration_profiles: CalibrationProfiles of the devices (see load_calibration_profiles, default: the
+                                 constants of DEFAULT_CALIBRATION_PROFILE)
+    :return: path of the Parquet file and number of rows
+    """
+
+    import pyarrow.parquet
+
+    serial, run_date = zx_ruler_results_interpreter.get_serial_and_run_date(hex_results_file_path)
+    calibration_profile = None
+    if calibration_profiles is not None:
+        calibration_profile = zx_ruler_results_interpreter.get_calibration_profile(calibration_profiles,
+                                                                                   hex_results_file_path)
+
+    partition_directory = os.path.join(dataset_directory, f"serial={serial}", f"date={run_date}")
+    os.makedirs(partition_directory, exist_ok=True)
+    parquet_file_path = os.path.join(partition_directory,
+                                     os.path.splitext(os.path.basename(hex_results_file_path))[0] + ".parquet")
+
+    # Write a temporary file first, so that readers of the dataset never see a partial file
+    temporary_parquet_file_path = parquet_file_path + ".tmp"
+    parquet_writer = None
+    number_of_rows = 0
+    # Decoded blocks waiting for a complete row group
+    pending_arrow_tables = []
+    number_of_pending_rows = 0
+    try:
+        for results_table in iter_results_tables(hex_results_file_path, min(row_group_size, PARQUET_LINES_PER_BLOCK),
+                                                 calibration_profile=calibration_profile):
+            arrow_table = results_table_to_arrow(results_table)
+            if parquet_writer is None:
+                # The schema of the file is the one of the first block
+                parquet_writer = pyarrow.parquet.ParquetWriter(temporary_parquet_file_path, arrow_table.schema,
+                                                               compression=compression)
+            elif arrow_table.schema != parquet_writer.schema:
+                # E.g. a column with only invalid values in a block
+                arrow_table = arrow_table.cast(parquet_writer.schema)
+            pending_arrow_tables.append(arrow_table)
+            number_of_pending_rows += arrow_table.num_rows
+
+            # Write the complete row groups, the remaining rows wait for the next blocks
+            while number_of_pending_rows >= row_group_size:
+                pending_arrow_table = pyarrow.concat_tables(pending_arrow_tables)
+                parquet_writer.write_table(pending_arrow_table.slice(0, row_group_size))
+                pending_arrow_tables = [pending_arrow_table.slice(row_group_size)]
+                number_of_pending_rows -= row_group_size
+                number_of_rows += row_group_size
+
+        # Last row group (also the empty table of a file without lines)
+        if number_of_pending_rows or not number_of_rows:
+            parquet_writer.write_table(pyarrow.concat_tables(pending_arrow_tables))
+            number_of_rows += number_of_pending_rows
+        parquet_writer.close()
+    except BaseException:
+        if parquet_writer is not None:
+            parquet_writer.close()
+        if os.path.exists(temporary_parquet_file_path):
+            os.remove(temporary_parquet_file_path)
+        raise
+    os.replace(temporary_parquet_file_path, parquet_file_path)
+
+    return parquet_file_path, number_of_rows